@@ -0,0 +1,60 @@
+import argparse
+import random
+import string
+import time
+from typing import List
+
+import textdistance
+
+from ..core.autocorrect import Autocorrecter
+
+_SYLLABLES = ["an", "el", "ri", "to", "ka", "mo", "ra", "li", "us", "th", "or", "ia", "ve", "ne"]
+
+
+def _roster(size: int, rng: random.Random) -> List[str]:
+    names = set()
+    while len(names) < size:
+        names.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5))).title())
+    return sorted(names)
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    index = rng.randrange(len(name))
+    return name[:index] + rng.choice(string.ascii_lowercase) + name[index + 1 :]
+
+
+def _brute_force(vocab, input_word: str) -> List[str]:
+    similarities = [(v, textdistance.cosine(v, input_word)) for v in vocab]
+    similarities.sort(key=lambda item: item[1])
+    return [vocab[v] for v, _ in reversed(similarities)][:5]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Autocorrecter.correct latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--baseline-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for size in args.sizes:
+        names = _roster(size, rng)
+        autocorrecter = Autocorrecter(names)
+        queries = [_typo(name, rng).lower() for name in rng.choices(names, k=args.queries)]
+
+        start = time.perf_counter()
+        for query in queries:
+            autocorrecter.correct(query)
+        indexed = (time.perf_counter() - start) / len(queries) * 1_000
+
+        sample = queries[: args.baseline_queries]
+        start = time.perf_counter()
+        for query in sample:
+            _brute_force(autocorrecter.vocab, query)
+        brute = (time.perf_counter() - start) / len(sample) * 1_000
+
+        print(f"names={size:>6} indexed={indexed:.3f} ms/query brute_force={brute:.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from ..core.timestamps import TimestampParser, parse_with_strptime
+
+_FORMATS = [
+    "%d %b %Y at %H:%M",
+    "%b %d, %Y at %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+    "%b %d, %Y %I:%M %p",
+]
+
+
+def _sample_lines(count: int, seed: int, fmt: str) -> List[str]:
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, 18, 0)
+    return [
+        f"{(start + timedelta(minutes=index)).strftime(fmt).lower()}:/boss{rng.randint(1, 20)} alice"
+        for index in range(count)
+    ]
+
+
+def _time(parse: Callable[[str], Optional[datetime]], lines: List[str]) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        parse(line)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="get_date parsing speed")
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for fmt in _FORMATS:
+        lines = _sample_lines(args.lines, args.seed, fmt)
+        reference = _time(parse_with_strptime, lines)
+        fast = _time(TimestampParser().parse, lines)
+        print(f"{fmt:<24} strptime={reference:.3f}s fast={fast:.3f}s ({reference / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
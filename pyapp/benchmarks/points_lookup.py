@@ -0,0 +1,68 @@
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from ..core.points import PointsStore
+
+
+def _write_store(base_dir: Path, boss_count: int) -> List[str]:
+    points: Dict[str, object] = {
+        "/rings": {"5": 1, "6": 2},
+        "/legacy": [{"level": 200, "5": 3, "6": 4}],
+        "/root": 4,
+    }
+    for index in range(boss_count):
+        points[f"/boss{index}"] = index % 50
+        points[f"{100 + index}.5"] = index % 10
+    (base_dir / "points.json").write_text(json.dumps(points), encoding="utf-8")
+    (base_dir / "prios.json").write_text(json.dumps([]), encoding="utf-8")
+
+    tokens = [f"boss{index}" for index in range(0, boss_count, max(boss_count // 20, 1))]
+    tokens += ["/rings2x5", "legacy210.6", "root3", "boss0(doublepoints)", "unknown"]
+    return tokens
+
+
+def bench_get_points(boss_count: int, calls: int) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir)
+        tokens = _write_store(base_dir, boss_count)
+        store = PointsStore(base_dir)
+        start = time.perf_counter()
+        for index in range(calls):
+            store.get_points(tokens[index % len(tokens)])
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1_000_000
+
+
+def bench_classify(boss_count: int, calls: int) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir)
+        tokens = _write_store(base_dir, boss_count)
+        store = PointsStore(base_dir)
+        start = time.perf_counter()
+        for index in range(calls):
+            store.classify(tokens[index % len(tokens)])
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PointsStore.get_points per-call cost")
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        per_call = bench_get_points(size, args.calls)
+        classify = bench_classify(size, args.calls)
+        print(
+            f"bosses={size * 2 + 3:>6} get_points={per_call:.3f} us/call "
+            f"classify={classify:.3f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Tuple
+
+from ..core.points import PointsStore
+from ..core.sanitise import (
+    ValidationErrors,
+    iter_preprocessed_lines,
+    iter_validated_lines,
+    preprocess_lines,
+    validate_lines,
+)
+
+
+def _write_inputs(base_dir: Path, line_count: int) -> Path:
+    (base_dir / "points.json").write_text(json.dumps({"/boss1": 10}), encoding="utf-8")
+    (base_dir / "prios.json").write_text(json.dumps([]), encoding="utf-8")
+    (base_dir / "boss_aliases.json").write_text(json.dumps([{"b1": "/boss1"}]), encoding="utf-8")
+
+    timers_path = base_dir / "timers.txt"
+    start = datetime(2024, 1, 1, 20, 0)
+    with timers_path.open("w", encoding="utf-8") as f:
+        for index in range(line_count):
+            stamp = (start + timedelta(minutes=index)).strftime("%d %b %Y at %H:%M")
+            f.write(f"{stamp}: b1 alice bob carl\n")
+    return timers_path
+
+
+def _measure(run: Callable[[], int]) -> Tuple[int, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Peak memory of list vs streaming preprocessing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 50_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            timers_path = _write_inputs(base_dir, size)
+            store = PointsStore(base_dir)
+
+            def run_lists() -> int:
+                lines = preprocess_lines(timers_path, base_dir)
+                formatted, _ = validate_lines(lines, store)
+                return len(formatted)
+
+            def run_stream() -> int:
+                errors = ValidationErrors()
+                lines = iter_preprocessed_lines(timers_path, base_dir)
+                return sum(1 for _ in iter_validated_lines(lines, store, errors))
+
+            for label, run in (("lists", run_lists), ("stream", run_stream)):
+                count, elapsed, peak = _measure(run)
+                print(
+                    f"lines={size:>8} {label:<6} kept={count:>8} "
+                    f"time={elapsed:.2f}s peak={peak / 1024 / 1024:.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
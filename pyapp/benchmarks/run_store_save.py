@@ -0,0 +1,113 @@
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..core.runs import (
+    build_run_meta,
+    enable_sqlite_store,
+    iso_to_dt,
+    normalize_event,
+    save_run,
+    save_run_store,
+)
+
+_START = datetime(2022, 1, 2, tzinfo=timezone.utc)
+_PLAYERS = [f"player{index}" for index in range(40)]
+
+
+Run = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
+
+def _week(run_id: str, week: int, events_per_week: int) -> Run:
+    start = _START + timedelta(weeks=week)
+    end = start + timedelta(days=7)
+    events = []
+    for index in range(events_per_week):
+        event_time = start + timedelta(minutes=index * 7 * 24 * 60 // events_per_week)
+        entries = [{"name": name, "delta": 10} for name in _PLAYERS[index % 10 :: 4]]
+        events.append(
+            normalize_event(run_id, start, event_time, "boss1", 10, entries, f"line {index}")
+        )
+    return build_run_meta(run_id, start, start, end, len(events)), events
+
+
+def _history(weeks: int, events_per_week: int) -> Dict[str, Any]:
+    runs: List[Dict[str, Any]] = []
+    events: List[Dict[str, Any]] = []
+    for week in range(weeks):
+        meta, week_events = _week(f"run{week}", week, events_per_week)
+        runs.append(meta)
+        events.extend(week_events)
+    return {"version": 1, "runs": runs, "events": events}
+
+
+def _legacy_save_run(
+    base_dir: Path, run_meta: Dict[str, Any], events: List[Dict[str, Any]]
+) -> None:
+    path = base_dir / "runs" / "events.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    start = iso_to_dt(run_meta["start_utc"])
+    end = iso_to_dt(run_meta["end_utc"])
+    for event in data["events"]:
+        if not event.get("active", True):
+            continue
+        event_time = iso_to_dt(event["event_time_utc"])
+        if start <= event_time <= end:
+            event["active"] = False
+            event["replaced_by"] = run_meta["run_id"]
+    data["runs"].append(run_meta)
+    data["events"].extend(events)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _timed_save(base_dir: Path, weeks: int, events_per_week: int) -> float:
+    save_run(base_dir, *_week("warmup", weeks - 2, events_per_week))
+    meta, events = _week("new", weeks - 1, events_per_week)
+    start = time.perf_counter()
+    save_run(base_dir, meta, events)
+    return (time.perf_counter() - start) * 1_000
+
+
+def bench(weeks: int, events_per_week: int) -> Tuple[int, float, float, float]:
+    history = _history(weeks, events_per_week)
+    meta, events = _week("new", weeks - 1, events_per_week)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir) / "jsonl"
+        save_run_store(base_dir, history)
+        appended = _timed_save(base_dir, weeks, events_per_week)
+
+        base_dir = Path(tmpdir) / "sqlite"
+        save_run_store(base_dir, history)
+        enable_sqlite_store(base_dir)
+        sqlite = _timed_save(base_dir, weeks, events_per_week)
+
+        base_dir = Path(tmpdir) / "legacy"
+        legacy_path = base_dir / "runs" / "events.json"
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_text(json.dumps(history, indent=2), encoding="utf-8")
+        start = time.perf_counter()
+        _legacy_save_run(base_dir, meta, events)
+        legacy = (time.perf_counter() - start) * 1_000
+    return len(history["events"]), appended, sqlite, legacy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="save_run latency versus history size")
+    parser.add_argument("--weeks", type=int, nargs="+", default=[4, 52, 156, 520])
+    parser.add_argument("--events-per-week", type=int, default=100)
+    args = parser.parse_args()
+
+    for weeks in args.weeks:
+        history_events, appended, sqlite, legacy = bench(weeks, args.events_per_week)
+        print(
+            f"history={history_events:>7} events append_log={appended:.2f} ms "
+            f"sqlite={sqlite:.2f} ms legacy_rewrite={legacy:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
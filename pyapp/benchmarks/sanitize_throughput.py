@@ -0,0 +1,99 @@
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Tuple
+
+from ..core.sanitise import Sanitizer
+
+ALIASES: List[Tuple[str, str]] = [
+    ("bloodthorn", "bt"),
+    ("gelebron", "gele"),
+    ("mordi", "mord"),
+    ("ring", "rings"),
+    ("dhio", "dino"),
+    ("/tree", "/valleyx"),
+]
+
+
+def reference_sanitize_line(raw_line: str, aliases: List[Tuple[str, str]]) -> str:
+    tokens = [
+        "".join(ch for ch in token if ch.isascii()).lower()
+        for token in raw_line.strip().split()
+    ]
+    joined = " ".join(tokens)
+    if not joined:
+        return ""
+
+    updated = joined
+    updated = re.sub(r"\(double\s+points?\)", "(doublepoints)", updated)
+    updated = re.sub(r"(^|\s)/\s+", r"\1/", updated)
+    updated = re.sub(r"\brootx(\d+)\b", r"root\1", updated)
+    updated = re.sub(r"/faction\b", "/factions", updated)
+    updated = re.sub(r"/nerco\b", "/necro", updated)
+    updated = re.sub(r"/hrugn\b", "/hrung", updated)
+    updated = re.sub(r"/mordis\b", "/mord", updated)
+    updated = re.sub(r"/mords\b", "/mord", updated)
+    updated = re.sub(r"\baggy/\s*", "/aggy ", updated)
+
+    alias_map = {original.lower(): replacement.lower() for original, replacement in aliases}
+
+    def apply_alias(entry: str) -> str:
+        parts = entry.split()
+        if not parts:
+            return entry
+        boss = parts[0]
+        modifier = ""
+        if boss.endswith(")") and "(" in boss:
+            boss, modifier = boss.split("(", 1)
+            modifier = "(" + modifier
+        parts[0] = f"{alias_map.get(boss, boss)}{modifier}"
+        return " ".join(parts)
+
+    if ":" in updated:
+        prefix, entry = updated.rsplit(":", 1)
+        entry = entry.strip()
+        if entry:
+            updated = f"{prefix}:{apply_alias(entry)}"
+    else:
+        updated = apply_alias(updated)
+    return updated
+
+
+def _sample_lines(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    bosses = ["/necro", "/ nerco", "bloodthorn", "rings 2x5", "/faction", "aggy/", "rootx3", "dhio"]
+    names = ["Alice", "bob", "Carl", "DÆve", "not", "eve"]
+    lines = []
+    for index in range(count):
+        boss = rng.choice(bosses)
+        if rng.random() < 0.1:
+            boss += " (double points)"
+        players = " ".join(rng.choice(names) for _ in range(rng.randint(1, 6)))
+        lines.append(f"{1 + index % 28:02d} Jan 2026 at 20:{index % 60:02d}: {boss} {players}")
+    return lines
+
+
+def _throughput(sanitize: Callable[[str], str], lines: List[str]) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        sanitize(line)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="sanitize_line throughput in lines/sec")
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    lines = _sample_lines(args.lines, args.seed)
+    sanitizer = Sanitizer(ALIASES)
+    reference = _throughput(lambda line: reference_sanitize_line(line, ALIASES), lines)
+    compiled = _throughput(sanitizer.sanitize, lines)
+    print(f"reference sanitize_line: {reference:,.0f} lines/sec")
+    print(f"Sanitizer.sanitize:      {compiled:,.0f} lines/sec ({compiled / reference:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
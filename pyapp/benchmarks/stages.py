@@ -0,0 +1,213 @@
+import argparse
+import json
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from ..cli import resolution_policy
+from ..core.autocorrect import Autocorrecter
+from ..core.points import PointsStore
+from ..core.runs import build_run_meta, normalize_event, save_run
+from ..core.sanitise import preprocess_lines, sanitize_line, slice_by_date, validate_lines
+from ..core.workflow import (
+    CalculationResult,
+    build_aliases,
+    calculate_points,
+    collect_unknown_tokens,
+)
+from .synthetic import Dataset, typo, write_dataset
+
+STAGES = [
+    "sanitize_line",
+    "preprocess_lines",
+    "slice_by_date",
+    "validate_lines",
+    "get_points",
+    "autocorrect",
+    "calculate_points",
+    "save_run",
+]
+
+
+@dataclass
+class Measurement:
+    stage: str
+    lines: int
+    ops: int
+    seconds: float
+    ops_per_second: float
+
+
+def _timed(run: Callable[[], int]) -> Tuple[int, float]:
+    started = time.perf_counter()
+    ops = run()
+    return ops, time.perf_counter() - started
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _save_events(dataset: Dataset, result: CalculationResult) -> int:
+    run_id = "benchmark"
+    created = datetime.now(timezone.utc)
+    events = [
+        normalize_event(
+            run_id=run_id,
+            created_utc=created,
+            event_time=event.event_time,
+            boss=event.boss,
+            points=event.points,
+            entries=[{"name": entry.name, "delta": entry.delta} for entry in event.entries],
+            source_line=event.source_line,
+        )
+        for event in result.events
+    ]
+    meta = build_run_meta(run_id, created, _utc(dataset.first), _utc(dataset.last), len(events))
+    save_run(dataset.base_dir, meta, events)
+    return len(events)
+
+
+def run_stages(
+    dataset: Dataset, stages: List[str], sample: int, seed: int = 0
+) -> List[Measurement]:
+    rng = random.Random(seed)
+    state: Dict[str, object] = {}
+
+    def lines() -> list:
+        if "lines" not in state:
+            state["lines"] = preprocess_lines(dataset.timers_path, dataset.base_dir)
+        return state["lines"]
+
+    def formatted() -> list:
+        if "formatted" not in state:
+            state["formatted"] = validate_lines(lines(), PointsStore(dataset.base_dir))[0]
+        return state["formatted"]
+
+    def result() -> CalculationResult:
+        if "result" not in state:
+            state["result"] = calculate()
+        return state["result"]
+
+    def sanitize() -> int:
+        with dataset.timers_path.open(encoding="utf-8") as f:
+            raw = [line.rstrip("\n") for _, line in zip(range(sample), f)]
+        for line in raw:
+            sanitize_line(line, aliases=dataset.boss_aliases)
+        return len(raw)
+
+    def preprocess() -> int:
+        state["lines"] = preprocess_lines(dataset.timers_path, dataset.base_dir)
+        return len(state["lines"])
+
+    def slice_lines() -> int:
+        span = dataset.last - dataset.first
+        start = dataset.first + span / 4
+        slice_by_date(lines(), start, start + span / 2)
+        return len(lines())
+
+    def validate() -> int:
+        state["formatted"] = validate_lines(lines(), PointsStore(dataset.base_dir))[0]
+        return len(lines())
+
+    def get_points() -> int:
+        store = PointsStore(dataset.base_dir)
+        bosses = [tokens[0] for _, tokens in formatted()]
+        for boss in bosses:
+            store.get_points(boss)
+        return len(bosses)
+
+    def autocorrect() -> int:
+        aliases = build_aliases(dataset.roster, dataset.base_dir)
+        queries = collect_unknown_tokens(formatted(), aliases)[:sample]
+        while len(queries) < sample:
+            queries.append(typo(rng.choice(dataset.roster), rng))
+        autocorrecter = Autocorrecter(dataset.roster)
+        for query in queries:
+            autocorrecter.correct(query)
+        return len(queries)
+
+    def calculate() -> CalculationResult:
+        return calculate_points(
+            timers_path=dataset.timers_path,
+            start_date=None,
+            end_date=None,
+            use_all_entries=True,
+            spreadsheet_id="",
+            range_name="",
+            credentials_path=dataset.base_dir / "credentials.json",
+            token_path=dataset.base_dir / "token.json",
+            base_dir=dataset.base_dir,
+            resolve_unknown=resolution_policy("accept", 0.8),
+            roster=dataset.roster,
+        )
+
+    def calculate_stage() -> int:
+        state["result"] = calculate()
+        return dataset.line_count
+
+    prerequisites: Dict[str, Callable[[], object]] = {
+        "slice_by_date": lines,
+        "validate_lines": lines,
+        "get_points": formatted,
+        "autocorrect": formatted,
+        "save_run": result,
+    }
+    runners: Dict[str, Callable[[], int]] = {
+        "sanitize_line": sanitize,
+        "preprocess_lines": preprocess,
+        "slice_by_date": slice_lines,
+        "validate_lines": validate,
+        "get_points": get_points,
+        "autocorrect": autocorrect,
+        "calculate_points": calculate_stage,
+        "save_run": lambda: _save_events(dataset, result()),
+    }
+    measurements: List[Measurement] = []
+    for stage in stages:
+        if stage in prerequisites:
+            prerequisites[stage]()
+        ops, seconds = _timed(runners[stage])
+        measurements.append(
+            Measurement(
+                stage=stage,
+                lines=dataset.line_count,
+                ops=ops,
+                seconds=round(seconds, 6),
+                ops_per_second=round(ops / seconds, 1) if seconds else 0.0,
+            )
+        )
+    return measurements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-stage throughput on synthetic timers files")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--sample", type=int, default=10_000)
+    parser.add_argument("--roster-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    records: List[Dict[str, object]] = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dataset = write_dataset(
+                Path(tmpdir), size, seed=args.seed, roster_size=args.roster_size
+            )
+            for measurement in run_stages(dataset, args.stages, args.sample, args.seed):
+                record = asdict(measurement)
+                records.append(record)
+                print(json.dumps(record), flush=True)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(records, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
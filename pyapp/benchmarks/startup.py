@@ -0,0 +1,111 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+DEFERRED_MODULES = (
+    "googleapiclient.discovery",
+    "google_auth_oauthlib",
+    "google_auth_httplib2",
+    "google.oauth2.credentials",
+    "httplib2",
+    "textdistance",
+)
+
+_FIRST_PAINT = """
+import sys
+import time
+
+started = time.perf_counter()
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+app = QApplication(sys.argv[:1])
+from pathlib import Path
+from pyapp.gui.wizard import DkpWizard
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            print(f"{(time.perf_counter() - started) * 1000:.1f}")
+            app.quit()
+        return False
+
+
+wizard = DkpWizard(Path(sys.argv[1]))
+paint = FirstPaint()
+wizard.installEventFilter(paint)
+QTimer.singleShot(10_000, app.quit)
+wizard.show()
+app.exec()
+"""
+
+
+def _run(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_times(module: str, env: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+    result = _run(["-X", "importtime", "-c", f"import {module}"], env)
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def first_paint_ms(env: Dict[str, str]) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in ("points.json", "name_aliases.json", "boss_aliases.json", "prios.json"):
+            if (_ROOT / name).exists():
+                shutil.copy2(_ROOT / name, Path(tmpdir) / name)
+        output = _run(["-c", _FIRST_PAINT, tmpdir], env).stdout.split()
+    if not output:
+        raise RuntimeError("The wizard never painted")
+    return float(output[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start import time and time to first paint")
+    parser.add_argument("--module", default="pyapp.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--platform", default=os.environ.get("QT_QPA_PLATFORM", ""))
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.platform:
+        env["QT_QPA_PLATFORM"] = args.platform
+
+    totals: List[float] = []
+    times: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.runs):
+        times = import_times(args.module, env)
+        totals.append(times[args.module][1] / 1000)
+    print(f"import {args.module}: min={min(totals):.1f}ms median={statistics.median(totals):.1f}ms")
+    slowest = sorted(times.items(), key=lambda item: item[1][1], reverse=True)[: args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"  {cumulative_us / 1000:>8.1f}ms cumulative {self_us / 1000:>7.1f}ms self  {name}")
+
+    eager = [name for name in DEFERRED_MODULES if name in times]
+    paints = [first_paint_ms(env) for _ in range(args.runs)]
+    print(f"first paint: min={min(paints):.1f}ms median={statistics.median(paints):.1f}ms")
+    if eager:
+        print(f"deferred modules imported at startup: {', '.join(eager)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+import json
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DATE_FORMATS = (
+    "%d %b %Y at %H:%M",
+    "%b %d, %Y at %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+    "%b %d, %Y %I:%M %p",
+)
+
+BASE_BOSSES = [
+    "/aggy",
+    "/base",
+    "/bt",
+    "/crom",
+    "/dino",
+    "/factions",
+    "/gele",
+    "/hrung",
+    "/mord",
+    "/necro",
+    "/prime",
+    "/valley",
+]
+DECIMAL_LEVELS = ["160", "170", "180", "195", "210", "215"]
+BOSS_ALIASES: List[Tuple[str, str]] = [
+    ("/bloodthorn", "/bt"),
+    ("/gelebron", "/gele"),
+    ("/mordi", "/mord"),
+    ("/ring", "/rings"),
+    ("/dhino", "/dino"),
+]
+BOSS_TYPOS = ["/faction", "/nerco", "/hrugn", "/mords"] + [
+    alias for alias, target in BOSS_ALIASES if target != "/rings"
+]
+LINE_MODIFIERS = ["(brucybonus)", "(double)", "(doublepoints)", "(fail)", " (double points)"]
+
+_SYLLABLES = (
+    "ka ri to mel dor an vel sha gor lin ya zu mor el tha bri nox ul fen ra kor is dra mi"
+).split()
+_RESERVED = {"not", "at", "rings", "legacy", "root"}
+
+LINE_KINDS = [
+    ("base", 50),
+    ("modifier", 10),
+    ("rings", 8),
+    ("legacy", 8),
+    ("decimal", 8),
+    ("root", 4),
+    ("not", 7),
+    ("boss_typo", 5),
+]
+
+
+@dataclass
+class Dataset:
+    base_dir: Path
+    timers_path: Path
+    roster: List[str]
+    boss_aliases: List[Tuple[str, str]]
+    first: datetime
+    last: datetime
+    line_count: int
+
+
+def generate_roster(size: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    names: List[str] = []
+    seen = set()
+    while len(names) < size:
+        name = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if name in seen or name in _RESERVED:
+            continue
+        seen.add(name)
+        names.append(name.capitalize() if rng.random() < 0.7 else name.upper())
+    return names
+
+
+def points_config(seed: int = 0) -> Dict[str, object]:
+    rng = random.Random(seed)
+    points: Dict[str, object] = {
+        boss: rng.choice([5, 10, 20, 30, 60, 120]) for boss in BASE_BOSSES
+    }
+    points["/root"] = 4
+    for level in DECIMAL_LEVELS:
+        for star in ("4", "5", "6"):
+            points[f"{level}.{star}"] = rng.randint(0, 10)
+    points["/rings"] = {"5": 2, "6": 3}
+    points["/legacy"] = [{"level": 220, "5": 5, "6": 6}, {"level": 200, "5": 3, "6": 4}]
+    return points
+
+
+def write_base_dir(base_dir: Path, seed: int = 0) -> None:
+    base_dir.mkdir(parents=True, exist_ok=True)
+    files = {
+        "points.json": points_config(seed),
+        "prios.json": DECIMAL_LEVELS[-2:],
+        "boss_aliases.json": [{alias: target} for alias, target in BOSS_ALIASES],
+        "name_aliases.json": {},
+    }
+    for name, data in files.items():
+        (base_dir / name).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def typo(name: str, rng: random.Random) -> str:
+    letters = list(name.lower())
+    position = rng.randrange(len(letters) - 1)
+    if rng.random() < 0.5:
+        letters[position], letters[position + 1] = letters[position + 1], letters[position]
+    else:
+        del letters[position]
+    return "".join(letters)
+
+
+class LineGenerator:
+    def __init__(
+        self,
+        roster: Sequence[str],
+        seed: int = 0,
+        start: datetime = datetime(2024, 1, 1, 18, 0),
+        typo_rate: float = 0.02,
+        date_formats: Sequence[str] = DATE_FORMATS,
+    ) -> None:
+        self.roster = list(roster)
+        self.rng = random.Random(seed)
+        self.when = start
+        self.typo_rate = typo_rate
+        self.date_formats = list(date_formats)
+        self._known = {name.lower() for name in self.roster}
+        self._kinds = [kind for kind, _ in LINE_KINDS]
+        self._weights = [weight for _, weight in LINE_KINDS]
+
+    def _name(self) -> str:
+        name = self.rng.choice(self.roster)
+        if self.rng.random() < self.typo_rate:
+            misspelt = typo(name, self.rng)
+            if len(misspelt) > 1 and misspelt not in self._known:
+                return misspelt
+        return name
+
+    def _names(self, low: int = 3, high: int = 12) -> str:
+        return " ".join(self._name() for _ in range(self.rng.randint(low, high)))
+
+    def entry(self) -> str:
+        rng = self.rng
+        kind = rng.choices(self._kinds, self._weights)[0]
+        boss = rng.choice(BASE_BOSSES)
+        if kind == "modifier":
+            return f"{boss}{rng.choice(LINE_MODIFIERS)} {self._names()}"
+        if kind == "rings":
+            ring = rng.choice(["/rings", "/ring"])
+            return f"{ring} {rng.randint(1, 4)}x{rng.choice('56')} {self._names()}"
+        if kind == "legacy":
+            return f"/legacy {rng.randint(200, 240)}.{rng.choice('56')} {self._names()}"
+        if kind == "decimal":
+            level = rng.choice(DECIMAL_LEVELS)
+            star = rng.choice("456")
+            separator = rng.choice([" ", "."])
+            return f"{level}{separator}{star} {self._names()}"
+        if kind == "root":
+            return f"rootx{rng.randint(1, 5)} {self._names()}"
+        if kind == "not":
+            if rng.random() < 0.5:
+                return f"{boss} not {self._name()}"
+            return f"{boss} {self._name()} not {self._name()}"
+        if kind == "boss_typo":
+            typo_boss = rng.choice(BOSS_TYPOS + ["/ " + boss[1:]])
+            return f"{typo_boss} {self._names()}"
+        return f"{boss} {self._names()}"
+
+    def line(self) -> str:
+        self.when += timedelta(minutes=self.rng.randint(1, 20))
+        date_format = self.date_formats[self.when.toordinal() % len(self.date_formats)]
+        return f"{self.when.strftime(date_format)}: {self.entry()}"
+
+    def lines(self, count: int) -> Iterator[str]:
+        for _ in range(count):
+            yield self.line()
+
+
+def write_dataset(
+    base_dir: Path,
+    line_count: int,
+    seed: int = 0,
+    roster_size: int = 200,
+    typo_rate: float = 0.02,
+    date_formats: Optional[Sequence[str]] = None,
+) -> Dataset:
+    write_base_dir(base_dir, seed)
+    roster = generate_roster(roster_size, seed)
+    start = datetime(2024, 1, 1, 18, 0)
+    generator = LineGenerator(roster, seed, start, typo_rate, date_formats or DATE_FORMATS)
+    timers_path = base_dir / "timers.txt"
+    first: Optional[datetime] = None
+    with timers_path.open("w", encoding="utf-8") as f:
+        for line in generator.lines(line_count):
+            if first is None:
+                first = generator.when
+            f.write(line + "\n")
+    return Dataset(
+        base_dir=base_dir,
+        timers_path=timers_path,
+        roster=roster,
+        boss_aliases=list(BOSS_ALIASES),
+        first=first or start,
+        last=generator.when,
+        line_count=line_count,
+    )
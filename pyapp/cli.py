@@ -0,0 +1,215 @@
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .core.autocorrect import similarity
+from .core.config import load_config, token_path
+from .core.sanitise import ValidationErrors
+from .core.sheets import prefetch_names
+from .core.workflow import (
+    CalculationResult,
+    Resolution,
+    ResolveCallback,
+    RosterSource,
+    calculate_points,
+)
+
+POLICIES = ("accept", "discard", "fail")
+
+
+class UnresolvedNameError(Exception):
+    pass
+
+
+def resolution_policy(policy: str, threshold: float = 0.8) -> ResolveCallback:
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown resolution policy: {policy}")
+
+    def resolve(
+        name: str,
+        suggestions: List[str],
+        line_text: str,
+        prev_token: str,
+        next_token: str,
+        prev_line_raw: str,
+        next_line_raw: str,
+    ) -> Optional[Resolution]:
+        if policy == "accept" and suggestions:
+            best = suggestions[0]
+            if similarity(name, best) >= threshold:
+                return Resolution(names=[best], cache_original=True)
+        if policy == "fail":
+            raise UnresolvedNameError(f"Unknown name {name!r} in line: {line_text}")
+        return None
+
+    return resolve
+
+
+def parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def describe_errors(errors: ValidationErrors) -> List[str]:
+    messages: List[str] = []
+    for item in fields(errors):
+        value = getattr(errors, item.name)
+        if not value:
+            continue
+        if isinstance(value, dict):
+            value = sorted(value)
+        messages.append(f"{item.name}: {', '.join(str(entry) for entry in value)}")
+    return messages
+
+
+def result_to_dict(timers_path: Path, result: CalculationResult) -> Dict[str, Any]:
+    return {
+        "timers_path": str(timers_path),
+        "first_entry": result.sanity.first_entry,
+        "last_entry": result.sanity.last_entry,
+        "total_lines": result.sanity.total_lines,
+        "totals": [{"name": name, "points": points} for name, points in result.totals],
+        "boss_list": result.boss_list,
+        "boss_counts": result.boss_counts,
+        "events": [
+            {
+                "event_time": event.event_time.isoformat(),
+                "boss": event.boss,
+                "points": event.points,
+                "entries": [{"name": entry.name, "delta": entry.delta} for entry in event.entries],
+                "source_line": event.source_line,
+            }
+            for event in result.events
+        ],
+    }
+
+
+def write_csv(output_dir: Path, stem: str, result: CalculationResult) -> None:
+    with (output_dir / f"{stem}.totals.csv").open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "points"])
+        writer.writerows(result.totals)
+    with (output_dir / f"{stem}.events.csv").open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["event_time", "boss", "points", "name", "delta"])
+        for event in result.events:
+            event_time = event.event_time.isoformat()
+            for entry in event.entries:
+                writer.writerow([event_time, event.boss, event.points, entry.name, entry.delta])
+
+
+def output_stems(paths: Sequence[Path]) -> List[str]:
+    counts = Counter(path.stem for path in paths)
+    used: Set[str] = set()
+    stems: List[str] = []
+    for path in paths:
+        stem = path.stem
+        if counts[stem] > 1:
+            index = 1
+            while f"{stem}-{index}" in used or f"{stem}-{index}" in counts:
+                index += 1
+            stem = f"{stem}-{index}"
+        used.add(stem)
+        stems.append(stem)
+    return stems
+
+
+def _load_roster(args: argparse.Namespace) -> RosterSource:
+    if args.names is None:
+        return prefetch_names(args.spreadsheet_id, args.range_name, args.credentials, args.token)
+    text = args.names.read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    config = load_config()
+    parser = argparse.ArgumentParser(
+        prog="python -m pyapp.cli", description="Calculate DKP totals without the GUI"
+    )
+    parser.add_argument("timers", type=Path, nargs="+")
+    parser.add_argument("--base-dir", type=Path, default=Path(__file__).resolve().parents[1])
+    parser.add_argument("--start", type=parse_datetime)
+    parser.add_argument("--end", type=parse_datetime)
+    parser.add_argument("--policy", choices=POLICIES, default="discard")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--output-dir", type=Path)
+    parser.add_argument("--names", type=Path)
+    parser.add_argument("--spreadsheet-id", default=config.spreadsheet_id)
+    parser.add_argument("--range", dest="range_name", default=config.range_name)
+    parser.add_argument(
+        "--credentials", type=Path, default=Path(config.last_credentials_path or "credentials.json")
+    )
+    parser.add_argument("--token", type=Path, default=token_path())
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.format == "csv" and args.output_dir is None:
+        parser.error("--format csv requires --output-dir")
+    if args.end is not None and args.start is None:
+        parser.error("--end requires --start")
+    if args.start is not None and args.end is None:
+        args.end = args.start + timedelta(days=7)
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    resolve = resolution_policy(args.policy, args.threshold)
+    roster = _load_roster(args)
+    use_all_entries = args.start is None
+    documents: List[Dict[str, Any]] = []
+    status = 0
+    for timers_path, stem in zip(args.timers, output_stems(args.timers)):
+        try:
+            result = calculate_points(
+                timers_path=timers_path,
+                start_date=args.start,
+                end_date=args.end,
+                use_all_entries=use_all_entries,
+                spreadsheet_id=args.spreadsheet_id,
+                range_name=args.range_name,
+                credentials_path=args.credentials,
+                token_path=args.token,
+                base_dir=args.base_dir,
+                resolve_unknown=resolve,
+                roster=roster,
+            )
+        except Exception as exc:
+            print(f"{timers_path}: {exc}", file=sys.stderr)
+            status = 1
+            continue
+        if result.errors.any():
+            for message in describe_errors(result.errors):
+                print(f"{timers_path}: {message}", file=sys.stderr)
+            status = 1
+            continue
+
+        if args.format == "csv":
+            write_csv(args.output_dir, stem, result)
+            continue
+        document = result_to_dict(timers_path, result)
+        if args.output_dir is not None:
+            (args.output_dir / f"{stem}.json").write_text(
+                json.dumps(document, indent=2), encoding="utf-8"
+            )
+        else:
+            documents.append(document)
+
+    if documents:
+        json.dump(documents if len(args.timers) > 1 else documents[0], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,49 +1,140 @@
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 
-def add_boss_alias(base_dir: Path, alias: str, canonical: str) -> None:
-    path = base_dir / "boss_aliases.json"
-    alias = alias.lower()
-    canonical = canonical.lower()
+def _read_json(path: Path, default: Any) -> Any:
     if path.exists():
-        data = json.loads(path.read_text(encoding="utf-8"))
-    else:
-        data = []
+        return json.loads(path.read_text(encoding="utf-8"))
+    return default
 
-    updated = False
-    for item in data:
-        if alias in item:
-            item[alias] = canonical
-            updated = True
-            break
 
-    if not updated:
-        data.append({alias: canonical})
+def _write_json(path: Path, data: Any) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
 
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
+FileSignature = Optional[Tuple[int, int, int]]
 
-def add_name_alias(base_dir: Path, alias: str, canonical: str) -> None:
-    path = base_dir / "name_aliases.json"
-    alias = alias.lower()
-    if path.exists():
-        data = json.loads(path.read_text(encoding="utf-8"))
-    else:
-        data = {}
 
-    data[alias] = canonical
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+def _signature(path: Path) -> FileSignature:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
 
 
-def add_points_value(base_dir: Path, boss: str, points: int) -> None:
-    path = base_dir / "points.json"
-    boss = boss.lower()
-    if path.exists():
-        data = json.loads(path.read_text(encoding="utf-8"))
-    else:
-        data = {}
+class AliasWriter:
+    def __init__(self, base_dir: Path) -> None:
+        self.base_dir = base_dir
+        self._lock = threading.Lock()
+        self._name_aliases: Dict[str, str] = {}
+        self._boss_aliases: Dict[str, str] = {}
+        self._points: Dict[str, int] = {}
+        self._boss_items: List[Dict[str, str]] = []
+        self._boss_owners: Dict[str, Dict[str, str]] = {}
+        self._boss_signature: FileSignature = None
+        self._boss_loaded = False
+
+    def add_name_alias(self, alias: str, canonical: str) -> None:
+        with self._lock:
+            self._name_aliases[alias.lower()] = canonical
+
+    def add_boss_alias(self, alias: str, canonical: str) -> None:
+        alias, canonical = alias.lower(), canonical.lower()
+        with self._lock:
+            self._boss_aliases[alias] = canonical
+            if self._boss_loaded:
+                self._set_boss_alias(alias, canonical)
+
+    def add_points_value(self, boss: str, points: int) -> None:
+        with self._lock:
+            self._points[boss.lower()] = int(points)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._name_aliases) + len(self._boss_aliases) + len(self._points)
+
+    def _set_boss_alias(self, alias: str, canonical: str) -> None:
+        item = self._boss_owners.get(alias)
+        if item is None:
+            item = self._boss_owners[alias] = {}
+            self._boss_items.append(item)
+        item[alias] = canonical
+
+    def _load_boss_items(self, path: Path) -> None:
+        signature = _signature(path)
+        if self._boss_loaded and signature == self._boss_signature:
+            return
+        self._boss_items = _read_json(path, [])
+        self._boss_owners = {}
+        for item in self._boss_items:
+            for alias in item:
+                self._boss_owners.setdefault(alias, item)
+        self._boss_signature = signature
+        self._boss_loaded = True
+        for alias, canonical in self._boss_aliases.items():
+            self._set_boss_alias(alias, canonical)
+
+    def flush(self) -> int:
+        with self._lock:
+            flushed = 0
+
+            if self._name_aliases:
+                path = self.base_dir / "name_aliases.json"
+                data = _read_json(path, {})
+                data.update(self._name_aliases)
+                _write_json(path, data)
+                flushed += len(self._name_aliases)
+                self._name_aliases.clear()
+
+            if self._boss_aliases:
+                path = self.base_dir / "boss_aliases.json"
+                self._load_boss_items(path)
+                _write_json(path, self._boss_items)
+                self._boss_signature = _signature(path)
+                flushed += len(self._boss_aliases)
+                self._boss_aliases.clear()
 
-    data[boss] = int(points)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            if self._points:
+                path = self.base_dir / "points.json"
+                data = _read_json(path, {})
+                data.update(self._points)
+                _write_json(path, data)
+                flushed += len(self._points)
+                self._points.clear()
+
+            return flushed
+
+
+_shared_lock = threading.Lock()
+_shared_writers: Dict[Path, AliasWriter] = {}
+
+
+def shared_writer(base_dir: Path) -> AliasWriter:
+    with _shared_lock:
+        writer = _shared_writers.get(base_dir)
+        if writer is None:
+            writer = _shared_writers[base_dir] = AliasWriter(base_dir)
+        return writer
+
+
+def add_boss_alias(base_dir: Path, alias: str, canonical: str) -> None:
+    writer = shared_writer(base_dir)
+    writer.add_boss_alias(alias, canonical)
+    writer.flush()
+
+
+def add_name_alias(base_dir: Path, alias: str, canonical: str) -> None:
+    writer = shared_writer(base_dir)
+    writer.add_name_alias(alias, canonical)
+    writer.flush()
+
+
+def add_points_value(base_dir: Path, boss: str, points: int) -> None:
+    writer = shared_writer(base_dir)
+    writer.add_points_value(boss, points)
+    writer.flush()
@@ -1,11 +1,79 @@
-from typing import Dict, Iterable, List, Optional
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-import textdistance
+Gram = Tuple[str, int]
+Ranked = List[Tuple[float, int]]
+
+
+def _grams(word: str) -> List[Gram]:
+    return [
+        (char, occurrence)
+        for char, count in Counter(word).items()
+        for occurrence in range(1, count + 1)
+    ]
+
+
+def _similarity(shared: int, length: int, query_length: int) -> float:
+    return shared / pow(length * query_length, 1.0 / 2)
+
+
+def similarity(first: str, second: str) -> float:
+    first = first.lower()
+    second = second.lower()
+    if not first or not second:
+        return 0.0
+    shared = sum((Counter(first) & Counter(second)).values())
+    return _similarity(shared, len(first), len(second))
+
+
+class _LengthBucket:
+    def __init__(self) -> None:
+        self.ids: List[int] = []
+        self.masks: Dict[Gram, int] = {}
+
+    def add(self, word_id: int, grams: List[Gram]) -> None:
+        bit = 1 << len(self.ids)
+        self.ids.append(word_id)
+        for gram in grams:
+            self.masks[gram] = self.masks.get(gram, 0) | bit
+
+    def overlap_masks(self, grams: List[Gram]) -> List[int]:
+        at_least = [(1 << len(self.ids)) - 1]
+        for gram in grams:
+            mask = self.masks.get(gram)
+            if not mask:
+                continue
+            at_least.append(at_least[-1] & mask)
+            for shared in range(len(at_least) - 2, 0, -1):
+                at_least[shared] |= at_least[shared - 1] & mask
+        return at_least
+
+    def best(self, grams: List[Gram], limit: int, need: float) -> List[Tuple[int, int]]:
+        at_least = self.overlap_masks(grams)
+        found: List[Tuple[int, int]] = []
+        for shared in range(len(at_least) - 1, 0, -1):
+            if shared < need:
+                break
+            mask = at_least[shared]
+            if shared + 1 < len(at_least):
+                mask &= ~at_least[shared + 1]
+            while mask and len(found) < limit:
+                position = mask.bit_length() - 1
+                mask ^= 1 << position
+                found.append((shared, self.ids[position]))
+            if len(found) == limit:
+                break
+        return found
 
 
 class Autocorrecter:
-    def __init__(self, words: Iterable[str]) -> None:
+    def __init__(self, words: Iterable[str], limit: int = 5) -> None:
         self.vocab: Dict[str, str] = {}
+        self.limit = limit
+        self._keys: List[str] = []
+        self._buckets: Dict[int, _LengthBucket] = {}
+        self._suggestions: Dict[str, Ranked] = {}
         for word in words:
             self.add_word(word)
 
@@ -17,10 +85,65 @@ class Autocorrecter:
             return
         self.vocab[key] = display or word
 
+        word_id = len(self._keys)
+        grams = _grams(key)
+        bucket = self._buckets.get(len(key))
+        if bucket is None:
+            bucket = self._buckets[len(key)] = _LengthBucket()
+        bucket.add(word_id, grams)
+        self._keys.append(key)
+
+        counts = Counter(key)
+        for query, ranked in self._suggestions.items():
+            shared = sum((counts & Counter(query)).values()) if query else 0
+            entry = (_similarity(shared, len(key), len(query)) if shared else 0.0, word_id)
+            if len(ranked) < self.limit or entry > ranked[-1]:
+                ranked.append(entry)
+                ranked.sort(reverse=True)
+                del ranked[self.limit :]
+
+    def _rank(self, input_word: str) -> Ranked:
+        limit = self.limit
+        top: Ranked = []
+        if input_word:
+            grams = _grams(input_word)
+            query_length = len(input_word)
+            lengths = sorted(
+                self._buckets,
+                key=lambda length: min(length, query_length) / max(length, query_length),
+                reverse=True,
+            )
+            for length in lengths:
+                scale = pow(length * query_length, 1.0 / 2)
+                need = 1.0
+                if len(top) == limit:
+                    threshold = top[0][0]
+                    if threshold > min(length, query_length) / scale + 1e-9:
+                        break
+                    need = max(need, threshold * scale - 1e-9)
+                for shared, word_id in self._buckets[length].best(grams, limit, need):
+                    entry = (_similarity(shared, length, query_length), word_id)
+                    if len(top) < limit:
+                        heapq.heappush(top, entry)
+                    elif entry > top[0]:
+                        heapq.heapreplace(top, entry)
+
+        ranked = sorted(top, reverse=True)
+        if len(ranked) < limit:
+            matched = {word_id for _, word_id in ranked}
+            for word_id in range(len(self._keys) - 1, -1, -1):
+                if len(ranked) == limit:
+                    break
+                if word_id not in matched:
+                    ranked.append((0.0, word_id))
+        return ranked
+
+    def correct_many(self, input_words: Sequence[str]) -> Dict[str, List[str]]:
+        return {word: self.correct(word) for word in input_words}
+
     def correct(self, input_word: str) -> List[str]:
         input_word = input_word.lower()
-        similarities = [
-            (v, textdistance.cosine(v, input_word)) for v in self.vocab
-        ]
-        similarities.sort(key=lambda item: item[1])
-        return [self.vocab[v] for v, _ in reversed(similarities)][:5]
+        ranked = self._suggestions.get(input_word)
+        if ranked is None:
+            ranked = self._suggestions[input_word] = self._rank(input_word)
+        return [self.vocab[self._keys[word_id]] for _, word_id in ranked]
@@ -18,6 +18,9 @@ class AppConfig:
     use_native_dialog: bool = True
     activity_a_threshold: int = 70
     activity_aplus_threshold: int = 300
+    roster_cache_ttl_seconds: int = 600
+    run_store_backend: str = "jsonl"
+    show_stage_timings: bool = False
 
 
 def config_path() -> Path:
@@ -30,6 +33,11 @@ def token_path() -> Path:
     return base / "token.json"
 
 
+def roster_cache_path() -> Path:
+    base = Path(user_config_dir("dkp_automator_gui"))
+    return base / "roster_cache.json"
+
+
 def load_config() -> AppConfig:
     path = config_path()
     if not path.exists():
@@ -50,6 +58,9 @@ def load_config() -> AppConfig:
         use_native_dialog=bool(data.get("use_native_dialog", True)),
         activity_a_threshold=int(data.get("activity_a_threshold", 70)),
         activity_aplus_threshold=int(data.get("activity_aplus_threshold", 300)),
+        roster_cache_ttl_seconds=int(data.get("roster_cache_ttl_seconds", 600)),
+        run_store_backend=data.get("run_store_backend", "jsonl"),
+        show_stage_timings=bool(data.get("show_stage_timings", False)),
     )
 
 
@@ -67,5 +78,8 @@ def save_config(cfg: AppConfig) -> None:
         "use_native_dialog": cfg.use_native_dialog,
         "activity_a_threshold": int(cfg.activity_a_threshold),
         "activity_aplus_threshold": int(cfg.activity_aplus_threshold),
+        "roster_cache_ttl_seconds": int(cfg.roster_cache_ttl_seconds),
+        "run_store_backend": cfg.run_store_backend,
+        "show_stage_timings": cfg.show_stage_timings,
     }
     path.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -2,10 +2,13 @@ import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 MODIFIERS = ["brucybonus", "double", "doublepoints", "fail", "comp"]
 
+_MODIFIER_SET = frozenset(MODIFIERS)
+_DECIMAL_BOSS_RE = re.compile(r"^\d+\.\d+$")
+
 
 @dataclass
 class Tier:
@@ -17,13 +20,56 @@ class Tier:
 PointValue = Union[int, Dict[str, int], List[Tier]]
 
 
+@dataclass(frozen=True)
+class BossToken:
+    boss: str
+    kind: str
+    slash: bool
+    modifier: Optional[str] = None
+    ring_count: Optional[int] = None
+    star: Optional[str] = None
+    level: Optional[int] = None
+
+
+def _parse_structured(body: str) -> Optional[BossToken]:
+    slash = body.startswith("/")
+    rest = body[1:] if slash else body
+
+    if rest.startswith("rings"):
+        if len(rest) == 8 and rest[5] in "1234" and rest[6] == "x" and rest[7] in "56":
+            return BossToken(
+                boss=body, kind="rings", slash=slash, ring_count=int(rest[5]), star=rest[7]
+            )
+        return None
+
+    if rest.startswith("legacy"):
+        level, dot, star = rest[6:].partition(".")
+        if dot and level.isdecimal() and star in {"5", "6"}:
+            return BossToken(
+                boss=body, kind="legacy", slash=slash, level=int(level), star=star
+            )
+        return None
+
+    if rest.startswith("root"):
+        suffix = rest[4:]
+        if not suffix or suffix.isdecimal():
+            return BossToken(boss=body, kind="root", slash=slash)
+        return None
+
+    return None
+
+
 class PointsStore:
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
         self.points_map: Dict[str, PointValue] = {}
         self.prios: List[str] = []
         self._bosses: List[str] = []
-        self._bosses_re: Optional[re.Pattern] = None
+        self._token_spellings: Set[str] = set()
+        self._base_points: Dict[str, Optional[int]] = {}
+        self._ring_values: Dict[str, int] = {}
+        self._legacy_tiers: List[Tier] = []
+        self._points_cache: Dict[str, Optional[int]] = {}
         self._load()
 
     @property
@@ -63,56 +109,121 @@ class PointsStore:
         self.points_map = points_map
         self.prios = [str(p) for p in prios]
         self._bosses = list(points_map.keys())
-        self._bosses_re = self._build_bosses_re()
+        self._token_spellings = self._build_token_spellings()
+        self._base_points = self._build_base_points()
+        self._ring_values = self._resolve_ring_values()
+        self._legacy_tiers = self._resolve_legacy_tiers()
+        self._points_cache = {}
+
+    def reload(self) -> None:
+        self._load()
+
+    def _build_base_points(self) -> Dict[str, Optional[int]]:
+        spellings: List[str] = []
+        for boss in self.points_map:
+            spellings.append(boss)
+            spellings.append(f"/{boss}")
+            if boss.startswith("/"):
+                spellings.append(boss[1:])
+
+        base_points: Dict[str, Optional[int]] = {}
+        for spelling in spellings:
+            if spelling in base_points:
+                continue
+            if spelling in self.points_map:
+                key = spelling
+            elif f"/{spelling}" in self.points_map:
+                key = f"/{spelling}"
+            elif spelling.startswith("/") and spelling[1:] in self.points_map:
+                key = spelling[1:]
+            else:
+                continue
+            value = self.points_map[key]
+            base_points[spelling] = value if isinstance(value, int) else None
+        return base_points
 
-    def _build_bosses_re(self) -> re.Pattern:
-        ring_match = r"/?rings([1-4])x([5-6])"
-        legacy_match = r"/?legacy(\d+)\.([5-6])"
-        root_match = r"/?root\d*"
+    def _resolve_ring_values(self) -> Dict[str, int]:
+        ring_map = self.points_map.get("/rings")
+        if ring_map is None:
+            ring_map = self.points_map.get("rings")
+        if isinstance(ring_map, dict):
+            return {str(k): int(v) for k, v in ring_map.items()}
+        return {}
 
-        boss_values: List[str] = []
+    def _resolve_legacy_tiers(self) -> List[Tier]:
+        tiers = self.points_map.get("/legacy")
+        if tiers is None:
+            tiers = self.points_map.get("legacy")
+        if isinstance(tiers, list):
+            return list(tiers)
+        return []
+
+    def _build_token_spellings(self) -> Set[str]:
+        spellings: Set[str] = set()
         for boss, value in self.points_map.items():
-            if isinstance(value, int):
-                if re.match(r"^\d+\.\d+$", boss):
-                    boss_values.append(r"/?" + re.escape(boss))
-                elif boss.startswith("/"):
-                    boss_values.append(r"/?" + re.escape(boss.lstrip("/")))
-                else:
-                    boss_values.append(re.escape(boss))
-
-        boss_values.append(ring_match)
-        boss_values.append(legacy_match)
-        boss_values.append(root_match)
-
-        boss_union = "|".join(boss_values)
-        modifier_union = "|".join(MODIFIERS)
-        pattern = rf"^(?P<boss>{boss_union})(\((?P<modifier>{modifier_union})\))?$"
-        return re.compile(pattern)
+            if not isinstance(value, int):
+                continue
+            if _DECIMAL_BOSS_RE.match(boss):
+                spellings.add(boss)
+                spellings.add(f"/{boss}")
+            elif boss.startswith("/"):
+                bare = boss.lstrip("/")
+                spellings.add(bare)
+                spellings.add(f"/{bare}")
+            else:
+                spellings.add(boss)
+        return spellings
 
-    def get_points(self, boss: str) -> Optional[int]:
-        if self._bosses_re is None:
-            self._bosses_re = self._build_bosses_re()
+    def _classify_body(self, body: str, modifier: Optional[str]) -> Optional[BossToken]:
+        if body in self._token_spellings:
+            return BossToken(
+                boss=body, kind="base", slash=body.startswith("/"), modifier=modifier
+            )
+        parsed = _parse_structured(body)
+        if parsed is None:
+            return None
+        if body in self._base_points:
+            return BossToken(boss=body, kind="base", slash=parsed.slash, modifier=modifier)
+        if modifier is None:
+            return parsed
+        return BossToken(
+            boss=parsed.boss,
+            kind=parsed.kind,
+            slash=parsed.slash,
+            modifier=modifier,
+            ring_count=parsed.ring_count,
+            star=parsed.star,
+            level=parsed.level,
+        )
+
+    def classify(self, token: str) -> Optional[BossToken]:
+        if token.endswith(")"):
+            open_index = token.rfind("(")
+            if open_index != -1 and token[open_index + 1 : -1] in _MODIFIER_SET:
+                parsed = self._classify_body(token[:open_index], token[open_index + 1 : -1])
+                if parsed is not None:
+                    return parsed
+        return self._classify_body(token, None)
 
-        rings_capture = re.compile(r"^/?rings(?P<num>[1-4])x(?P<star>[5-6])$")
-        legacy_capture = re.compile(r"^/?legacy(?P<level>\d+)\.(?P<star>[5-6])$")
-        root_re = re.compile(r"^/?root\d*$")
+    def get_points(self, boss: str) -> Optional[int]:
+        try:
+            return self._points_cache[boss]
+        except KeyError:
+            pass
+        points = self._compute_points(boss)
+        self._points_cache[boss] = points
+        return points
 
-        match = self._bosses_re.match(boss)
-        if not match:
+    def _compute_points(self, boss: str) -> Optional[int]:
+        parsed = self.classify(boss)
+        if parsed is None:
             return None
 
         points = 0
         double_points = False
         half_points = False
 
-        stripped_boss = match.group("boss")
-        if stripped_boss not in self.points_map:
-            if f"/{stripped_boss}" in self.points_map:
-                stripped_boss = f"/{stripped_boss}"
-            elif stripped_boss.startswith("/") and stripped_boss[1:] in self.points_map:
-                stripped_boss = stripped_boss[1:]
-        modifier = match.group("modifier")
-
+        modifier = parsed.modifier
         if modifier:
             if modifier == "brucybonus":
                 points += 5
@@ -124,39 +235,23 @@ class PointsStore:
                 if not any(prio in boss for prio in self.prios):
                     return None
 
-        if stripped_boss in self.points_map:
-            value = self.points_map[stripped_boss]
-            if isinstance(value, int):
-                points += value
-            else:
+        if parsed.kind == "base":
+            value = self._base_points.get(parsed.boss)
+            if value is None:
                 return None
+            points += value
+        elif parsed.kind == "rings":
+            if self._ring_values:
+                points += self._ring_values[parsed.star] * parsed.ring_count
+        elif parsed.kind == "legacy":
+            for tier in self._legacy_tiers:
+                if parsed.level >= tier.level:
+                    points += tier.point_5 if parsed.star == "5" else tier.point_6
+                    break
+        elif parsed.kind == "root":
+            points += 4
         else:
-            ring_match = rings_capture.match(stripped_boss)
-            if ring_match:
-                num = int(ring_match.group("num"))
-                star = ring_match.group("star")
-                ring_map = self.points_map.get("/rings")
-                if ring_map is None:
-                    ring_map = self.points_map.get("rings")
-                if isinstance(ring_map, dict):
-                    points += int(ring_map[star]) * num
-            else:
-                legacy_match = legacy_capture.match(stripped_boss)
-                if legacy_match:
-                    level = int(legacy_match.group("level"))
-                    star = legacy_match.group("star")
-                    tiers = self.points_map.get("/legacy")
-                    if tiers is None:
-                        tiers = self.points_map.get("legacy")
-                    if isinstance(tiers, list):
-                        for tier in tiers:
-                            if level >= tier.level:
-                                points += tier.point_5 if star == "5" else tier.point_6
-                                break
-                elif root_re.match(stripped_boss):
-                    points += 4
-                else:
-                    return None
+            return None
 
         if double_points:
             points *= 2
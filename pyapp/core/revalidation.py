@@ -0,0 +1,79 @@
+from dataclasses import fields
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .points import PointsStore
+from .sanitise import Line, ValidationErrors, iter_validated_lines
+
+_LINE_FIELDS = [f.name for f in fields(ValidationErrors) if f.name != "unknown_bosses"]
+
+
+def split_errors_by_line(errors: ValidationErrors) -> Dict[int, ValidationErrors]:
+    by_line: Dict[int, ValidationErrors] = {}
+    for name in _LINE_FIELDS:
+        for index in getattr(errors, name):
+            line_errors = by_line.setdefault(index, ValidationErrors())
+            getattr(line_errors, name).append(index)
+    for boss, indices in errors.unknown_bosses.items():
+        for index in indices:
+            line_errors = by_line.setdefault(index, ValidationErrors())
+            line_errors.unknown_bosses.setdefault(boss, []).append(index)
+    return by_line
+
+
+def merge_line_errors(per_line: Iterable[ValidationErrors]) -> ValidationErrors:
+    merged = ValidationErrors()
+    for line_errors in per_line:
+        for name in _LINE_FIELDS:
+            getattr(merged, name).extend(getattr(line_errors, name))
+        for boss, indices in line_errors.unknown_bosses.items():
+            merged.unknown_bosses.setdefault(boss, []).extend(indices)
+    return merged
+
+
+class IncrementalValidator:
+    def __init__(self, lines: Iterable[Line], points_store: PointsStore) -> None:
+        self.points_store = points_store
+        self.lines: Dict[int, str] = {}
+        errors = ValidationErrors()
+        for _ in iter_validated_lines(self._track(lines), points_store, errors):
+            pass
+        self._line_errors = split_errors_by_line(errors)
+
+    def _track(self, lines: Iterable[Line]) -> Iterable[Line]:
+        for index, line in lines:
+            self.lines[index] = line
+            yield index, line
+
+    @property
+    def total_lines(self) -> int:
+        return len(self.lines)
+
+    def error_lines(self) -> List[int]:
+        return sorted(self._line_errors)
+
+    def line_errors(self, index: int) -> Optional[ValidationErrors]:
+        return self._line_errors.get(index)
+
+    def errors(self) -> ValidationErrors:
+        return merge_line_errors(self._line_errors[index] for index in self.error_lines())
+
+    def validate_line(self, index: int, line: str) -> ValidationErrors:
+        errors = ValidationErrors()
+        for _ in iter_validated_lines(((index, line),), self.points_store, errors):
+            pass
+        return errors
+
+    def update_line(
+        self, index: int, line: Optional[str]
+    ) -> Tuple[Optional[ValidationErrors], Optional[ValidationErrors]]:
+        previous = self._line_errors.pop(index, None)
+        if line is None:
+            self.lines.pop(index, None)
+            return previous, None
+
+        self.lines[index] = line
+        current = self.validate_line(index, line)
+        if current.any() or current.unknown_bosses:
+            self._line_errors[index] = current
+            return previous, current
+        return previous, None
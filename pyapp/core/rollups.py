@@ -0,0 +1,186 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .runs import (
+    _rollup_index_path,
+    _sqlite_path,
+    iso_to_dt,
+    iter_active_events,
+    store_revision,
+)
+
+ROLLUP_VERSION = 1
+
+PlayerWeek = Dict[str, Any]
+WeeklyData = Dict[datetime, Dict[str, PlayerWeek]]
+
+
+def week_start_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    dt = dt.astimezone(timezone.utc)
+    days_since_sunday = (dt.weekday() + 1) % 7
+    week_start = dt - timedelta(days=days_since_sunday)
+    return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def normalize_boss_key(raw_boss: str) -> str:
+    cleaned = raw_boss.strip()
+    if "(" in cleaned and cleaned.endswith(")"):
+        cleaned = cleaned.split("(", 1)[0]
+    if cleaned.startswith("/"):
+        cleaned = cleaned[1:]
+    return cleaned
+
+
+def _event_week(event: Dict[str, Any]) -> Optional[datetime]:
+    event_time_raw = event.get("event_time_utc")
+    if not event_time_raw:
+        return None
+    return week_start_utc(iso_to_dt(event_time_raw))
+
+
+def _count_boss(boss_counts: Dict[str, int], boss_key: str, delta: int) -> None:
+    current = boss_counts.get(boss_key, 0)
+    if delta > 0:
+        boss_counts[boss_key] = current + 1
+    elif delta < 0 and current > 0:
+        if current > 1:
+            boss_counts[boss_key] = current - 1
+        else:
+            boss_counts.pop(boss_key, None)
+
+
+def aggregate_events(
+    events: Iterable[Dict[str, Any]],
+) -> Tuple[WeeklyData, Dict[datetime, Set[str]]]:
+    weekly: WeeklyData = {}
+    bosses: Dict[datetime, Set[str]] = {}
+    for event in events:
+        week_start = _event_week(event)
+        if week_start is None:
+            continue
+        bucket = weekly.setdefault(week_start, {})
+        boss = event.get("boss", "")
+        boss_key = normalize_boss_key(boss) if boss else ""
+        has_positive = False
+        for entry in event.get("entries", []):
+            name = entry.get("name", "")
+            delta = int(entry.get("delta", 0))
+            if not name:
+                continue
+            player = bucket.setdefault(name, {"dkp": 0, "boss_counts": {}})
+            player["dkp"] += delta
+            if boss_key:
+                _count_boss(player["boss_counts"], boss_key, delta)
+                has_positive = has_positive or delta > 0
+        week_bosses = bosses.setdefault(week_start, set())
+        if boss_key and has_positive:
+            week_bosses.add(boss_key)
+    return weekly, bosses
+
+
+def _week_path(base_dir: Path, week_iso: str) -> Path:
+    return _rollup_index_path(base_dir).with_name(week_iso[:10] + ".json")
+
+
+def _write_json(path: Path, data: Any) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _read_index(base_dir: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(_rollup_index_path(base_dir).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != ROLLUP_VERSION:
+        return {}
+    return data
+
+
+def _write_weeks(
+    base_dir: Path,
+    weeks: List[str],
+    changed: Dict[str, Any],
+    removed: Iterable[str] = (),
+) -> None:
+    index_path = _rollup_index_path(base_dir)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    for week_iso in removed:
+        _week_path(base_dir, week_iso).unlink(missing_ok=True)
+    for week_iso, week in changed.items():
+        _write_json(_week_path(base_dir, week_iso), week)
+    _write_json(
+        index_path,
+        {"version": ROLLUP_VERSION, "revision": store_revision(base_dir), "weeks": sorted(weeks)},
+    )
+
+
+def _encode_weeks(weekly: WeeklyData, bosses: Dict[datetime, Set[str]]) -> Dict[str, Any]:
+    return {
+        week_start.isoformat(): {
+            "players": players,
+            "bosses": sorted(bosses.get(week_start, ())),
+        }
+        for week_start, players in weekly.items()
+    }
+
+
+def rebuild_weekly_rollups(base_dir: Path) -> Dict[str, Any]:
+    weeks = _encode_weeks(*aggregate_events(iter_active_events(base_dir)))
+    stale = set(_read_index(base_dir).get("weeks", [])) - set(weeks)
+    _write_weeks(base_dir, list(weeks), weeks, stale)
+    return weeks
+
+
+def update_weekly_rollups(
+    base_dir: Path, changed_events: Iterable[Dict[str, Any]], previous_revision: str
+) -> None:
+    index = _read_index(base_dir)
+    if "weeks" not in index or index.get("revision") != previous_revision:
+        rebuild_weekly_rollups(base_dir)
+        return
+    affected = {week for week in map(_event_week, changed_events) if week is not None}
+    changed: Dict[str, Any] = {}
+    if affected:
+        events = iter_active_events(base_dir, min(affected), max(affected) + timedelta(days=7))
+        weekly, bosses = aggregate_events(
+            event for event in events if _event_week(event) in affected
+        )
+        changed = _encode_weeks(weekly, bosses)
+    removed = {week.isoformat() for week in affected} - set(changed)
+    weeks = (set(index["weeks"]) - removed) | set(changed)
+    _write_weeks(base_dir, list(weeks), changed, removed)
+
+
+def load_weekly_rollups(base_dir: Path) -> Tuple[WeeklyData, List[str]]:
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
+
+        weekly, bosses = runs_sqlite.weekly_aggregates(base_dir)
+        return weekly, sorted(set().union(*bosses.values()), key=str.lower)
+
+    index = _read_index(base_dir)
+    weeks: Dict[str, Any] = {}
+    if "weeks" in index and index.get("revision") == store_revision(base_dir):
+        try:
+            for week_iso in index["weeks"]:
+                weeks[week_iso] = json.loads(
+                    _week_path(base_dir, week_iso).read_text(encoding="utf-8")
+                )
+        except (OSError, json.JSONDecodeError):
+            weeks = rebuild_weekly_rollups(base_dir)
+    else:
+        weeks = rebuild_weekly_rollups(base_dir)
+
+    weekly: WeeklyData = {}
+    boss_set: Set[str] = set()
+    for week_iso, week in weeks.items():
+        weekly[datetime.fromisoformat(week_iso)] = week["players"]
+        boss_set.update(week["bosses"])
+    return weekly, sorted(boss_set, key=str.lower)
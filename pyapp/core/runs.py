@@ -1,11 +1,38 @@
 import json
+import math
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .timing import Timings
+
+STORE_VERSION = 2
+
+
+def _runs_dir(base_dir: Path) -> Path:
+    return base_dir / "runs"
 
 
 def _runs_path(base_dir: Path) -> Path:
-    return base_dir / "runs" / "events.json"
+    return _runs_dir(base_dir) / "events.json"
+
+
+def _log_path(base_dir: Path) -> Path:
+    return _runs_dir(base_dir) / "events.jsonl"
+
+
+def _manifest_path(base_dir: Path) -> Path:
+    return _runs_dir(base_dir) / "manifest.jsonl"
+
+
+def _sqlite_path(base_dir: Path) -> Path:
+    return _runs_dir(base_dir) / "runs.sqlite3"
+
+
+def _rollup_index_path(base_dir: Path) -> Path:
+    return _runs_dir(base_dir) / "weekly" / "index.json"
 
 
 def _ensure_parent(path: Path) -> None:
@@ -22,56 +49,398 @@ def _isoformat_utc(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _to_epoch(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_local_tzinfo())
+    return dt.timestamp()
+
+
 def _parse_iso(value: str) -> datetime:
     if value.endswith("Z"):
         value = value.replace("Z", "+00:00")
     return datetime.fromisoformat(value)
 
 
-def load_run_store(base_dir: Path) -> Dict[str, Any]:
-    path = _runs_path(base_dir)
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+WEEK_SECONDS = 7 * 24 * 60 * 60
+_MAX_BUCKET_SPAN = 520
+
+
+def _week_key(epoch: float) -> int:
+    return int(epoch // WEEK_SECONDS)
+
+
+class WeekBuckets:
+    def __init__(self) -> None:
+        self._buckets: Dict[int, List[Tuple[float, float, Any]]] = {}
+        self._wide: List[Tuple[float, float, Any]] = []
+
+    def add(self, start: float, end: float, item: Any) -> None:
+        if not (math.isfinite(start) and math.isfinite(end)):
+            self._wide.append((start, end, item))
+            return
+        first, last = _week_key(start), _week_key(end)
+        if last - first > _MAX_BUCKET_SPAN:
+            self._wide.append((start, end, item))
+            return
+        for key in range(first, last + 1):
+            self._buckets.setdefault(key, []).append((start, end, item))
+
+    def covering(self, point: float) -> List[Any]:
+        found = [item for start, end, item in self._wide if start <= point <= end]
+        for start, end, item in self._buckets.get(_week_key(point), ()):
+            if start <= point <= end:
+                found.append(item)
+        return found
+
+    def overlapping(self, start: float, end: float) -> List[Any]:
+        if math.isfinite(start) and math.isfinite(end) and (
+            _week_key(end) - _week_key(start) <= _MAX_BUCKET_SPAN
+        ):
+            candidates = list(self._wide)
+            for key in range(_week_key(start), _week_key(end) + 1):
+                candidates.extend(self._buckets.get(key, ()))
+        else:
+            candidates = list(self._wide)
+            for bucket in self._buckets.values():
+                candidates.extend(bucket)
+        return sorted({item for low, high, item in candidates if low <= end and high >= start})
+
+
+@dataclass
+class Segment:
+    kind: str
+    event_count: int
+    offset: int
+    run: Optional[Dict[str, Any]] = None
+    legacy_runs: List[Dict[str, Any]] = field(default_factory=list)
+    min_epoch: Optional[float] = -math.inf
+    max_epoch: Optional[float] = math.inf
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Segment":
+        segment = cls(
+            kind=record["type"],
+            event_count=int(record["event_count"]),
+            offset=int(record["offset"]),
+            run=record.get("run"),
+            legacy_runs=list(record.get("runs", [])),
+        )
+        if "min_epoch" in record:
+            segment.min_epoch = record["min_epoch"]
+            segment.max_epoch = record["max_epoch"]
+        return segment
+
+    def to_record(self) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "type": self.kind,
+            "event_count": self.event_count,
+            "offset": self.offset,
+            "min_epoch": self.min_epoch,
+            "max_epoch": self.max_epoch,
+        }
+        if self.kind == "run":
+            record["run"] = self.run
+        else:
+            record["runs"] = self.legacy_runs
+        return record
+
+
+def _read_manifest(base_dir: Path) -> Tuple[List[Segment], int]:
+    path = _manifest_path(base_dir)
     if not path.exists():
-        return {"version": 1, "runs": [], "events": []}
+        return [], 0
+    segments: List[Segment] = []
+    offset = 0
+    valid_size = 0
+    with path.open("rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                segment = Segment.from_record(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                break
+            if segment.offset < offset:
+                break
+            offset = segment.offset
+            valid_size += len(line)
+            segments.append(segment)
+    return segments, valid_size
+
+
+def _read_events(base_dir: Path, segments: List[Segment]) -> List[Tuple[int, Dict[str, Any]]]:
+    if not segments:
+        return []
+    log_path = _log_path(base_dir)
+    if not log_path.exists():
+        return []
+    committed = segments[-1].offset
+    events: List[Tuple[int, Dict[str, Any]]] = []
+    with log_path.open("rb") as handle:
+        data = handle.read(committed)
+    lines = data.splitlines()
+    position = 0
+    for segment_index, segment in enumerate(segments):
+        for line in lines[position : position + segment.event_count]:
+            events.append((segment_index, json.loads(line)))
+        position += segment.event_count
+    return events
+
+
+def _read_segments(
+    base_dir: Path, segments: List[Segment], indices: List[int]
+) -> List[Tuple[int, Dict[str, Any]]]:
+    log_path = _log_path(base_dir)
+    if not indices or not log_path.exists():
+        return []
+    events: List[Tuple[int, Dict[str, Any]]] = []
+    with log_path.open("rb") as handle:
+        for segment_index in indices:
+            start = segments[segment_index - 1].offset if segment_index else 0
+            handle.seek(start)
+            data = handle.read(segments[segment_index].offset - start)
+            for line in data.splitlines()[: segments[segment_index].event_count]:
+                events.append((segment_index, json.loads(line)))
+    return events
+
+
+def _event_epoch(event: Dict[str, Any]) -> Optional[float]:
+    event_time_raw = event.get("event_time_utc")
+    if not event_time_raw:
+        return None
+    return _parse_iso(event_time_raw).timestamp()
+
+
+def _run_window(run_meta: Dict[str, Any]) -> Tuple[float, float]:
+    start = _parse_iso(run_meta["start_utc"]).timestamp()
+    end = _parse_iso(run_meta["end_utc"]).timestamp()
+    return start, end
+
+
+def _epoch_bounds(events: List[Dict[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
+    epochs = [epoch for epoch in map(_event_epoch, events) if epoch is not None]
+    if not epochs:
+        return None, None
+    return min(epochs), max(epochs)
+
+
+def _segment_index(segments: List[Segment]) -> WeekBuckets:
+    index = WeekBuckets()
+    for segment_index, segment in enumerate(segments):
+        if segment.min_epoch is not None and segment.max_epoch is not None:
+            index.add(segment.min_epoch, segment.max_epoch, segment_index)
+    return index
+
+
+def _tombstone_index(segments: List[Segment]) -> WeekBuckets:
+    index = WeekBuckets()
+    for segment_index, segment in enumerate(segments):
+        if segment.kind == "run":
+            start, end = _run_window(segment.run)
+            index.add(start, end, (segment_index, segment.run["run_id"]))
+    return index
+
+
+def _resolve_active(
+    tombstones: WeekBuckets, events: List[Tuple[int, Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    resolved: List[Dict[str, Any]] = []
+    for segment_index, event in events:
+        if event.get("active", True):
+            event["active"] = True
+            event["replaced_by"] = None
+            event_time = _event_epoch(event)
+            if event_time is not None:
+                later = [
+                    tombstone
+                    for tombstone in tombstones.covering(event_time)
+                    if tombstone[0] > segment_index
+                ]
+                if later:
+                    event["active"] = False
+                    event["replaced_by"] = min(later)[1]
+        resolved.append(event)
+    return resolved
+
+
+def _active_in_window(
+    base_dir: Path, segments: List[Segment], start: float, end: float
+) -> List[Dict[str, Any]]:
+    indices = _segment_index(segments).overlapping(start, end)
+    events = _read_segments(base_dir, segments, indices)
+    selected = []
+    for event in _resolve_active(_tombstone_index(segments), events):
+        if not event["active"]:
+            continue
+        event_time = _event_epoch(event)
+        if event_time is not None and start <= event_time <= end:
+            selected.append(event)
+    return selected
+
+
+def _write_store(base_dir: Path, runs: List[Dict[str, Any]], events: List[Dict[str, Any]]) -> None:
+    log_path = _log_path(base_dir)
+    manifest_path = _manifest_path(base_dir)
+    _ensure_parent(log_path)
+
+    groups: List[List[Dict[str, Any]]] = []
+    previous_key: Any = object()
+    for event in events:
+        event_time = _event_epoch(event)
+        key = _week_key(event_time) if event_time is not None else None
+        if not groups or key != previous_key:
+            groups.append([])
+            previous_key = key
+        groups[-1].append(event)
+
+    payload: List[bytes] = []
+    records: List[bytes] = []
+    offset = 0
+    for group_index, group in enumerate(groups or [[]]):
+        chunk = b"".join(_encode(event) for event in group)
+        payload.append(chunk)
+        offset += len(chunk)
+        min_epoch, max_epoch = _epoch_bounds(group)
+        segment = Segment(
+            kind="legacy",
+            event_count=len(group),
+            offset=offset,
+            legacy_runs=runs if group_index == 0 else [],
+            min_epoch=min_epoch,
+            max_epoch=max_epoch,
+        )
+        records.append(_encode(segment.to_record()))
+
+    log_tmp = log_path.with_name(log_path.name + ".tmp")
+    manifest_tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    log_tmp.write_bytes(b"".join(payload))
+    manifest_tmp.write_bytes(b"".join(records))
+    os.replace(log_tmp, log_path)
+    os.replace(manifest_tmp, manifest_path)
+
+
+def migrate_legacy_store(base_dir: Path) -> bool:
+    legacy_path = _runs_path(base_dir)
+    if _manifest_path(base_dir).exists() or not legacy_path.exists():
+        return False
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(legacy_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
-        return {"version": 1, "runs": [], "events": []}
+        data = {}
+    _write_store(base_dir, list(data.get("runs", [])), list(data.get("events", [])))
+    legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+    return True
+
+
+def load_run_store(base_dir: Path) -> Dict[str, Any]:
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
+
+        return runs_sqlite.load_run_store(base_dir)
+    migrate_legacy_store(base_dir)
+    segments, _ = _read_manifest(base_dir)
+    runs: List[Dict[str, Any]] = []
+    for segment in segments:
+        if segment.kind == "run":
+            runs.append(segment.run)
+        else:
+            runs.extend(segment.legacy_runs)
+    events = _resolve_active(_tombstone_index(segments), _read_events(base_dir, segments))
+    return {"version": STORE_VERSION, "runs": runs, "events": events}
 
 
 def save_run_store(base_dir: Path, data: Dict[str, Any]) -> None:
-    path = _runs_path(base_dir)
-    _ensure_parent(path)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
+
+        runs_sqlite.save_run_store(base_dir, data)
+    else:
+        _write_store(base_dir, list(data.get("runs", [])), list(data.get("events", [])))
+        legacy_path = _runs_path(base_dir)
+        if legacy_path.exists():
+            legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+    _rollup_index_path(base_dir).unlink(missing_ok=True)
+
+
+def store_revision(base_dir: Path) -> str:
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
+
+        return runs_sqlite.store_revision(base_dir)
+    try:
+        return f"jsonl:{_manifest_path(base_dir).stat().st_size}"
+    except FileNotFoundError:
+        return "empty"
 
 
 def save_run(
     base_dir: Path,
     run_meta: Dict[str, Any],
     events: List[Dict[str, Any]],
-) -> None:
-    data = load_run_store(base_dir)
-    data.setdefault("version", 1)
-    data.setdefault("runs", [])
-    data.setdefault("events", [])
+    timings: Optional[Timings] = None,
+) -> List[Dict[str, Any]]:
+    from . import rollups
 
-    start = _parse_iso(run_meta["start_utc"])
-    end = _parse_iso(run_meta["end_utc"])
-    run_id = run_meta["run_id"]
+    timings = timings or Timings()
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
 
-    for event in data["events"]:
-        if not event.get("active", True):
-            continue
-        event_time_raw = event.get("event_time_utc")
-        if not event_time_raw:
-            continue
-        event_time = _parse_iso(event_time_raw)
-        if start <= event_time <= end:
-            event["active"] = False
-            event["replaced_by"] = run_id
+        with timings.span("store", len(events)):
+            return runs_sqlite.save_run(base_dir, run_meta, events)
+
+    previous_revision = store_revision(base_dir)
+    with timings.span("store", len(events)):
+        superseded = _append_run(base_dir, run_meta, events)
+    with timings.span("rollups", len(events) + len(superseded)):
+        rollups.update_weekly_rollups(base_dir, events + superseded, previous_revision)
+    return superseded
+
+
+def _append_run(
+    base_dir: Path,
+    run_meta: Dict[str, Any],
+    events: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    migrate_legacy_store(base_dir)
+    log_path = _log_path(base_dir)
+    _ensure_parent(log_path)
+    segments, manifest_size = _read_manifest(base_dir)
+    committed = segments[-1].offset if segments else 0
+
+    start, end = _run_window(run_meta)
+    superseded = _active_in_window(base_dir, segments, start, end)
+    for event in superseded:
+        event["active"] = False
+        event["replaced_by"] = run_meta["run_id"]
+
+    payload = b"".join(_encode(event) for event in events)
+    with log_path.open("ab") as handle:
+        if handle.tell() > committed:
+            handle.truncate(committed)
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
 
-    data["runs"].append(run_meta)
-    data["events"].extend(events)
-    save_run_store(base_dir, data)
+    min_epoch, max_epoch = _epoch_bounds(events)
+    segment = Segment(
+        kind="run",
+        event_count=len(events),
+        offset=committed + len(payload),
+        run=run_meta,
+        min_epoch=min_epoch,
+        max_epoch=max_epoch,
+    )
+    with _manifest_path(base_dir).open("ab") as handle:
+        if handle.tell() > manifest_size:
+            handle.truncate(manifest_size)
+        handle.write(_encode(segment.to_record()))
+        handle.flush()
+        os.fsync(handle.fileno())
+    return superseded
 
 
 def build_run_meta(
@@ -116,10 +485,69 @@ def normalize_event(
     }
 
 
-def iter_active_events(base_dir: Path) -> List[Dict[str, Any]]:
+def enable_sqlite_store(base_dir: Path) -> bool:
+    if _sqlite_path(base_dir).exists():
+        return False
+    from . import runs_sqlite
+
     data = load_run_store(base_dir)
-    events = data.get("events", [])
-    return [event for event in events if event.get("active", True)]
+    tmp_path = _sqlite_path(base_dir).with_name("runs.sqlite3.tmp")
+    for stale in (tmp_path, tmp_path.with_name(tmp_path.name + "-wal")):
+        if stale.exists():
+            stale.unlink()
+    runs_sqlite.create_store(tmp_path, data)
+    os.replace(tmp_path, _sqlite_path(base_dir))
+    for path in (_log_path(base_dir), _manifest_path(base_dir)):
+        if path.exists():
+            path.replace(path.with_name(path.name + ".migrated"))
+    return True
+
+
+def disable_sqlite_store(base_dir: Path) -> bool:
+    sqlite_path = _sqlite_path(base_dir)
+    if not sqlite_path.exists():
+        return False
+    from . import runs_sqlite
+
+    data = runs_sqlite.load_run_store(base_dir)
+    _write_store(base_dir, list(data.get("runs", [])), list(data.get("events", [])))
+    for suffix in ("", "-wal", "-shm"):
+        path = sqlite_path.with_name(sqlite_path.name + suffix)
+        if path.exists():
+            path.replace(path.with_name(path.name + ".migrated"))
+    _rollup_index_path(base_dir).unlink(missing_ok=True)
+    return True
+
+
+def apply_run_store_backend(base_dir: Path, backend: str) -> bool:
+    if backend == "sqlite":
+        return enable_sqlite_store(base_dir)
+    return disable_sqlite_store(base_dir)
+
+
+def iter_active_events(
+    base_dir: Path,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    start_epoch = _to_epoch(start) if start is not None else None
+    end_epoch = _to_epoch(end) if end is not None else None
+    if _sqlite_path(base_dir).exists():
+        from . import runs_sqlite
+
+        return runs_sqlite.iter_active_events(base_dir, start_epoch, end_epoch)
+
+    if start_epoch is None and end_epoch is None:
+        data = load_run_store(base_dir)
+        return [event for event in data.get("events", []) if event.get("active", True)]
+    migrate_legacy_store(base_dir)
+    segments, _ = _read_manifest(base_dir)
+    return _active_in_window(
+        base_dir,
+        segments,
+        start_epoch if start_epoch is not None else -math.inf,
+        end_epoch if end_epoch is not None else math.inf,
+    )
 
 
 def iso_to_dt(value: str) -> datetime:
@@ -0,0 +1,218 @@
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .rollups import WeeklyData, _count_boss, normalize_boss_key
+from .runs import WEEK_SECONDS, _event_epoch, _run_window, _sqlite_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    start_epoch REAL,
+    end_epoch REAL,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT,
+    event_time_utc TEXT,
+    event_epoch REAL,
+    boss TEXT,
+    points INTEGER,
+    active INTEGER NOT NULL DEFAULT 1,
+    replaced_by TEXT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    delta INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_active_time ON events(active, event_epoch);
+CREATE INDEX IF NOT EXISTS idx_events_time ON events(event_epoch);
+CREATE INDEX IF NOT EXISTS idx_entries_name ON entries(name);
+CREATE INDEX IF NOT EXISTS idx_entries_event ON entries(event_id);
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _insert_runs(conn: sqlite3.Connection, runs: Iterable[Dict[str, Any]]) -> None:
+    rows = []
+    for run_meta in runs:
+        try:
+            start, end = _run_window(run_meta)
+        except (KeyError, TypeError, ValueError):
+            start, end = None, None
+        rows.append((run_meta.get("run_id", ""), start, end, json.dumps(run_meta)))
+    conn.executemany(
+        "INSERT INTO runs (run_id, start_epoch, end_epoch, meta) VALUES (?, ?, ?, ?)", rows
+    )
+
+
+def _insert_events(conn: sqlite3.Connection, events: Iterable[Dict[str, Any]]) -> None:
+    for event in events:
+        cursor = conn.execute(
+            "INSERT INTO events (run_id, event_time_utc, event_epoch, boss, points, active,"
+            " replaced_by, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                event.get("run_id"),
+                event.get("event_time_utc"),
+                _event_epoch(event),
+                event.get("boss"),
+                event.get("points"),
+                1 if event.get("active", True) else 0,
+                event.get("replaced_by"),
+                json.dumps(event),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO entries (event_id, position, name, delta) VALUES (?, ?, ?, ?)",
+            [
+                (cursor.lastrowid, position, entry.get("name", ""), int(entry.get("delta", 0)))
+                for position, entry in enumerate(event.get("entries", []))
+            ],
+        )
+
+
+def _event_from_row(payload: str, active: int, replaced_by: Optional[str]) -> Dict[str, Any]:
+    event = json.loads(payload)
+    event["active"] = bool(active)
+    event["replaced_by"] = replaced_by
+    return event
+
+
+def load_run_store(base_dir: Path) -> Dict[str, Any]:
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        runs = [json.loads(meta) for (meta,) in conn.execute("SELECT meta FROM runs ORDER BY seq")]
+        events = [
+            _event_from_row(*row)
+            for row in conn.execute("SELECT payload, active, replaced_by FROM events ORDER BY id")
+        ]
+    return {"version": 2, "runs": runs, "events": events}
+
+
+def _replace_all(conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+    with conn:
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM events")
+        conn.execute("DELETE FROM runs")
+        _insert_runs(conn, data.get("runs", []))
+        _insert_events(conn, data.get("events", []))
+
+
+def create_store(path: Path, data: Dict[str, Any]) -> None:
+    with closing(connect(path)) as conn:
+        _replace_all(conn, data)
+
+
+def save_run_store(base_dir: Path, data: Dict[str, Any]) -> None:
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        _replace_all(conn, data)
+
+
+def save_run(
+    base_dir: Path, run_meta: Dict[str, Any], events: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    start, end = _run_window(run_meta)
+    run_id = run_meta["run_id"]
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        with conn:
+            superseded = [
+                _event_from_row(payload, 0, run_id)
+                for (payload,) in conn.execute(
+                    "SELECT payload FROM events"
+                    " WHERE active = 1 AND event_epoch BETWEEN ? AND ? ORDER BY id",
+                    (start, end),
+                )
+            ]
+            conn.execute(
+                "UPDATE events SET active = 0, replaced_by = ?"
+                " WHERE active = 1 AND event_epoch BETWEEN ? AND ?",
+                (run_id, start, end),
+            )
+            _insert_runs(conn, [run_meta])
+            _insert_events(conn, events)
+    return superseded
+
+
+def store_revision(base_dir: Path) -> str:
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        run_seq, event_id = conn.execute(
+            "SELECT (SELECT MAX(seq) FROM runs), (SELECT MAX(id) FROM events)"
+        ).fetchone()
+    return f"sqlite:{run_seq}:{event_id}"
+
+
+def iter_active_events(
+    base_dir: Path, start: Optional[float] = None, end: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    query = "SELECT payload, active, replaced_by FROM events WHERE active = 1"
+    params: Tuple[float, ...] = ()
+    if start is not None or end is not None:
+        query += " AND event_epoch BETWEEN ? AND ?"
+        params = (
+            start if start is not None else float("-inf"),
+            end if end is not None else float("inf"),
+        )
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        return [_event_from_row(*row) for row in conn.execute(query + " ORDER BY id", params)]
+
+
+
+SUNDAY_EPOCH = 3 * 24 * 60 * 60
+_WEEK_OFFSET = f"((events.event_epoch - {SUNDAY_EPOCH}) / {WEEK_SECONDS})"
+_WEEK = f"(CAST({_WEEK_OFFSET} AS INTEGER) - ({_WEEK_OFFSET} < CAST({_WEEK_OFFSET} AS INTEGER)))"
+_ACTIVE_ENTRIES = (
+    " FROM entries JOIN events ON events.id = entries.event_id"
+    " WHERE events.active = 1 AND events.event_epoch IS NOT NULL AND entries.name != ''"
+)
+
+
+def _week_start(week: int) -> datetime:
+    return datetime.fromtimestamp(SUNDAY_EPOCH + week * WEEK_SECONDS, timezone.utc)
+
+
+def weekly_aggregates(base_dir: Path) -> Tuple[WeeklyData, Dict[datetime, Set[str]]]:
+    weekly: WeeklyData = {}
+    bosses: Dict[datetime, Set[str]] = {}
+    starts: Dict[int, datetime] = {}
+    with closing(connect(_sqlite_path(base_dir))) as conn:
+        for (week,) in conn.execute(
+            f"SELECT DISTINCT {_WEEK} FROM events"
+            " WHERE active = 1 AND event_epoch IS NOT NULL"
+        ):
+            starts[week] = _week_start(week)
+            weekly[starts[week]] = {}
+            bosses[starts[week]] = set()
+        for week, name, dkp in conn.execute(
+            f"SELECT {_WEEK}, entries.name, SUM(entries.delta)"
+            + _ACTIVE_ENTRIES
+            + " GROUP BY 1, 2"
+        ):
+            weekly[starts[week]][name] = {"dkp": dkp, "boss_counts": {}}
+        for week, name, boss, delta in conn.execute(
+            f"SELECT {_WEEK}, entries.name, events.boss, entries.delta"
+            + _ACTIVE_ENTRIES
+            + " AND events.boss != '' AND entries.delta != 0"
+            " ORDER BY events.id, entries.position"
+        ):
+            boss_key = normalize_boss_key(boss)
+            if not boss_key:
+                continue
+            _count_boss(weekly[starts[week]][name]["boss_counts"], boss_key, delta)
+            if delta > 0:
+                bosses[starts[week]].add(boss_key)
+    return weekly, bosses
@@ -1,22 +1,28 @@
+import hashlib
 import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from google.oauth2.credentials import Credentials
-from google.oauth2 import service_account
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
+from .config import load_config, roster_cache_path
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
+ServiceFactory = Callable[[Path, Path], Any]
+CredentialsLoader = Callable[[Path, Path], Any]
+TransportFactory = Callable[[], Any]
+
+
+def load_credentials(credentials_path: Path, token_path: Path):
+    from google.auth.transport.requests import Request
+    from google.oauth2 import service_account
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
 
-def get_names_from_sheets(
-    spreadsheet_id: str,
-    range_name: str,
-    credentials_path: Path,
-    token_path: Path,
-) -> List[str]:
     raw = json.loads(credentials_path.read_text(encoding="utf-8"))
 
     creds = None
@@ -38,7 +44,113 @@ def get_names_from_sheets(
             token_path.parent.mkdir(parents=True, exist_ok=True)
             token_path.write_text(creds.to_json(), encoding="utf-8")
 
-    service = build("sheets", "v4", credentials=creds)
+    return creds
+
+
+def _default_transport() -> Any:
+    import httplib2
+
+    return httplib2.Http()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _SerializedHttp:
+    def __init__(self, http: Any) -> None:
+        self._http = http
+        self._lock = threading.Lock()
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return self._http.request(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http, name)
+
+
+@dataclass
+class SheetsClient:
+    credentials: Any
+    service: Any
+    token_path: Path
+    signature: Tuple[int, int]
+
+
+class SheetsClientPool:
+    def __init__(
+        self,
+        credentials_loader: CredentialsLoader = load_credentials,
+        transport_factory: TransportFactory = _default_transport,
+    ) -> None:
+        self.credentials_loader = credentials_loader
+        self.transport_factory = transport_factory
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str], SheetsClient] = {}
+
+    def service(self, credentials_path: Path, token_path: Path) -> Any:
+        key = (str(credentials_path), str(token_path))
+        signature = _file_signature(credentials_path)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.signature != signature:
+                client = self._clients[key] = self._connect(
+                    credentials_path, token_path, signature
+                )
+            else:
+                self._refresh_if_expired(client)
+            return client.service
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def _connect(
+        self, credentials_path: Path, token_path: Path, signature: Tuple[int, int]
+    ) -> SheetsClient:
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build
+
+        creds = self.credentials_loader(credentials_path, token_path)
+        http = _SerializedHttp(AuthorizedHttp(creds, http=self.transport_factory()))
+        service = build("sheets", "v4", http=http, static_discovery=True)
+        return SheetsClient(creds, service, token_path, signature)
+
+    @staticmethod
+    def _refresh_if_expired(client: SheetsClient) -> None:
+        creds = client.credentials
+        if creds.valid or not getattr(creds, "refresh_token", None):
+            return
+        from google.auth.transport.requests import Request
+
+        creds.refresh(Request())
+        client.token_path.parent.mkdir(parents=True, exist_ok=True)
+        client.token_path.write_text(creds.to_json(), encoding="utf-8")
+
+
+_defaults_lock = threading.Lock()
+_default_client_pool: Optional[SheetsClientPool] = None
+
+
+def default_client_pool() -> SheetsClientPool:
+    global _default_client_pool
+    if _default_client_pool is None:
+        with _defaults_lock:
+            if _default_client_pool is None:
+                _default_client_pool = SheetsClientPool()
+    return _default_client_pool
+
+
+def build_service(credentials_path: Path, token_path: Path) -> Any:
+    return default_client_pool().service(credentials_path, token_path)
+
+
+def fetch_names(service: Any, spreadsheet_id: str, range_name: str) -> List[str]:
     result = (
         service.spreadsheets()
         .values()
@@ -54,3 +166,208 @@ def get_names_from_sheets(
                 names.append(cell)
 
     return names
+
+
+def roster_digest(names: List[str]) -> str:
+    return hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class RosterEntry:
+    names: List[str]
+    fetched_at: float
+    digest: str
+
+
+class RosterCache:
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = 600,
+        service_factory: ServiceFactory = build_service,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.service_factory = service_factory
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, RosterEntry]] = None
+        self._refreshing: Dict[str, threading.Thread] = {}
+
+    @staticmethod
+    def _key(spreadsheet_id: str, range_name: str) -> str:
+        return f"{spreadsheet_id}|{range_name}"
+
+    def _load(self) -> Dict[str, RosterEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: Dict[str, RosterEntry] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if isinstance(data, dict):
+            for key, raw in data.items():
+                try:
+                    entries[key] = RosterEntry(
+                        names=[str(name) for name in raw["names"]],
+                        fetched_at=float(raw["fetched_at"]),
+                        digest=str(raw.get("digest", "")),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+        self._entries = entries
+        return entries
+
+    def _save(self) -> None:
+        data = {
+            key: {"names": entry.names, "fetched_at": entry.fetched_at, "digest": entry.digest}
+            for key, entry in self._load().items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def cached(self, spreadsheet_id: str, range_name: str) -> Optional[RosterEntry]:
+        with self._lock:
+            return self._load().get(self._key(spreadsheet_id, range_name))
+
+    def refresh(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        credentials_path: Path,
+        token_path: Path,
+    ) -> List[str]:
+        service = self.service_factory(credentials_path, token_path)
+        names = fetch_names(service, spreadsheet_id, range_name)
+        digest = roster_digest(names)
+        key = self._key(spreadsheet_id, range_name)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and entry.digest == digest:
+                entry.fetched_at = self.clock()
+            else:
+                entry = entries[key] = RosterEntry(names, self.clock(), digest)
+            self._save()
+            return list(entry.names)
+
+    def refresh_in_background(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        credentials_path: Path,
+        token_path: Path,
+    ) -> threading.Thread:
+        key = self._key(spreadsheet_id, range_name)
+
+        def run() -> None:
+            try:
+                self.refresh(spreadsheet_id, range_name, credentials_path, token_path)
+            except Exception as exc:
+                logging.warning("Background roster refresh failed: %s", exc)
+            finally:
+                with self._lock:
+                    self._refreshing.pop(key, None)
+
+        with self._lock:
+            thread = self._refreshing.get(key)
+            if thread is None:
+                thread = threading.Thread(target=run, name="roster-refresh", daemon=True)
+                self._refreshing[key] = thread
+                thread.start()
+        return thread
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def get(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        credentials_path: Path,
+        token_path: Path,
+        force_refresh: bool = False,
+    ) -> List[str]:
+        entry = None if force_refresh else self.cached(spreadsheet_id, range_name)
+        if entry is not None:
+            age = self.clock() - entry.fetched_at
+            if 0 <= age < self.ttl_seconds:
+                if age >= self.ttl_seconds / 2:
+                    self.refresh_in_background(
+                        spreadsheet_id, range_name, credentials_path, token_path
+                    )
+                return list(entry.names)
+        return self.refresh(spreadsheet_id, range_name, credentials_path, token_path)
+
+
+_default_cache: Optional[RosterCache] = None
+
+
+def default_roster_cache() -> RosterCache:
+    global _default_cache
+    if _default_cache is None:
+        with _defaults_lock:
+            if _default_cache is None:
+                _default_cache = RosterCache(
+                    roster_cache_path(), ttl_seconds=load_config().roster_cache_ttl_seconds
+                )
+    return _default_cache
+
+
+def get_names_from_sheets(
+    spreadsheet_id: str,
+    range_name: str,
+    credentials_path: Path,
+    token_path: Path,
+    force_refresh: bool = False,
+    cache: Optional[RosterCache] = None,
+) -> List[str]:
+    cache = cache or default_roster_cache()
+    return cache.get(
+        spreadsheet_id,
+        range_name,
+        credentials_path,
+        token_path,
+        force_refresh=force_refresh,
+    )
+
+
+_prefetch_lock = threading.Lock()
+
+
+def prefetch_names(
+    spreadsheet_id: str,
+    range_name: str,
+    credentials_path: Path,
+    token_path: Path,
+    cache: Optional[RosterCache] = None,
+) -> "Future[List[str]]":
+    future: "Future[List[str]]" = Future()
+
+    def run() -> None:
+        with _prefetch_lock:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                names = get_names_from_sheets(
+                    spreadsheet_id,
+                    range_name,
+                    credentials_path,
+                    token_path,
+                    cache=cache,
+                )
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(names)
+
+    threading.Thread(target=run, name="roster-prefetch", daemon=True).start()
+    return future
@@ -0,0 +1,59 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from .rollups import WeeklyData
+
+Streaks = Dict[str, Dict[str, int]]
+
+
+def full_week_range(weeks: Iterable[datetime]) -> List[datetime]:
+    weeks = list(weeks)
+    if not weeks:
+        return []
+    full_weeks: List[datetime] = []
+    current = min(weeks)
+    last = max(weeks)
+    while current <= last:
+        full_weeks.append(current)
+        current = current + timedelta(days=7)
+    return full_weeks
+
+
+class StreakEngine:
+    def __init__(self, weekly: WeeklyData) -> None:
+        self.weeks = full_week_range(weekly)
+        self._floors: Dict[str, List[int]] = {}
+        self._cache: Dict[Tuple[int, int], Streaks] = {}
+
+        players = set()
+        for week_players in weekly.values():
+            players.update(week_players)
+        for player in players:
+            floors: List[int] = []
+            floor = None
+            for week_start in reversed(self.weeks):
+                dkp = weekly.get(week_start, {}).get(player, {}).get("dkp", 0)
+                floor = dkp if floor is None else min(floor, dkp)
+                floors.append(floor)
+            floors.reverse()
+            self._floors[player] = floors
+
+    def streak(self, player: str, threshold: int) -> int:
+        floors = self._floors.get(player)
+        if not floors:
+            return 0
+        return len(floors) - bisect_left(floors, threshold)
+
+    def streaks(self, a_threshold: int, aplus_threshold: int) -> Streaks:
+        key = (a_threshold, aplus_threshold)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = {
+                player: {
+                    "a": self.streak(player, a_threshold),
+                    "aplus": self.streak(player, aplus_threshold),
+                }
+                for player in self._floors
+            }
+        return cached
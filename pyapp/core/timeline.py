@@ -0,0 +1,94 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import List, Optional, Sequence, Tuple
+
+from .timestamps import parse_timestamp
+
+Line = Tuple[int, str]
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def local_tzinfo() -> tzinfo:
+    return datetime.now().astimezone().tzinfo or timezone.utc
+
+
+def to_utc(value: datetime, local_tz: Optional[tzinfo] = None) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=local_tz or local_tzinfo())
+    return value.astimezone(timezone.utc)
+
+
+def to_epoch(value: datetime, local_tz: Optional[tzinfo] = None) -> float:
+    return to_utc(value, local_tz).timestamp()
+
+
+class TimelineIndex:
+    def __init__(self, positions: List[int], epochs: List[float], line_count: int) -> None:
+        self.positions = positions
+        self.epochs = epochs
+        self.line_count = line_count
+        self.is_sorted = all(a <= b for a, b in zip(epochs, epochs[1:]))
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[Line], local_tz: Optional[tzinfo] = None) -> "TimelineIndex":
+        local_tz = local_tz or local_tzinfo()
+        offset = local_tz.utcoffset(None)
+        positions: List[int] = []
+        epochs: List[float] = []
+        for position, (_, line) in enumerate(lines):
+            as_date = parse_timestamp(line)
+            if as_date is None:
+                continue
+            if as_date.tzinfo is None and offset is not None:
+                epoch = (as_date - _EPOCH - offset).total_seconds()
+            else:
+                epoch = to_epoch(as_date, local_tz)
+            positions.append(position)
+            epochs.append(epoch)
+        return cls(positions, epochs, len(lines))
+
+    def bounds(self, start: datetime, end: Optional[datetime] = None) -> Optional[Tuple[int, int]]:
+        if self.line_count == 0:
+            return None
+        if end is None:
+            end = start + timedelta(days=7)
+        local_tz = local_tzinfo()
+        start_epoch = to_epoch(start, local_tz)
+        end_epoch = to_epoch(end, local_tz)
+
+        if self.is_sorted:
+            end_slot = bisect_right(self.epochs, end_epoch) - 1
+            if end_slot < 0:
+                return 0, 0
+            before_slot = min(bisect_left(self.epochs, start_epoch), end_slot) - 1
+        else:
+            end_slot = -1
+            for slot in range(len(self.epochs) - 1, -1, -1):
+                if self.epochs[slot] <= end_epoch:
+                    end_slot = slot
+                    break
+            if end_slot < 0:
+                return 0, 0
+            before_slot = -1
+            for slot in range(end_slot - 1, -1, -1):
+                if self.epochs[slot] < start_epoch:
+                    before_slot = slot
+                    break
+
+        end_index = self.positions[end_slot]
+        if end_index == 0:
+            return 0, 0
+        start_index = self.positions[before_slot] + 1 if before_slot >= 0 else 0
+        return start_index, end_index
+
+    def slice(
+        self, lines: Sequence[Line], start: datetime, end: Optional[datetime] = None
+    ) -> List[Line]:
+        bounds = self.bounds(start, end)
+        if bounds is None:
+            return []
+        start_index, end_index = bounds
+        if end_index < start_index:
+            return []
+        return list(lines[start_index : end_index + 1])
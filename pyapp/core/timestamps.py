@@ -0,0 +1,159 @@
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+_MONTH_NAMES = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+]
+MONTHS_FULL: Dict[str, int] = {name: index for index, name in enumerate(_MONTH_NAMES, start=1)}
+MONTHS_ABBR: Dict[str, int] = {name[:3]: index for index, name in enumerate(_MONTH_NAMES, start=1)}
+
+STRPTIME_PATTERNS: List[Tuple[str, str]] = [
+    (r"^(?P<date>\d{1,2} [A-Za-z]{3} \d{4} at \d{2}:\d{2})", "%d %b %Y at %H:%M"),
+    (r"^(?P<date>[A-Za-z]{3} \d{1,2}, \d{4} at \d{1,2}:\d{2} [AP]M)", "%b %d, %Y at %I:%M %p"),
+    (r"^(?P<date>[A-Za-z]+ \d{1,2}, \d{4} \d{1,2}:\d{2} [AP]M)", "%B %d, %Y %I:%M %p"),
+    (r"^(?P<date>[A-Za-z]{3} \d{1,2}, \d{4} \d{1,2}:\d{2} [AP]M)", "%b %d, %Y %I:%M %p"),
+]
+
+
+def parse_with_strptime(line: str) -> Optional[datetime]:
+    for pattern, fmt in STRPTIME_PATTERNS:
+        match = re.match(pattern, line, flags=re.IGNORECASE)
+        if not match:
+            continue
+        date_part = match.group("date").rstrip(":").strip()
+        try:
+            return datetime.strptime(date_part, fmt)
+        except ValueError:
+            continue
+
+    return None
+
+
+_MONTHS_ANY: Dict[str, int] = {**MONTHS_ABBR, **MONTHS_FULL}
+_DAYS: Dict[str, int] = {
+    **{str(value): value for value in range(10)},
+    **{f"{value:02d}": value for value in range(100)},
+}
+_MERIDIEMS: Dict[str, int] = {"am": 0, "pm": 12}
+_MEMO_LIMIT = 4096
+
+
+def _meridiem_minutes() -> Dict[str, timedelta]:
+    minutes: Dict[str, timedelta] = {}
+    for meridiem, offset in _MERIDIEMS.items():
+        for spelling in {meridiem, meridiem.upper(), meridiem.capitalize(), meridiem[0] + "M"}:
+            for minute in range(60):
+                minutes[f"{minute:02d} {spelling}"] = timedelta(hours=offset, minutes=minute)
+    return minutes
+
+
+_CLOCKS_24: Dict[str, timedelta] = {
+    f"{hour:02d}:{minute:02d}": timedelta(hours=hour, minutes=minute)
+    for hour in range(24)
+    for minute in range(60)
+}
+_HOURS_12: Dict[str, timedelta] = {
+    text: timedelta(hours=hour % 12) for hour in range(1, 13) for text in (str(hour), f"{hour:02d}")
+}
+_MERIDIEM_MINUTES = _meridiem_minutes()
+
+
+def _midnight(
+    day_text: str, month_name: str, year_text: str, months: Dict[str, int]
+) -> Optional[datetime]:
+    day = _DAYS.get(day_text)
+    month = months.get(month_name.lower())
+    if day is None or month is None or len(year_text) != 4 or not year_text.isdigit():
+        return None
+    try:
+        return datetime(int(year_text), month, day)
+    except ValueError:
+        return None
+
+
+class TimestampParser:
+    def __init__(self) -> None:
+        self._day_first_dates: Dict[str, datetime] = {}
+        self._month_first_dates: Dict[str, datetime] = {}
+        self._detected = self._parse_day_first
+        self._other = self._parse_month_first
+
+    def parse(self, line: str) -> Optional[datetime]:
+        if not line.isascii():
+            return parse_with_strptime(line)
+        parsed = self._detected(line)
+        if parsed is None:
+            parsed = self._other(line)
+            if parsed is not None:
+                self._detected, self._other = self._other, self._detected
+        return parsed
+
+    def _remember(self, dates: Dict[str, datetime], date_text: str, midnight: datetime) -> None:
+        if len(dates) >= _MEMO_LIMIT:
+            dates.clear()
+        dates[date_text] = midnight
+
+    def _parse_day_first(self, line: str) -> Optional[datetime]:
+        date_text, _, rest = line.partition(" at ")
+        midnight = self._day_first_dates.get(date_text)
+        if midnight is not None:
+            clock = _CLOCKS_24.get(rest[:5])
+            if clock is not None:
+                return midnight + clock
+
+        parts = line.split(" ", 4)
+        if len(parts) != 5 or parts[3].lower() != "at":
+            return None
+        clock = _CLOCKS_24.get(parts[4][:5])
+        midnight = _midnight(parts[0], parts[1], parts[2], MONTHS_ABBR)
+        if clock is None or midnight is None:
+            return None
+        if parts[3] == "at":
+            self._remember(self._day_first_dates, date_text, midnight)
+        return midnight + clock
+
+    def _parse_month_first(self, line: str) -> Optional[datetime]:
+        head, _, tail = line.partition(":")
+        date_text, _, hour_text = head.rpartition(" ")
+        hour = _HOURS_12.get(hour_text)
+        minutes = _MERIDIEM_MINUTES.get(tail[:5])
+        if hour is None or minutes is None:
+            return None
+        midnight = self._month_first_dates.get(date_text)
+        if midnight is not None:
+            return midnight + hour + minutes
+
+        parts = date_text.split(" ")
+        if len(parts) == 4 and parts[3].lower() == "at":
+            months = MONTHS_ABBR
+        elif len(parts) == 3:
+            months = _MONTHS_ANY
+        else:
+            return None
+        day_text = parts[1]
+        if day_text[-1:] != ",":
+            return None
+        midnight = _midnight(day_text[:-1], parts[0], parts[2], months)
+        if midnight is None:
+            return None
+        self._remember(self._month_first_dates, date_text, midnight)
+        return midnight + hour + minutes
+
+
+_default_parser = TimestampParser()
+
+
+def parse_timestamp(line: str) -> Optional[datetime]:
+    return _default_parser.parse(line)
@@ -0,0 +1,71 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+
+@dataclass
+class SpanStats:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    items: int = 0
+
+
+class Span:
+    def __init__(self, name: str, items: int = 0) -> None:
+        self.name = name
+        self.items = items
+
+
+class Timings:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, SpanStats] = {}
+
+    @contextmanager
+    def span(self, name: str, items: int = 0) -> Iterator[Span]:
+        span = Span(name, items)
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            self.add(name, time.perf_counter() - started, span.items)
+
+    def add(self, name: str, seconds: float, items: int = 0) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = SpanStats(name)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.items += items
+
+    def seconds(self, *names: str) -> float:
+        with self._lock:
+            return sum(self._stats[name].seconds for name in names if name in self._stats)
+
+    def stats(self) -> List[SpanStats]:
+        with self._lock:
+            return [
+                SpanStats(stats.name, stats.calls, stats.seconds, stats.items)
+                for stats in self._stats.values()
+            ]
+
+    def summary_lines(self) -> List[str]:
+        lines: List[str] = []
+        for stats in self.stats():
+            line = f"{stats.name}: {stats.seconds * 1000:.1f} ms"
+            if stats.calls != 1:
+                line += f", {stats.calls} calls"
+            if stats.items:
+                line += f", {stats.items} items"
+            lines.append(line)
+        return lines
+
+    def log(self, title: str, level: int = logging.INFO) -> None:
+        lines = self.summary_lines()
+        if lines:
+            logging.log(level, "%s timings: %s", title, "; ".join(lines))
@@ -1,12 +1,17 @@
+import copy
 import json
-from dataclasses import dataclass
+import logging
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from .autocorrect import Autocorrecter
 from .points import PointsStore
 from .sanitise import (
+    Line,
     SanityCheck,
     ValidationErrors,
     build_sanity_check,
@@ -16,8 +21,9 @@ from .sanitise import (
     validate_lines,
     MULTI_NOT_MARKER,
 )
-from .aliases import add_name_alias
+from .aliases import AliasWriter
 from .sheets import get_names_from_sheets
+from .timing import Timings
 
 
 @dataclass
@@ -39,6 +45,7 @@ class CalculationResult:
     boss_counts: Dict[str, Dict[str, int]]
     boss_list: List[str]
     events: List["EventRecord"]
+    timings: Timings = field(default_factory=Timings)
 
 
 @dataclass
@@ -59,6 +66,7 @@ class EventRecord:
 ResolveCallback = Callable[
     [str, List[str], str, str, str, str, str], Optional[Resolution]
 ]
+RosterSource = Union[List[str], "Future[List[str]]"]
 
 
 def build_aliases(names: Iterable[str], base_dir: Path) -> Dict[str, str]:
@@ -83,6 +91,118 @@ def build_aliases(names: Iterable[str], base_dir: Path) -> Dict[str, str]:
     return aliases
 
 
+def collect_unknown_tokens(
+    formatted_lines: Iterable[Tuple[int, List[str]]],
+    aliases: Dict[str, str],
+) -> List[str]:
+    seen: Set[str] = set()
+    unknown: List[str] = []
+    for _, tokens in formatted_lines:
+        for name in tokens[1:]:
+            if name in {MULTI_NOT_MARKER, "not"}:
+                continue
+            if len(name) <= 1:
+                continue
+            if name in aliases:
+                continue
+            if name in seen:
+                continue
+            seen.add(name)
+            unknown.append(name)
+    return unknown
+
+
+def _roster_names(
+    roster: Optional[RosterSource],
+    spreadsheet_id: str,
+    range_name: str,
+    credentials_path: Path,
+    token_path: Path,
+) -> List[str]:
+    if isinstance(roster, Future):
+        try:
+            return list(roster.result())
+        except CancelledError:
+            logging.warning("Roster prefetch was cancelled, fetching again")
+        except Exception as exc:
+            logging.warning("Roster prefetch failed, fetching again: %s", exc)
+    elif roster is not None:
+        return list(roster)
+    return get_names_from_sheets(
+        spreadsheet_id=spreadsheet_id,
+        range_name=range_name,
+        credentials_path=credentials_path,
+        token_path=token_path,
+    )
+
+
+@dataclass
+class PreparedRun:
+    base_dir: Path
+    points_store: PointsStore
+    lines: List[Line]
+    sanity: SanityCheck
+    formatted_lines: List[Tuple[int, List[str]]]
+    errors: ValidationErrors
+    names: List[str]
+    aliases: Dict[str, str]
+    unknown_tokens: List[str]
+    timings: Timings = field(default_factory=Timings)
+
+
+def prepare_run(
+    timers_path: Path,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    use_all_entries: bool,
+    spreadsheet_id: str,
+    range_name: str,
+    credentials_path: Path,
+    token_path: Path,
+    base_dir: Path,
+    roster: Optional[RosterSource] = None,
+) -> PreparedRun:
+    timings = Timings()
+    with timings.span("points"):
+        points_store = PointsStore(base_dir)
+
+    with timings.span("preprocess") as span:
+        lines = preprocess_lines(timers_path, base_dir)
+        span.items = len(lines)
+    if not use_all_entries and start_date and end_date:
+        with timings.span("slice") as span:
+            lines = slice_by_date(lines, start_date, end_date)
+            span.items = len(lines)
+
+    sanity = build_sanity_check(lines)
+    with timings.span("validate", len(lines)):
+        formatted_lines, errors = validate_lines(lines, points_store)
+    names: List[str] = []
+    aliases: Dict[str, str] = {}
+    unknown_tokens: List[str] = []
+    if not errors.any():
+        with timings.span("roster") as span:
+            names = _roster_names(roster, spreadsheet_id, range_name, credentials_path, token_path)
+            span.items = len(names)
+        with timings.span("aliases") as span:
+            aliases = build_aliases(names, base_dir)
+            unknown_tokens = collect_unknown_tokens(formatted_lines, aliases)
+            span.items = len(unknown_tokens)
+
+    return PreparedRun(
+        base_dir=base_dir,
+        points_store=points_store,
+        lines=lines,
+        sanity=sanity,
+        formatted_lines=formatted_lines,
+        errors=errors,
+        names=names,
+        aliases=aliases,
+        unknown_tokens=unknown_tokens,
+        timings=timings,
+    )
+
+
 def calculate_points(
     timers_path: Path,
     start_date: Optional[datetime],
@@ -94,9 +214,54 @@ def calculate_points(
     token_path: Path,
     base_dir: Path,
     resolve_unknown: ResolveCallback,
+    roster: Optional[RosterSource] = None,
+) -> CalculationResult:
+    prepared = prepare_run(
+        timers_path=timers_path,
+        start_date=start_date,
+        end_date=end_date,
+        use_all_entries=use_all_entries,
+        spreadsheet_id=spreadsheet_id,
+        range_name=range_name,
+        credentials_path=credentials_path,
+        token_path=token_path,
+        base_dir=base_dir,
+        roster=roster,
+    )
+    return calculate_prepared(prepared, resolve_unknown)
+
+
+def calculate_prepared(
+    prepared: PreparedRun,
+    resolve_unknown: ResolveCallback,
+    alias_writer: Optional[AliasWriter] = None,
+) -> CalculationResult:
+    if alias_writer is not None:
+        return _score_prepared(prepared, resolve_unknown, alias_writer)
+    alias_writer = AliasWriter(prepared.base_dir)
+    try:
+        result = _score_prepared(prepared, resolve_unknown, alias_writer)
+    except BaseException:
+        try:
+            _flush_aliases(prepared, alias_writer)
+        except Exception:
+            logging.exception("Could not save aliases after an interrupted calculation")
+        raise
+    _flush_aliases(prepared, alias_writer)
+    return result
+
+
+def _flush_aliases(prepared: PreparedRun, alias_writer: AliasWriter) -> None:
+    with prepared.timings.span("persist", alias_writer.pending()):
+        alias_writer.flush()
+
+
+def _score_prepared(
+    prepared: PreparedRun, resolve_unknown: ResolveCallback, alias_writer: AliasWriter
 ) -> CalculationResult:
     strict_prefix = "__strict__"
-    points_store = PointsStore(base_dir)
+    points_store = prepared.points_store
+    timings = prepared.timings
 
     def normalize_boss_key(raw_boss: str) -> str:
         cleaned = raw_boss.strip()
@@ -106,14 +271,10 @@ def calculate_points(
             cleaned = cleaned[1:]
         return cleaned
 
-    lines = preprocess_lines(timers_path, base_dir)
-    if not use_all_entries and start_date and end_date:
-        lines = slice_by_date(lines, start_date, end_date)
-
-    sanity = build_sanity_check(lines)
-
-    line_map = {idx: line for idx, line in lines}
-    formatted_lines, errors = validate_lines(lines, points_store)
+    sanity = prepared.sanity
+    line_map = {idx: line for idx, line in prepared.lines}
+    formatted_lines = prepared.formatted_lines
+    errors = copy.deepcopy(prepared.errors)
     if errors.any():
         return CalculationResult(
             totals=[],
@@ -122,18 +283,15 @@ def calculate_points(
             boss_counts={},
             boss_list=[],
             events=[],
+            timings=timings,
         )
 
-    names = get_names_from_sheets(
-        spreadsheet_id=spreadsheet_id,
-        range_name=range_name,
-        credentials_path=credentials_path,
-        token_path=token_path,
-    )
-
-    aliases = build_aliases(names, base_dir)
+    names = prepared.names
+    aliases = dict(prepared.aliases)
     sheet_lookup = {name.lower(): name for name in names}
-    autocorrecter = Autocorrecter(names)
+    with timings.span("autocorrect", len(prepared.unknown_tokens)):
+        autocorrecter = Autocorrecter(names)
+        autocorrecter.correct_many(prepared.unknown_tokens)
     discard: Set[str] = set()
 
     dkp_count: Dict[str, int] = {}
@@ -141,6 +299,8 @@ def calculate_points(
     boss_set: Set[str] = set()
     events: List[EventRecord] = []
 
+    score_started = time.perf_counter()
+    nested_before = timings.seconds("autocorrect", "prompts")
     for line_index, tokens in formatted_lines:
         if not tokens:
             continue
@@ -195,7 +355,8 @@ def calculate_points(
                 i += 1
                 continue
 
-            suggestions = autocorrecter.correct(name)
+            with timings.span("autocorrect", 1):
+                suggestions = autocorrecter.correct(name)
 
             prev_token_raw = name_tokens[i - 1] if i - 1 >= 0 else ""
             next_token_raw = name_tokens[i + 1] if i + 1 < len(name_tokens) else ""
@@ -234,15 +395,16 @@ def calculate_points(
 
             prev_line_raw = line_map.get(line_index - 1, "")
             next_line_raw = line_map.get(line_index + 1, "")
-            resolution = resolve_unknown(
-                name,
-                suggestions,
-                line_text,
-                prev_token,
-                next_token,
-                prev_line_raw,
-                next_line_raw,
-            )
+            with timings.span("prompts", 1):
+                resolution = resolve_unknown(
+                    name,
+                    suggestions,
+                    line_text,
+                    prev_token,
+                    next_token,
+                    prev_line_raw,
+                    next_line_raw,
+                )
             if resolution is None:
                 discard.add(name)
                 i += 1
@@ -292,7 +454,7 @@ def calculate_points(
                 else:
                     last_appended_token = name
                 if resolution.persist_alias:
-                    add_name_alias(base_dir, name, new_name)
+                    alias_writer.add_name_alias(name, new_name)
                 if resolution.merge_with_next and next_token:
                     i += 2
                 else:
@@ -311,7 +473,7 @@ def calculate_points(
                 if resolution.cache_original:
                     aliases[name] = resolved
                     if resolution.persist_alias and len(resolution.names) == 1:
-                        add_name_alias(base_dir, name, resolved)
+                        alias_writer.add_name_alias(name, resolved)
 
                 resolved_names.append(resolved)
                 actual_names.append(resolved)
@@ -394,6 +556,9 @@ def calculate_points(
                 )
             )
 
+    nested = timings.seconds("autocorrect", "prompts") - nested_before
+    timings.add("score", time.perf_counter() - score_started - nested, len(formatted_lines))
+
     totals = [(name, points) for name, points in dkp_count.items() if points > 0]
     totals.sort(key=lambda item: item[0].lower())
 
@@ -405,6 +570,7 @@ def calculate_points(
         boss_counts=boss_counts,
         boss_list=boss_list,
         events=events,
+        timings=timings,
     )
 
 
@@ -418,40 +584,25 @@ def estimate_unknown_count(
     credentials_path: Path,
     token_path: Path,
     base_dir: Path,
+    roster: Optional[RosterSource] = None,
 ) -> Tuple[int, List[str]]:
-    points_store = PointsStore(base_dir)
-
-    lines = preprocess_lines(timers_path, base_dir)
-    if not use_all_entries and start_date and end_date:
-        lines = slice_by_date(lines, start_date, end_date)
-
-    formatted_lines, errors = validate_lines(lines, points_store)
-    if errors.any():
-        return 0, []
-
-    names = get_names_from_sheets(
+    prepared = prepare_run(
+        timers_path=timers_path,
+        start_date=start_date,
+        end_date=end_date,
+        use_all_entries=use_all_entries,
         spreadsheet_id=spreadsheet_id,
         range_name=range_name,
         credentials_path=credentials_path,
         token_path=token_path,
+        base_dir=base_dir,
+        roster=roster,
     )
+    prepared.timings.log("Estimate unknowns")
+    return estimate_prepared(prepared)
 
-    aliases = build_aliases(names, base_dir)
-    seen: Set[str] = set()
-    discard: Set[str] = set()
-    count = 0
-
-    for _, tokens in formatted_lines:
-        for name in tokens[1:]:
-            if name in {MULTI_NOT_MARKER, "not"}:
-                continue
-            if name in discard or len(name) <= 1:
-                continue
-            if name in aliases:
-                continue
-            if name in seen:
-                continue
-            seen.add(name)
-            count += 1
 
-    return count, names
+def estimate_prepared(prepared: PreparedRun) -> Tuple[int, List[str]]:
+    if prepared.errors.any():
+        return 0, []
+    return len(prepared.unknown_tokens), prepared.names
@@ -0,0 +1,174 @@
+from array import array
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+SIZE_SAMPLE_ROWS = 200
+
+
+class CountTableModel(QAbstractTableModel):
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._labels: List[str] = []
+        self._order: List[int] = []
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._labels)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        if 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._value(self._order[index.row()], index.column())
+
+    def _value(self, row: int, column: int) -> Any:
+        return self._labels[row] if column == 0 else self.count(row, column)
+
+    def count(self, row: int, column: int) -> int:
+        raise NotImplementedError
+
+    def text(self, row: int, column: int) -> str:
+        return str(self._value(self._order[row], column))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        rows = [self._order[index.row()] for index in persistent]
+        self._order = self._sorted_rows()
+        position = {row: view_row for view_row, row in enumerate(self._order)}
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(position[row], index.column()) for row, index in zip(rows, persistent)],
+        )
+        self.layoutChanged.emit()
+
+    def _sorted_rows(self) -> List[int]:
+        rows = list(range(len(self._labels)))
+        if not 0 <= self._sort_column < len(self._headers):
+            return rows
+        column = self._sort_column
+        return sorted(
+            rows,
+            key=lambda row: self._value(row, column),
+            reverse=self._sort_order == Qt.DescendingOrder,
+        )
+
+    def _reset(self, headers: List[str], labels: List[str]) -> None:
+        self.beginResetModel()
+        self._headers = headers
+        self._labels = labels
+        self._order = self._sorted_rows()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self._reset([], [])
+
+    def _values_changed(self, first_column: int, last_column: int) -> None:
+        if self._sort_column >= first_column:
+            self.sort(self._sort_column, self._sort_order)
+        elif self._labels and first_column <= last_column:
+            self.dataChanged.emit(
+                self.index(0, first_column),
+                self.index(len(self._labels) - 1, last_column),
+                [Qt.DisplayRole],
+            )
+
+
+class BossBreakdownModel(CountTableModel):
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._width = 0
+        self._counts = array("q")
+
+    def set_breakdown(
+        self,
+        players: List[str],
+        boss_list: List[str],
+        boss_counts: Dict[str, Dict[str, int]],
+    ) -> None:
+        counts = array("q")
+        for player in players:
+            player_counts = boss_counts.get(player, {})
+            counts.extend(int(player_counts.get(boss, 0)) for boss in boss_list)
+        self._width = len(boss_list)
+        self._counts = counts
+        self._reset(["Player"] + list(boss_list), list(players))
+
+    def count(self, row: int, column: int) -> int:
+        return self._counts[row * self._width + column - 1]
+
+
+class WeeklyChartModel(CountTableModel):
+    FIXED_COLUMNS = ["Player", "Weekly DKP", "A Streak", "A+ Streak"]
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._boss_list: List[str] = []
+        self._week: Dict[str, Dict[str, Any]] = {}
+        self._streaks: Dict[str, Dict[str, int]] = {}
+
+    def set_players(self, players: List[str], boss_list: List[str]) -> None:
+        self._boss_list = list(boss_list)
+        self._reset(self.FIXED_COLUMNS + self._boss_list, list(players))
+
+    def set_week(
+        self,
+        week_players: Dict[str, Dict[str, Any]],
+        streaks: Optional[Dict[str, Dict[str, int]]] = None,
+    ) -> None:
+        self._week = week_players
+        if streaks is not None:
+            self._streaks = streaks
+        self._values_changed(1, len(self._headers) - 1)
+
+    def count(self, row: int, column: int) -> int:
+        player = self._labels[row]
+        if column == 1:
+            return int(self._week.get(player, {}).get("dkp", 0))
+        if column in (2, 3):
+            key = "a" if column == 2 else "aplus"
+            return int(self._streaks.get(player, {}).get(key, 0))
+        counts = self._week.get(player, {}).get("boss_counts", {})
+        return int(counts.get(self._boss_list[column - 4], 0))
+
+
+def make_count_table(model: CountTableModel) -> QTableView:
+    table = QTableView()
+    table.setModel(model)
+    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table.setSelectionMode(QAbstractItemView.NoSelection)
+    table.verticalHeader().setVisible(False)
+    table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    table.horizontalHeader().setStretchLastSection(True)
+    table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+    table.setSortingEnabled(True)
+    return table
+
+
+def fit_columns(table: QTableView, padding: int = 24) -> None:
+    model = table.model()
+    rows = model.rowCount()
+    sample = range(0, rows, max(1, rows // SIZE_SAMPLE_ROWS))
+    header = table.horizontalHeader()
+    header_metrics = header.fontMetrics()
+    metrics = table.fontMetrics()
+    for column in range(model.columnCount()):
+        title = str(model.headerData(column, Qt.Horizontal) or "")
+        widest = max((model.text(row, column) for row in sample), key=len, default="")
+        width = max(header_metrics.horizontalAdvance(title), metrics.horizontalAdvance(widest))
+        header.resizeSection(column, width + padding)
@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -6,7 +8,7 @@ from uuid import uuid4
 import logging
 import json
 
-from PySide6.QtCore import QDate, QEventLoop, QTime, QTimer, Qt
+from PySide6.QtCore import QDate, QThread, QTime, QTimer, Qt
 from PySide6.QtGui import QColor, QPixmap, QCursor
 from PySide6.QtWidgets import (
     QApplication,
@@ -47,22 +49,28 @@ from PySide6.QtWidgets import (
 from ..core.config import AppConfig, load_config, save_config, token_path
 from ..core.points import MODIFIERS, PointsStore
 from ..core.sanitise import (
-    build_sanity_check,
+    Sanitizer,
+    get_date,
     preprocess_lines,
-    sanitize_line,
     slice_by_date,
-    validate_lines,
     MULTI_NOT_MARKER,
 )
+from ..core.revalidation import IncrementalValidator
+from ..core.timeline import TimelineIndex, local_tzinfo, to_utc
 from ..core.aliases import add_boss_alias, add_points_value
-from ..core.workflow import (
-    CalculationResult,
-    Resolution,
-    calculate_points,
-    estimate_unknown_count,
+from ..core.workflow import CalculationResult, Resolution
+from ..core.sheets import get_names_from_sheets, prefetch_names
+from ..core.streaks import StreakEngine
+from ..core.timing import Timings
+from .workers import AutocorrectJob, AutocorrectWorker, ResolutionRequest
+from .models import BossBreakdownModel, WeeklyChartModel, fit_columns, make_count_table
+from ..core.rollups import load_weekly_rollups
+from ..core.runs import (
+    apply_run_store_backend,
+    build_run_meta,
+    normalize_event,
+    save_run,
 )
-from ..core.sheets import get_names_from_sheets
-from ..core.runs import build_run_meta, iter_active_events, iso_to_dt, normalize_event, save_run
 
 
 @dataclass
@@ -79,6 +87,7 @@ class WizardContext:
     sanity_text: str = ""
     errors_text: str = ""
     calculation: Optional[CalculationResult] = None
+    roster_future: Optional["Future[List[str]]"] = None
 
 
 @dataclass
@@ -354,14 +363,8 @@ class SetupPage(QWizardPage):
         self.chart_status = QLabel("No saved runs yet.")
         self.chart_status.setObjectName("ProgressLabel")
         chart_layout.addWidget(self.chart_status)
-        self.chart_table = QTableWidget()
-        self.chart_table.setColumnCount(0)
-        self.chart_table.setRowCount(0)
-        self.chart_table.setSortingEnabled(False)
-        self.chart_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.chart_table.setSelectionMode(QAbstractItemView.NoSelection)
-        self.chart_table.verticalHeader().setVisible(False)
-        self.chart_table.horizontalHeader().setStretchLastSection(True)
+        self.chart_model = WeeklyChartModel(self)
+        self.chart_table = make_count_table(self.chart_model)
         chart_layout.addWidget(self.chart_table)
 
         export_row = QHBoxLayout()
@@ -387,6 +390,9 @@ class SetupPage(QWizardPage):
         if wizard:
             wizard.setButtonText(QWizard.NextButton, "Start DKP Wizard")
         self.tabs.setCurrentIndex(0)
+        QTimer.singleShot(0, self._load_page_data)
+
+    def _load_page_data(self) -> None:
         self._load_weekly_chart()
         self._load_points_json()
 
@@ -441,6 +447,7 @@ class SetupPage(QWizardPage):
                 range_name=range_name,
                 credentials_path=credentials_path,
                 token_path=token_file,
+                force_refresh=True,
             )
 
             self._set_test_status(
@@ -768,77 +775,38 @@ class SetupPage(QWizardPage):
         self.context.config.activity_a_threshold = a_value
         self.context.config.activity_aplus_threshold = aplus_value
         save_config(self.context.config)
-        self._load_weekly_chart()
-
-    @staticmethod
-    def _week_start_utc(dt: datetime) -> datetime:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        dt = dt.astimezone(timezone.utc)
-        days_since_sunday = (dt.weekday() + 1) % 7
-        week_start = dt - timedelta(days=days_since_sunday)
-        return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._render_selected_week()
 
     def _load_weekly_chart(self) -> None:
-        events = iter_active_events(self.context.base_dir)
-        if not events:
+        timings = Timings()
+        with timings.span("total"):
+            self._populate_weekly_chart(timings)
+        timings.log("Weekly chart")
+
+    def _populate_weekly_chart(self, timings: Timings) -> None:
+        with timings.span("rollups") as span:
+            weekly, boss_list = load_weekly_rollups(self.context.base_dir)
+            span.items = len(weekly)
+        if not weekly:
             self.chart_status.setText("No saved runs yet.")
-            self.chart_table.setRowCount(0)
-            self.chart_table.setColumnCount(0)
+            self.chart_model.clear()
             self.chart_table.setVisible(False)
             self.week_selector.blockSignals(True)
             self.week_selector.clear()
             self.week_selector.blockSignals(False)
             return
 
-        def normalize_boss_key(raw_boss: str) -> str:
-            cleaned = raw_boss.strip()
-            if "(" in cleaned and cleaned.endswith(")"):
-                cleaned = cleaned.split("(", 1)[0]
-            if cleaned.startswith("/"):
-                cleaned = cleaned[1:]
-            return cleaned
-
-        weekly: Dict[datetime, Dict[str, Dict[str, Dict[str, int]]]] = {}
-        boss_set: Set[str] = set()
-
-        for event in events:
-            event_time_raw = event.get("event_time_utc")
-            if not event_time_raw:
-                continue
-            event_time = iso_to_dt(event_time_raw)
-            week_start = self._week_start_utc(event_time)
-            bucket = weekly.setdefault(week_start, {})
-            boss = event.get("boss", "")
-            boss_key = normalize_boss_key(boss) if boss else ""
-            has_positive = False
-            for entry in event.get("entries", []):
-                name = entry.get("name", "")
-                delta = int(entry.get("delta", 0))
-                if not name:
-                    continue
-                player = bucket.setdefault(name, {"dkp": 0, "boss_counts": {}})
-                player["dkp"] += delta
-                if boss_key:
-                    boss_counts = player["boss_counts"]
-                    current = boss_counts.get(boss_key, 0)
-                    if delta > 0:
-                        boss_counts[boss_key] = current + 1
-                        has_positive = True
-                    elif delta < 0 and current > 0:
-                        new_value = current - 1
-                        if new_value > 0:
-                            boss_counts[boss_key] = new_value
-                        else:
-                            boss_counts.pop(boss_key, None)
-            if boss_key and has_positive:
-                boss_set.add(boss_key)
-
-        boss_list = sorted(boss_set, key=str.lower)
         weeks = sorted(weekly.keys())
+        all_players: Set[str] = set()
+        for week_players in weekly.values():
+            all_players.update(week_players.keys())
         self._weekly_data = weekly
         self._boss_list = boss_list
         self._weeks = weeks
+        self._players = sorted(all_players, key=str.lower)
+        with timings.span("streaks", len(self._players)):
+            self._streak_engine = StreakEngine(weekly)
+        self.chart_model.set_players(self._players, boss_list)
 
         current_value = self.week_selector.currentData()
         self.week_selector.blockSignals(True)
@@ -854,55 +822,20 @@ class SetupPage(QWizardPage):
         else:
             self.week_selector.setCurrentIndex(len(weeks) - 1)
 
-        self._render_selected_week()
+        with timings.span("render", len(self._players)):
+            self._render_selected_week()
 
     def _compute_streaks(self) -> Dict[str, Dict[str, int]]:
-        weekly = getattr(self, "_weekly_data", {})
-        weeks = getattr(self, "_weeks", [])
-        if not weekly or not weeks:
+        engine = getattr(self, "_streak_engine", None)
+        if engine is None:
             return {}
-
-        min_week = min(weeks)
-        max_week = max(weeks)
-        full_weeks: List[datetime] = []
-        current = min_week
-        while current <= max_week:
-            full_weeks.append(current)
-            current = current + timedelta(days=7)
-
-        a_threshold = self.activity_a_input.value()
-        aplus_threshold = self.activity_aplus_input.value()
-        players: Set[str] = set()
-        for week_players in weekly.values():
-            players.update(week_players.keys())
-
-        streaks: Dict[str, Dict[str, int]] = {}
-        for player in players:
-            a_streak = 0
-            aplus_streak = 0
-            for week_start in reversed(full_weeks):
-                dkp = weekly.get(week_start, {}).get(player, {}).get("dkp", 0)
-                if dkp >= a_threshold:
-                    a_streak += 1
-                else:
-                    break
-            for week_start in reversed(full_weeks):
-                dkp = weekly.get(week_start, {}).get(player, {}).get("dkp", 0)
-                if dkp >= aplus_threshold:
-                    aplus_streak += 1
-                else:
-                    break
-            streaks[player] = {"a": a_streak, "aplus": aplus_streak}
-        return streaks
+        return engine.streaks(self.activity_a_input.value(), self.activity_aplus_input.value())
 
     def _render_selected_week(self) -> None:
         weekly = getattr(self, "_weekly_data", {})
-        boss_list = getattr(self, "_boss_list", [])
         weeks = getattr(self, "_weeks", [])
         if not weekly or not weeks or self.week_selector.currentIndex() < 0:
             self.chart_status.setText("No saved runs yet.")
-            self.chart_table.setRowCount(0)
-            self.chart_table.setColumnCount(0)
             self.chart_table.setVisible(False)
             return
 
@@ -910,63 +843,19 @@ class SetupPage(QWizardPage):
         if not selected_iso:
             return
         selected_week = datetime.fromisoformat(selected_iso)
-        all_players: Set[str] = set()
-        for week_players in weekly.values():
-            all_players.update(week_players.keys())
-        if not all_players:
+        players = getattr(self, "_players", [])
+        if not players:
             self.chart_status.setText("No data for this week.")
-            self.chart_table.setRowCount(0)
-            self.chart_table.setColumnCount(0)
             self.chart_table.setVisible(False)
             return
 
-        streaks = self._compute_streaks()
-        columns = ["Player", "Weekly DKP", "A Streak", "A+ Streak"] + boss_list
-        rows = []
-        selected_players = weekly.get(selected_week, {})
-        for player_name in sorted(all_players, key=str.lower):
-            player_data = selected_players.get(player_name, {"dkp": 0, "boss_counts": {}})
-            rows.append(
-                {
-                    "player": player_name,
-                    "dkp": player_data["dkp"],
-                    "boss_counts": player_data["boss_counts"],
-                    "a_streak": streaks.get(player_name, {}).get("a", 0),
-                    "aplus_streak": streaks.get(player_name, {}).get("aplus", 0),
-                }
-            )
-
         week_end = selected_week + timedelta(days=6)
         self.chart_status.setText(
-            f"Week: {selected_week.date()} to {week_end.date()} (UTC) | {len(rows)} players"
+            f"Week: {selected_week.date()} to {week_end.date()} (UTC) | {len(players)} players"
         )
+        self.chart_model.set_week(weekly.get(selected_week, {}), self._compute_streaks())
         self.chart_table.setVisible(True)
-        self.chart_table.setSortingEnabled(False)
-        self.chart_table.setRowCount(len(rows))
-        self.chart_table.setColumnCount(len(columns))
-        self.chart_table.setHorizontalHeaderLabels(columns)
-
-        for row_idx, row in enumerate(rows):
-            self.chart_table.setItem(row_idx, 0, QTableWidgetItem(str(row["player"])))
-            dkp_item = QTableWidgetItem()
-            dkp_item.setData(Qt.DisplayRole, int(row["dkp"]))
-            self.chart_table.setItem(row_idx, 1, dkp_item)
-            a_item = QTableWidgetItem()
-            a_item.setData(Qt.DisplayRole, int(row["a_streak"]))
-            self.chart_table.setItem(row_idx, 2, a_item)
-            aplus_item = QTableWidgetItem()
-            aplus_item.setData(Qt.DisplayRole, int(row["aplus_streak"]))
-            self.chart_table.setItem(row_idx, 3, aplus_item)
-            counts = row["boss_counts"]
-            for col_idx, boss in enumerate(boss_list, start=4):
-                value = int(counts.get(boss, 0))
-                item = QTableWidgetItem()
-                item.setData(Qt.DisplayRole, value)
-                self.chart_table.setItem(row_idx, col_idx, item)
-
-        self.chart_table.resizeColumnsToContents()
-        self.chart_table.resizeRowsToContents()
-        self.chart_table.setSortingEnabled(True)
+        fit_columns(self.chart_table)
 
     def _selected_week_rows(self, include_streaks: bool) -> (List[str], List[List[str]]):
         weekly = getattr(self, "_weekly_data", {})
@@ -977,11 +866,8 @@ class SetupPage(QWizardPage):
         if not selected_iso:
             return [], []
         selected_week = datetime.fromisoformat(selected_iso)
-
-        all_players: Set[str] = set()
-        for week_players in weekly.values():
-            all_players.update(week_players.keys())
-        if not all_players:
+        players = getattr(self, "_players", [])
+        if not players:
             return [], []
 
         headers = ["Player", "Weekly DKP"]
@@ -992,7 +878,7 @@ class SetupPage(QWizardPage):
 
         rows: List[List[str]] = []
         selected_players = weekly.get(selected_week, {})
-        for player_name in sorted(all_players, key=str.lower):
+        for player_name in players:
             player_data = selected_players.get(player_name, {"dkp": 0})
             row = [player_name, str(int(player_data.get("dkp", 0)))]
             if include_streaks:
@@ -1103,6 +989,15 @@ class SetupPage(QWizardPage):
         cfg.use_native_dialog = True
         save_config(cfg)
 
+        previous = self.context.roster_future
+        if previous is not None:
+            previous.cancel()
+        self.context.roster_future = prefetch_names(
+            spreadsheet_id=spreadsheet_id,
+            range_name=range_name,
+            credentials_path=credentials_path,
+            token_path=token_path(),
+        )
         return True
 
     def _open_file_dialog(self, title: str, start_dir: str, filter_text: str) -> str:
@@ -1279,12 +1174,25 @@ class SanityCheckPage(QWizardPage):
         self._initial_total = 0
         self._source_key = None
         self._bosses: List[str] = []
+        self._sanitizer: Optional[Sanitizer] = None
+        self._source_cache_key = None
+        self._source_lines: List[tuple] = []
+        self._source_raw_line_map: Dict[int, str] = {}
+        self._source_timeline: Optional[TimelineIndex] = None
+        self._points_store: Optional[PointsStore] = None
+        self._validator: Optional[IncrementalValidator] = None
+        self._window_last_dated: Optional[int] = None
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(1500)
+        self._persist_timer.timeout.connect(self._persist_overrides)
         self._backup_created = False
         self._update_boss_inputs()
         self._update_single_inputs()
         self._update_retype_inputs()
 
     def reset_state(self) -> None:
+        self.flush_pending_writes()
         self._line_map = {}
         self._raw_line_map = {}
         self._overrides = {}
@@ -1293,6 +1201,13 @@ class SanityCheckPage(QWizardPage):
         self._initial_total = 0
         self._source_key = None
         self._bosses = []
+        self._source_cache_key = None
+        self._source_lines = []
+        self._source_raw_line_map = {}
+        self._source_timeline = None
+        self._points_store = None
+        self._validator = None
+        self._window_last_dated = None
         self._backup_created = False
         self.complete = False
         self.summary.setText("Parsing timers...")
@@ -1355,17 +1270,108 @@ class SanityCheckPage(QWizardPage):
         return "\n".join(parts)
 
     def _revalidate(self) -> None:
-        points_store = PointsStore(self.context.base_dir)
+        self._points_store = PointsStore(self.context.base_dir)
         self._bosses = sorted(
-            k for k, v in points_store.points_map.items() if isinstance(v, int)
+            k for k, v in self._points_store.points_map.items() if isinstance(v, int)
         )
 
+        self._sanitizer = Sanitizer.from_base_dir(self.context.base_dir)
         lines, line_map = self._build_lines()
         self._line_map = line_map
-        sanity = build_sanity_check(lines)
-        _, errors = validate_lines(lines, points_store)
+        self._validator = IncrementalValidator(lines, self._points_store)
+        self._window_last_dated = None
+        if self._slicing_active():
+            for idx, line in reversed(lines):
+                if get_date(line) is not None:
+                    self._window_last_dated = idx
+                    break
+
+        self._error_items = self._build_error_queue(self._validator.errors())
+        self._refresh_validation_state()
+
+    def _revalidate_lines(
+        self,
+        line_indices: List[int],
+        reload_points: bool = False,
+        reload_aliases: bool = False,
+    ) -> None:
+        if reload_aliases:
+            self._sanitizer = Sanitizer.from_base_dir(self.context.base_dir)
+        if reload_points:
+            self._points_store.reload()
+            self._bosses = sorted(
+                k for k, v in self._points_store.points_map.items() if isinstance(v, int)
+            )
+
+        affected = set(line_indices)
+        reloaded = reload_points or reload_aliases
+        if reloaded:
+            affected.update(self._validator.lines)
 
-        summary_text = f"Total lines: {sanity.total_lines}"
+        updates: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        for idx in affected:
+            if idx in self._overrides:
+                raw = self._overrides[idx]
+            else:
+                raw = self._raw_line_map.get(idx)
+                if raw is None:
+                    continue
+            line = None if raw is None else self._sanitizer.sanitize(raw)
+            updates[idx] = (raw, line)
+
+        if self._requires_reslice({idx: line for idx, (_, line) in updates.items()}):
+            self._revalidate()
+            return
+
+        for idx in sorted(updates):
+            raw, line = updates[idx]
+            if line is None:
+                self._line_map.pop(idx, None)
+                self._raw_line_map.pop(idx, None)
+            else:
+                self._line_map[idx] = line
+                self._raw_line_map[idx] = raw
+            _, line_errors = self._validator.update_line(idx, line)
+            if not reloaded:
+                self._replace_error_items(idx, line_errors)
+
+        if reloaded:
+            self._error_items = self._build_error_queue(self._validator.errors())
+        self._refresh_validation_state()
+
+    def _slicing_active(self) -> bool:
+        return bool(
+            not self.context.use_all_entries
+            and self.context.start_datetime
+            and self.context.end_datetime
+        )
+
+    def _requires_reslice(self, updates: Dict[int, Optional[str]]) -> bool:
+        if not self._slicing_active():
+            return False
+        local_tz = local_tzinfo()
+        start_utc = to_utc(self.context.start_datetime, local_tz)
+        end_utc = to_utc(self.context.end_datetime, local_tz)
+        for idx, line in updates.items():
+            old_date = get_date(self._line_map.get(idx, ""))
+            new_date = get_date(line) if line is not None else None
+            if old_date == new_date:
+                continue
+            if idx == self._window_last_dated:
+                return True
+            if new_date is not None and not start_utc <= to_utc(new_date, local_tz) <= end_utc:
+                return True
+        return False
+
+    def _replace_error_items(self, line_index: int, line_errors) -> None:
+        lo = bisect_left(self._error_items, line_index, key=lambda item: item.line_index)
+        hi = bisect_right(self._error_items, line_index, key=lambda item: item.line_index)
+        new_items = self._build_error_queue(line_errors) if line_errors else []
+        self._error_items[lo:hi] = new_items
+
+    def _refresh_validation_state(self) -> None:
+        errors = self._validator.errors()
+        summary_text = f"Total lines: {self._validator.total_lines}"
         self.summary.setText(summary_text)
 
         errors_text = self._format_errors(errors)
@@ -1373,7 +1379,6 @@ class SanityCheckPage(QWizardPage):
         self.context.sanity_text = summary_text
         self.context.errors_text = errors_text
 
-        self._error_items = self._build_error_queue(errors)
         remaining = len(self._error_items)
 
         if self._initial_total == 0:
@@ -1425,41 +1430,72 @@ class SanityCheckPage(QWizardPage):
         items.sort(key=lambda item: item.line_index)
         return items
 
+    def _load_source_lines(self) -> (List[tuple], Dict[int, str]):
+        path = self.context.timers_path
+        try:
+            stat = path.stat()
+            cache_key = (
+                str(path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                tuple(sorted(self._sanitizer.alias_map.items())),
+            )
+        except OSError:
+            cache_key = None
+
+        if cache_key is None or cache_key != self._source_cache_key:
+            lines = preprocess_lines(path, self.context.base_dir, self._sanitizer)
+            raw_line_map: Dict[int, str] = {}
+            if path.exists():
+                try:
+                    with path.open("r", encoding="utf-8", errors="ignore") as f:
+                        raw_lines = f.read().splitlines()
+                    raw_line_map = {
+                        idx: raw for idx, raw in enumerate(raw_lines, start=1)
+                    }
+                except Exception:
+                    raw_line_map = {}
+            self._source_cache_key = cache_key
+            self._source_lines = lines
+            self._source_raw_line_map = raw_line_map
+            self._source_timeline = None
+
+        return self._source_lines, dict(self._source_raw_line_map)
+
     def _build_lines(self) -> (List[tuple], Dict[int, str]):
-        lines = preprocess_lines(self.context.timers_path, self.context.base_dir)
+        lines, raw_line_map = self._load_source_lines()
         line_map = {idx: line for idx, line in lines}
-        raw_line_map: Dict[int, str] = {}
-        if self.context.timers_path.exists():
-            try:
-                with self.context.timers_path.open(
-                    "r", encoding="utf-8", errors="ignore"
-                ) as f:
-                    raw_lines = f.read().splitlines()
-                raw_line_map = {
-                    idx: raw for idx, raw in enumerate(raw_lines, start=1)
-                }
-            except Exception:
-                raw_line_map = {}
 
         for idx, override in self._overrides.items():
             if override is None:
                 line_map.pop(idx, None)
                 raw_line_map.pop(idx, None)
             else:
-                line_map[idx] = sanitize_line(
-                    override, base_dir=self.context.base_dir
-                )
+                line_map[idx] = self._sanitizer.sanitize(override)
                 raw_line_map[idx] = override
 
         self._raw_line_map = raw_line_map
 
-        ordered = [(idx, line_map[idx]) for idx in sorted(line_map.keys())]
+        timeline = None
+        if self._overrides:
+            ordered = [(idx, line_map[idx]) for idx in sorted(line_map.keys())]
+        else:
+            ordered = list(lines)
         if (
             not self.context.use_all_entries
             and self.context.start_datetime
             and self.context.end_datetime
         ):
-            ordered = slice_by_date(ordered, self.context.start_datetime, self.context.end_datetime)
+            if not self._overrides:
+                if self._source_timeline is None:
+                    self._source_timeline = TimelineIndex.from_lines(lines)
+                timeline = self._source_timeline
+            ordered = slice_by_date(
+                ordered,
+                self.context.start_datetime,
+                self.context.end_datetime,
+                timeline,
+            )
             line_map = {idx: line for idx, line in ordered}
 
         return ordered, line_map
@@ -1735,13 +1771,13 @@ class SanityCheckPage(QWizardPage):
                     return
             if entry_only:
                 prefix, _ = self._split_prefix_entry(line_text)
-                sanitized_entry = sanitize_line(new_raw, base_dir=self.context.base_dir)
+                sanitized_entry = self._sanitizer.sanitize(new_raw)
                 if not sanitized_entry:
                     QMessageBox.critical(self, "Invalid line", "The line could not be parsed.")
                     return
                 sanitized = f"{prefix}{sanitized_entry}"
             else:
-                sanitized = sanitize_line(new_raw, base_dir=self.context.base_dir)
+                sanitized = self._sanitizer.sanitize(new_raw)
                 if not sanitized:
                     QMessageBox.critical(self, "Invalid line", "The line could not be parsed.")
                     return
@@ -1749,8 +1785,7 @@ class SanityCheckPage(QWizardPage):
                 if MULTI_NOT_MARKER not in sanitized.split():
                     sanitized = f"{sanitized} {MULTI_NOT_MARKER}"
             self._overrides[item.line_index] = sanitized
-            self._persist_overrides()
-            self._revalidate()
+            self._commit_fix(item.line_index)
             return
 
         if item.kind == "boss_or_not":
@@ -1772,13 +1807,13 @@ class SanityCheckPage(QWizardPage):
                         return
                 if entry_only:
                     prefix, _ = self._split_prefix_entry(line_text)
-                    sanitized_entry = sanitize_line(new_raw, base_dir=self.context.base_dir)
+                    sanitized_entry = self._sanitizer.sanitize(new_raw)
                     if not sanitized_entry:
                         QMessageBox.critical(self, "Invalid line", "The line could not be parsed.")
                         return
                     sanitized = f"{prefix}{sanitized_entry}"
                 else:
-                    sanitized = sanitize_line(new_raw, base_dir=self.context.base_dir)
+                    sanitized = self._sanitizer.sanitize(new_raw)
                     if not sanitized:
                         QMessageBox.critical(self, "Invalid line", "The line could not be parsed.")
                         return
@@ -1786,20 +1821,21 @@ class SanityCheckPage(QWizardPage):
                     if MULTI_NOT_MARKER not in sanitized.split():
                         sanitized = f"{sanitized} {MULTI_NOT_MARKER}"
                 self._overrides[item.line_index] = sanitized
-                self._persist_overrides()
-                self._revalidate()
+                self._commit_fix(item.line_index)
                 return
             # Treat as boss error and apply immediately
             item = ErrorItem("boss", item.line_index, item.boss)
 
         if item.kind == "boss":
             unknown = item.boss or self._extract_boss_token(line_text)
+            reload_points = False
+            reload_aliases = False
             if self.boss_manual_radio.isChecked():
                 new_raw = self.boss_manual_input.toPlainText().strip()
                 if not new_raw:
                     QMessageBox.critical(self, "Missing input", "Please edit the line.")
                     return
-                sanitized = sanitize_line(new_raw, base_dir=self.context.base_dir)
+                sanitized = self._sanitizer.sanitize(new_raw)
                 if not sanitized:
                     QMessageBox.critical(self, "Invalid line", "The line could not be parsed.")
                     return
@@ -1811,6 +1847,7 @@ class SanityCheckPage(QWizardPage):
                     return
                 points = self.boss_points.value()
                 add_points_value(self.context.base_dir, new_token, points)
+                reload_points = True
                 self._overrides[item.line_index] = self._replace_boss_in_entry(
                     line_text, new_token
                 )
@@ -1828,12 +1865,16 @@ class SanityCheckPage(QWizardPage):
                     QMessageBox.critical(self, "Missing boss", "Select a boss.")
                     return
                 add_boss_alias(self.context.base_dir, unknown, selection)
+                reload_aliases = True
                 self._overrides[item.line_index] = self._replace_boss_in_entry(
                     line_text, selection
                 )
 
-            self._persist_overrides()
-            self._revalidate()
+            self._commit_fix(
+                item.line_index,
+                reload_points=reload_points,
+                reload_aliases=reload_aliases,
+            )
             return
 
         if item.kind == "single_char":
@@ -1870,16 +1911,39 @@ class SanityCheckPage(QWizardPage):
                         new_tokens.append(t)
                 self._overrides[item.line_index] = f"{prefix}{' '.join(new_tokens)}"
 
-            self._persist_overrides()
-            self._revalidate()
+            self._commit_fix(item.line_index)
             return
 
     def _skip_line(self) -> None:
         if not self._current_error:
             return
-        self._overrides[self._current_error.line_index] = None
+        line_index = self._current_error.line_index
+        self._overrides[line_index] = None
+        self._commit_fix(line_index)
+
+    def _commit_fix(
+        self,
+        line_index: int,
+        reload_points: bool = False,
+        reload_aliases: bool = False,
+    ) -> None:
+        self._persist_timer.start()
+        self._revalidate_lines(
+            [line_index], reload_points=reload_points, reload_aliases=reload_aliases
+        )
+
+    def flush_pending_writes(self) -> None:
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
         self._persist_overrides()
-        self._revalidate()
+
+    def validatePage(self) -> bool:
+        self.flush_pending_writes()
+        return True
+
+    def cleanupPage(self) -> None:
+        self.flush_pending_writes()
+        super().cleanupPage()
 
     def _persist_overrides(self) -> None:
         if not self._overrides:
@@ -1920,6 +1984,7 @@ class SanityCheckPage(QWizardPage):
                 f.write(new_text)
 
             self._overrides = {}
+            self._source_cache_key = None
         except Exception as exc:
             QMessageBox.critical(self, "Save failed", f"Could not write timers.txt: {exc}")
 
@@ -2005,8 +2070,9 @@ class AutocorrectPage(QWizardPage):
         self.resolve_panel.setVisible(False)
         layout.addWidget(self.resolve_panel)
 
-        self._resolve_loop: Optional[QEventLoop] = None
-        self._resolve_result: Optional[Resolution] = None
+        self._worker: Optional[AutocorrectWorker] = None
+        self._workers: Dict[QThread, AutocorrectWorker] = {}
+        self._pending_request: Optional[ResolutionRequest] = None
         self._resolve_group: Optional[QButtonGroup] = None
         self._resolve_suggestion_map: Dict[QRadioButton, str] = {}
         self._resolve_custom_input: Optional[QLineEdit] = None
@@ -2027,8 +2093,7 @@ class AutocorrectPage(QWizardPage):
         self._autocorrect_source_key = None
 
     def reset_state(self) -> None:
-        self._resolve_loop = None
-        self._resolve_result = None
+        self._cancel_worker()
         self._resolve_group = None
         self._resolve_suggestion_map = {}
         self._resolve_custom_input = None
@@ -2060,12 +2125,14 @@ class AutocorrectPage(QWizardPage):
         current_key = (
             str(self.context.timers_path),
             self.context.start_datetime,
+            self.context.end_datetime,
             self.context.use_all_entries,
             self.context.spreadsheet_id,
             self.context.range_name,
             str(self.context.credentials_path),
         )
         if self._autocorrect_source_key != current_key:
+            self._cancel_worker()
             self._autocorrect_source_key = current_key
             self._autocorrect_started = False
             self._autocorrect_in_progress = False
@@ -2074,116 +2141,125 @@ class AutocorrectPage(QWizardPage):
             self.status.setText("Running autocorrect...")
             QTimer.singleShot(0, self._run_autocorrect)
 
+    def cleanupPage(self) -> None:
+        if self._pending_request is not None:
+            self._cancel_worker()
+            self._autocorrect_started = False
+            self.resolve_panel.setVisible(False)
+            self.status.setText("Run autocorrect to continue.")
+        super().cleanupPage()
+
     def _run_autocorrect(self) -> None:
         if self._autocorrect_in_progress:
             return
         self._autocorrect_in_progress = True
-        try:
-            token_file = token_path()
-            self._reset_resolve_progress()
-            QApplication.processEvents()
-            estimated, _sheet_names = estimate_unknown_count(
-                timers_path=self.context.timers_path,
-                start_date=self.context.start_datetime,
-                end_date=self.context.end_datetime,
-                use_all_entries=self.context.use_all_entries,
-                spreadsheet_id=self.context.spreadsheet_id,
-                range_name=self.context.range_name,
-                credentials_path=self.context.credentials_path,
-                token_path=token_file,
-                base_dir=self.context.base_dir,
-            )
-            self._resolve_total = estimated
-            self._update_resolve_progress()
-
-            def resolver(
-                name: str,
-                suggestions: List[str],
-                line_text: str,
-                prev_token: str,
-                next_token: str,
-                prev_line_raw: str,
-                next_line_raw: str,
-            ) -> Optional[Resolution]:
-                if self._resolve_count >= self._resolve_total:
-                    self._resolve_total = self._resolve_count + 1
-                self._update_resolve_progress()
-                result = self._resolve_name_inline(
-                    name,
-                    suggestions,
-                    line_text,
-                    prev_token,
-                    next_token,
-                    prev_line_raw,
-                    next_line_raw,
-                )
-                self._resolve_count += 1
-                self._update_resolve_progress()
-                return result
-
-            calculation = calculate_points(
-                timers_path=self.context.timers_path,
-                start_date=self.context.start_datetime,
-                end_date=self.context.end_datetime,
-                use_all_entries=self.context.use_all_entries,
-                spreadsheet_id=self.context.spreadsheet_id,
-                range_name=self.context.range_name,
-                credentials_path=self.context.credentials_path,
-                token_path=token_file,
-                base_dir=self.context.base_dir,
-                resolve_unknown=resolver,
-            )
+        self._reset_resolve_progress()
+        job = AutocorrectJob(
+            timers_path=self.context.timers_path,
+            start_date=self.context.start_datetime,
+            end_date=self.context.end_datetime,
+            use_all_entries=self.context.use_all_entries,
+            spreadsheet_id=self.context.spreadsheet_id,
+            range_name=self.context.range_name,
+            credentials_path=self.context.credentials_path,
+            token_path=token_path(),
+            base_dir=self.context.base_dir,
+            roster=self.context.roster_future,
+        )
+        thread = QThread(self)
+        worker = AutocorrectWorker(job)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.estimated.connect(self._on_estimated)
+        worker.resolution_requested.connect(self._on_resolution_requested)
+        worker.succeeded.connect(self._on_autocorrect_succeeded)
+        worker.failed.connect(self._on_autocorrect_failed)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(self._on_worker_thread_finished)
+        self._worker = worker
+        self._workers[thread] = worker
+        thread.start()
+
+    def _cancel_worker(self) -> None:
+        worker = self._worker
+        self._worker = None
+        self._pending_request = None
+        self._autocorrect_in_progress = False
+        if worker is not None:
+            worker.cancel()
+
+    def shutdown(self) -> None:
+        self._cancel_worker()
+        for thread in list(self._workers):
+            thread.quit()
+            thread.wait()
+
+    def _on_worker_thread_finished(self) -> None:
+        thread = self.sender()
+        worker = self._workers.pop(thread, None)
+        if worker is not None:
+            worker.deleteLater()
+        thread.deleteLater()
+        if worker is self._worker:
+            self._worker = None
+            self._autocorrect_in_progress = False
 
-            if calculation.errors.any():
-                QMessageBox.critical(
-                    self,
-                    "Validation errors",
-                    "Please fix the errors shown in the previous step and try again.",
-                )
-                return
+    def _on_estimated(self, estimated: int) -> None:
+        if self.sender() is not self._worker:
+            return
+        self._resolve_total = estimated
+        self._update_resolve_progress()
+
+    def _on_resolution_requested(self, request: ResolutionRequest) -> None:
+        if self.sender() is not self._worker:
+            request.cancel()
+            return
+        if self._resolve_count >= self._resolve_total:
+            self._resolve_total = self._resolve_count + 1
+        self._update_resolve_progress()
+        self._pending_request = request
+        self._show_resolution(request)
 
-            self.context.calculation = calculation
-            self.status.setText(
-                f"Autocorrect complete. {len(calculation.totals)} names with points."
+    def _on_autocorrect_succeeded(self, calculation: CalculationResult) -> None:
+        if self.sender() is not self._worker:
+            return
+        if calculation.errors.any():
+            QMessageBox.critical(
+                self,
+                "Validation errors",
+                "Please fix the errors shown in the previous step and try again.",
             )
-            self.complete = True
-            self.completeChanged.emit()
-        except Exception as exc:
-            QMessageBox.critical(self, "Autocorrect failed", str(exc))
-        finally:
-            self._autocorrect_in_progress = False
+            return
+
+        calculation.timings.log("Calculate points")
+        self.context.calculation = calculation
+        self.status.setText(
+            f"Autocorrect complete. {len(calculation.totals)} names with points."
+        )
+        self.complete = True
+        self.completeChanged.emit()
+
+    def _on_autocorrect_failed(self, message: str) -> None:
+        if self.sender() is not self._worker:
+            return
+        QMessageBox.critical(self, "Autocorrect failed", message)
 
     def isComplete(self) -> bool:
         return getattr(self, "complete", False)
 
-    def _resolve_name_inline(
-        self,
-        name: str,
-        suggestions: List[str],
-        line_text: str,
-        prev_token: str,
-        next_token: str,
-        prev_line_raw: str,
-        next_line_raw: str,
-    ) -> Optional[Resolution]:
+    def _show_resolution(self, request: ResolutionRequest) -> None:
         self._build_resolution_ui(
-            name,
-            suggestions,
-            line_text,
-            prev_token,
-            next_token,
-            prev_line_raw,
-            next_line_raw,
+            request.name,
+            request.suggestions,
+            request.line_text,
+            request.prev_token,
+            request.next_token,
+            request.prev_line_raw,
+            request.next_line_raw,
         )
         self.resolve_panel.setVisible(True)
         self.resolve_panel.raise_()
         self._ensure_wizard_size(min_width=900, min_height=720)
-        self._resolve_result = None
-        self._resolve_loop = QEventLoop()
-        self._resolve_loop.exec()
-        self._resolve_loop = None
-        self.resolve_panel.setVisible(False)
-        return self._resolve_result
 
     def _reset_resolve_progress(self) -> None:
         self._resolve_total = 0
@@ -2491,9 +2567,14 @@ class AutocorrectPage(QWizardPage):
         self._finish_resolution(None)
 
     def _finish_resolution(self, result: Optional[Resolution]) -> None:
-        self._resolve_result = result
-        if self._resolve_loop:
-            self._resolve_loop.quit()
+        request = self._pending_request
+        if request is None:
+            return
+        self._pending_request = None
+        self.resolve_panel.setVisible(False)
+        self._resolve_count += 1
+        self._update_resolve_progress()
+        request.respond(result)
 
     def _update_review_queue(self) -> None:
         if not self._review_queue:
@@ -2546,14 +2627,8 @@ class ResultsPage(QWizardPage):
         self.breakdown_label.setObjectName("SectionTitle")
         layout.addWidget(self.breakdown_label)
 
-        self.breakdown_table = QTableWidget()
-        self.breakdown_table.setColumnCount(0)
-        self.breakdown_table.setRowCount(0)
-        self.breakdown_table.setSortingEnabled(False)
-        self.breakdown_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.breakdown_table.setSelectionMode(QAbstractItemView.NoSelection)
-        self.breakdown_table.verticalHeader().setVisible(False)
-        self.breakdown_table.horizontalHeader().setStretchLastSection(True)
+        self.breakdown_model = BossBreakdownModel(self)
+        self.breakdown_table = make_count_table(self.breakdown_model)
         layout.addWidget(self.breakdown_table)
 
         buttons_row = QHBoxLayout()
@@ -2571,17 +2646,34 @@ class ResultsPage(QWizardPage):
 
         layout.addLayout(buttons_row)
 
+        self.timings_toggle = QCheckBox("Show stage timings")
+        self.timings_toggle.setChecked(self.context.config.show_stage_timings)
+        self.timings_toggle.toggled.connect(self._toggle_timings)
+        layout.addWidget(self.timings_toggle)
+
+        self.timings_box = QPlainTextEdit()
+        self.timings_box.setReadOnly(True)
+        self.timings_box.setMaximumHeight(140)
+        self.timings_box.setVisible(self.context.config.show_stage_timings)
+        layout.addWidget(self.timings_box)
+
     def reset_state(self) -> None:
         self.results_box.setPlainText("")
-        self.breakdown_table.setRowCount(0)
-        self.breakdown_table.setColumnCount(0)
+        self.breakdown_model.clear()
+        self.timings_box.setPlainText("")
+
+    def _toggle_timings(self, checked: bool) -> None:
+        self.timings_box.setVisible(checked)
+        cfg = self.context.config
+        cfg.show_stage_timings = checked
+        save_config(cfg)
 
     def initializePage(self) -> None:
         calculation = self.context.calculation
         if not calculation:
             self.results_box.setPlainText("No results available.")
-            self.breakdown_table.setRowCount(0)
-            self.breakdown_table.setColumnCount(0)
+            self.breakdown_model.clear()
+            self.timings_box.setPlainText("")
             return
 
         lines = [f"{name}, {points}" for name, points in calculation.totals]
@@ -2591,23 +2683,9 @@ class ResultsPage(QWizardPage):
         boss_counts = calculation.boss_counts
         total_names = {name for name, _points in calculation.totals}
         players = sorted(total_names | set(boss_counts.keys()), key=str.lower)
-        columns = ["Player"] + boss_list
-        self.breakdown_table.setColumnCount(len(columns))
-        self.breakdown_table.setHorizontalHeaderLabels(columns)
-        self.breakdown_table.setRowCount(len(players))
-
-        for row, player in enumerate(players):
-            self.breakdown_table.setItem(row, 0, QTableWidgetItem(player))
-            counts = boss_counts.get(player, {})
-            for col, boss in enumerate(boss_list, start=1):
-                value = counts.get(boss, 0)
-                item = QTableWidgetItem()
-                item.setData(Qt.DisplayRole, int(value))
-                self.breakdown_table.setItem(row, col, item)
-
-        self.breakdown_table.resizeColumnsToContents()
-        self.breakdown_table.resizeRowsToContents()
-        self.breakdown_table.setSortingEnabled(True)
+        self.breakdown_model.set_breakdown(players, boss_list, boss_counts)
+        fit_columns(self.breakdown_table)
+        self.timings_box.setPlainText("\n".join(calculation.timings.summary_lines()))
 
     def _export_txt(self) -> None:
         calculation = self.context.calculation
@@ -2664,6 +2742,7 @@ class DkpWizard(QWizard):
         )
 
         self.base_dir = base_dir
+        apply_run_store_backend(base_dir, config.run_store_backend)
         self.setWindowTitle("DKP Automator")
         self.setWizardStyle(QWizard.ModernStyle)
         banner = QPixmap(1, 1)
@@ -2679,6 +2758,8 @@ class DkpWizard(QWizard):
         self.addPage(self.results_page)
 
     def closeEvent(self, event) -> None:
+        self.sanity_page.flush_pending_writes()
+        self.autocorrect_page.shutdown()
         event.accept()
 
     def accept(self) -> None:
@@ -2726,4 +2807,6 @@ class DkpWizard(QWizard):
                     source_line=event.source_line,
                 )
             )
-        save_run(self.base_dir, run_meta, event_payloads)
+        timings = Timings()
+        save_run(self.base_dir, run_meta, event_payloads, timings=timings)
+        timings.log("Save run")
@@ -0,0 +1,137 @@
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from ..core.workflow import (
+    Resolution,
+    RosterSource,
+    calculate_prepared,
+    estimate_prepared,
+    prepare_run,
+)
+
+
+class AutocorrectCancelled(Exception):
+    pass
+
+
+@dataclass
+class AutocorrectJob:
+    timers_path: Path
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    use_all_entries: bool
+    spreadsheet_id: str
+    range_name: str
+    credentials_path: Path
+    token_path: Path
+    base_dir: Path
+    roster: Optional[RosterSource] = None
+
+    def kwargs(self) -> Dict[str, Any]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+
+@dataclass
+class ResolutionRequest:
+    name: str
+    suggestions: List[str]
+    line_text: str
+    prev_token: str
+    next_token: str
+    prev_line_raw: str
+    next_line_raw: str
+    cancelled: bool = False
+    _result: Optional[Resolution] = field(default=None, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def respond(self, resolution: Optional[Resolution]) -> None:
+        self._result = resolution
+        self._done.set()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        self._done.set()
+
+    def wait(self) -> Optional[Resolution]:
+        self._done.wait()
+        if self.cancelled:
+            raise AutocorrectCancelled()
+        return self._result
+
+
+class AutocorrectWorker(QObject):
+    estimated = Signal(int)
+    resolution_requested = Signal(object)
+    succeeded = Signal(object)
+    failed = Signal(str)
+    finished = Signal()
+
+    def __init__(self, job: AutocorrectJob) -> None:
+        super().__init__()
+        self.job = job
+        self._lock = threading.Lock()
+        self._pending: Optional[ResolutionRequest] = None
+        self._cancelled = False
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            prepared = prepare_run(**self.job.kwargs())
+            self._check_cancelled()
+            estimated, _sheet_names = estimate_prepared(prepared)
+            self.estimated.emit(estimated)
+            calculation = calculate_prepared(prepared, self._request_resolution)
+            self._check_cancelled()
+            self.succeeded.emit(calculation)
+        except AutocorrectCancelled:
+            pass
+        except Exception as exc:
+            if not self._cancelled:
+                self.failed.emit(str(exc))
+        finally:
+            self.finished.emit()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            pending = self._pending
+        if pending is not None:
+            pending.cancel()
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled:
+            raise AutocorrectCancelled()
+
+    def _request_resolution(
+        self,
+        name: str,
+        suggestions: List[str],
+        line_text: str,
+        prev_token: str,
+        next_token: str,
+        prev_line_raw: str,
+        next_line_raw: str,
+    ) -> Optional[Resolution]:
+        request = ResolutionRequest(
+            name,
+            suggestions,
+            line_text,
+            prev_token,
+            next_token,
+            prev_line_raw,
+            next_line_raw,
+        )
+        with self._lock:
+            self._check_cancelled()
+            self._pending = request
+        self.resolution_requested.emit(request)
+        try:
+            return request.wait()
+        finally:
+            with self._lock:
+                self._pending = None
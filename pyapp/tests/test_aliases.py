@@ -0,0 +1,142 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pyapp.core import aliases
+from pyapp.core.aliases import AliasWriter, add_boss_alias, add_name_alias, add_points_value
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _read_json(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class AliasWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_changes_are_buffered_until_flush(self) -> None:
+        _write_json(self.base_dir / "name_aliases.json", {"ali": "Alice"})
+        writer = AliasWriter(self.base_dir)
+        writer.add_name_alias("BOBBY", "Bob")
+        writer.add_name_alias("zed", "Zed")
+        writer.add_boss_alias("/Gelebron", "/GELE")
+        writer.add_points_value("/Crom", 12)
+        self.assertEqual(writer.pending(), 4)
+        self.assertEqual(_read_json(self.base_dir / "name_aliases.json"), {"ali": "Alice"})
+        self.assertFalse((self.base_dir / "boss_aliases.json").exists())
+
+        self.assertEqual(writer.flush(), 4)
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(
+            _read_json(self.base_dir / "name_aliases.json"),
+            {"ali": "Alice", "bobby": "Bob", "zed": "Zed"},
+        )
+        self.assertEqual(
+            _read_json(self.base_dir / "boss_aliases.json"), [{"/gelebron": "/gele"}]
+        )
+        self.assertEqual(_read_json(self.base_dir / "points.json"), {"/crom": 12})
+        self.assertEqual(sorted(path.name for path in self.base_dir.glob("*.tmp")), [])
+
+    def test_boss_aliases_update_in_place_and_keep_order(self) -> None:
+        _write_json(
+            self.base_dir / "boss_aliases.json",
+            [{"/bloodthorn": "/bt"}, {"/mordi": "/mord", "/mords": "/mord"}],
+        )
+        writer = AliasWriter(self.base_dir)
+        writer.add_boss_alias("/mords", "/mordris")
+        writer.add_boss_alias("/dhino", "/dino")
+        writer.add_boss_alias("/bloodthorn", "/bt")
+        writer.flush()
+        self.assertEqual(
+            _read_json(self.base_dir / "boss_aliases.json"),
+            [
+                {"/bloodthorn": "/bt"},
+                {"/mordi": "/mord", "/mords": "/mordris"},
+                {"/dhino": "/dino"},
+            ],
+        )
+
+    def test_duplicate_boss_alias_updates_first_entry(self) -> None:
+        _write_json(self.base_dir / "boss_aliases.json", [{"/mordi": "/mord"}, {"/mordi": "/x"}])
+        writer = AliasWriter(self.base_dir)
+        writer.add_boss_alias("/mordi", "/mordris")
+        writer.flush()
+        self.assertEqual(
+            _read_json(self.base_dir / "boss_aliases.json"),
+            [{"/mordi": "/mordris"}, {"/mordi": "/x"}],
+        )
+
+    def test_failed_write_keeps_pending_aliases(self) -> None:
+        writer = AliasWriter(self.base_dir)
+        writer.add_name_alias("bobby", "Bob")
+        writer.add_boss_alias("/dhino", "/dino")
+        writer.add_points_value("/crom", 12)
+        real_write = aliases._write_json
+
+        def fail_boss_write(path: Path, data) -> None:
+            if path.name == "boss_aliases.json":
+                raise OSError("disk full")
+            real_write(path, data)
+
+        with patch("pyapp.core.aliases._write_json", side_effect=fail_boss_write):
+            with self.assertRaises(OSError):
+                writer.flush()
+        self.assertEqual(_read_json(self.base_dir / "name_aliases.json"), {"bobby": "Bob"})
+        self.assertEqual(writer.pending(), 2)
+
+        self.assertEqual(writer.flush(), 2)
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(_read_json(self.base_dir / "boss_aliases.json"), [{"/dhino": "/dino"}])
+        self.assertEqual(_read_json(self.base_dir / "points.json"), {"/crom": 12})
+
+    def test_boss_aliases_are_not_reread_between_flushes(self) -> None:
+        _write_json(self.base_dir / "boss_aliases.json", [{"/mordi": "/mord"}])
+        writer = AliasWriter(self.base_dir)
+        writer.add_boss_alias("/dhino", "/dino")
+        writer.flush()
+        with patch("pyapp.core.aliases._read_json", wraps=aliases._read_json) as mock_read:
+            writer.add_boss_alias("/mordi", "/mordris")
+            writer.flush()
+        mock_read.assert_not_called()
+        self.assertEqual(
+            _read_json(self.base_dir / "boss_aliases.json"),
+            [{"/mordi": "/mordris"}, {"/dhino": "/dino"}],
+        )
+
+    def test_boss_aliases_reload_after_outside_edit(self) -> None:
+        writer = AliasWriter(self.base_dir)
+        writer.add_boss_alias("/dhino", "/dino")
+        writer.flush()
+        _write_json(self.base_dir / "boss_aliases.json", [{"/bloodthorn": "/bt"}])
+        writer.add_boss_alias("/mordi", "/mord")
+        writer.flush()
+        self.assertEqual(
+            _read_json(self.base_dir / "boss_aliases.json"),
+            [{"/bloodthorn": "/bt"}, {"/mordi": "/mord"}],
+        )
+
+    def test_flush_without_changes_leaves_files_alone(self) -> None:
+        self.assertEqual(AliasWriter(self.base_dir).flush(), 0)
+        self.assertEqual(list(self.base_dir.iterdir()), [])
+
+    def test_single_change_helpers_write_immediately(self) -> None:
+        add_name_alias(self.base_dir, "Ali", "Alice")
+        add_boss_alias(self.base_dir, "/Ring", "/Rings")
+        add_points_value(self.base_dir, "/Base", 7)
+        self.assertEqual(_read_json(self.base_dir / "name_aliases.json"), {"ali": "Alice"})
+        self.assertEqual(_read_json(self.base_dir / "boss_aliases.json"), [{"/ring": "/rings"}])
+        self.assertEqual(_read_json(self.base_dir / "points.json"), {"/base": 7})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import string
+import unittest
+
+import textdistance
+
+from pyapp.core.autocorrect import Autocorrecter
+
+
+def _brute_force(vocab, input_word):
+    input_word = input_word.lower()
+    similarities = [(v, textdistance.cosine(v, input_word)) for v in vocab]
+    similarities.sort(key=lambda item: item[1])
+    return [vocab[v] for v, _ in reversed(similarities)][:5]
+
+
+class AutocorrecterTests(unittest.TestCase):
+    NAMES = ["Alice", "Alicia", "Bob", "Bobby", "Carl", "Carla", "Dave", "Eve", "Lica"]
+
+    def test_matches_brute_force_ranking(self) -> None:
+        autocorrecter = Autocorrecter(self.NAMES)
+        for query in ["alcie", "ALICE", "bob", "obb", "ca", "zzz", "", "evev", "acil"]:
+            self.assertEqual(
+                autocorrecter.correct(query), _brute_force(autocorrecter.vocab, query), query
+            )
+
+    def test_ties_prefer_latest_words(self) -> None:
+        autocorrecter = Autocorrecter(["ab", "ba", "xy", "yx"])
+        self.assertEqual(autocorrecter.correct("ab"), ["ba", "ab", "yx", "xy"])
+        self.assertEqual(autocorrecter.correct("qq"), ["yx", "xy", "ba", "ab"])
+
+    def test_added_words_are_indexed(self) -> None:
+        autocorrecter = Autocorrecter(self.NAMES)
+        autocorrecter.add_word("zedd", "Zedd")
+        self.assertEqual(autocorrecter.correct("zed")[0], "Zedd")
+        self.assertEqual(
+            autocorrecter.correct("zed"), _brute_force(autocorrecter.vocab, "zed")
+        )
+
+    def test_correct_many_precomputes_suggestions(self) -> None:
+        autocorrecter = Autocorrecter(self.NAMES)
+        queries = ["alcie", "bobb", "alcie", "zzz"]
+        suggestions = autocorrecter.correct_many(queries)
+        self.assertEqual(set(suggestions), {"alcie", "bobb", "zzz"})
+        for query in queries:
+            self.assertEqual(suggestions[query], _brute_force(autocorrecter.vocab, query))
+
+    def test_cached_suggestions_follow_added_words(self) -> None:
+        autocorrecter = Autocorrecter(self.NAMES)
+        autocorrecter.correct_many(["alcie", "bobb", "zzz", "ab"])
+        for word, display in [("alcie", "Alcie"), ("bb", None), ("zzzz", None), ("xyz", None)]:
+            autocorrecter.add_word(word, display)
+            for query in ["alcie", "bobb", "zzz", "ab"]:
+                self.assertEqual(
+                    autocorrecter.correct(query), _brute_force(autocorrecter.vocab, query)
+                )
+
+    def test_random_vocabularies_match_brute_force(self) -> None:
+        rng = random.Random(7)
+        for _ in range(200):
+            alphabet = rng.choice(["ab", "abcd", string.ascii_lowercase])
+            words = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+                for _ in range(rng.randint(0, 25))
+            ]
+            autocorrecter = Autocorrecter(words)
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            self.assertEqual(
+                autocorrecter.correct(query), _brute_force(autocorrecter.vocab, query)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import csv
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from pyapp.cli import UnresolvedNameError, main, output_stems, resolution_policy
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class ResolutionPolicyTests(unittest.TestCase):
+    def _resolve(self, policy: str, name: str, suggestions, threshold: float = 0.8):
+        return resolution_policy(policy, threshold)(name, suggestions, "line", "", "", "", "")
+
+    def test_accept_takes_close_top_suggestion(self) -> None:
+        resolution = self._resolve("accept", "alcie", ["Alice", "Bob"])
+        self.assertEqual(resolution.names, ["Alice"])
+        self.assertTrue(resolution.cache_original)
+        self.assertFalse(resolution.persist_alias)
+
+    def test_accept_discards_below_threshold(self) -> None:
+        self.assertIsNone(self._resolve("accept", "zed", ["Alice", "Bob"]))
+        self.assertIsNone(self._resolve("accept", "zed", []))
+
+    def test_discard_and_fail(self) -> None:
+        self.assertIsNone(self._resolve("discard", "alcie", ["Alice"]))
+        with self.assertRaises(UnresolvedNameError):
+            self._resolve("fail", "alcie", ["Alice"])
+
+    def test_unknown_policy_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            resolution_policy("ask")
+
+
+class CliTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        _write_json(self.base_dir / "points.json", {"boss1": 10, "boss2": 5})
+        _write_json(self.base_dir / "prios.json", [])
+        _write_json(self.base_dir / "boss_aliases.json", [])
+        _write_json(self.base_dir / "name_aliases.json", {})
+        self.names_path = self.base_dir / "names.txt"
+        self.names_path.write_text("Alice\nBob\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _timers(self, name: str, lines) -> Path:
+        path = self.base_dir / name
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    def _run(self, *args: str):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = main(
+                [*args, "--base-dir", str(self.base_dir), "--names", str(self.names_path)]
+            )
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_json_to_stdout_with_accept_policy(self) -> None:
+        timers = self._timers(
+            "timers.txt",
+            [
+                "01 Jan 2026 at 20:00: boss1 alcie bob",
+                "02 Jan 2026 at 20:00: boss2 alice zed",
+            ],
+        )
+        status, stdout, _stderr = self._run(str(timers), "--policy", "accept")
+        self.assertEqual(status, 0)
+        document = json.loads(stdout)
+        totals = {item["name"].lower(): item["points"] for item in document["totals"]}
+        self.assertEqual(totals, {"alice": 15, "bob": 10})
+        self.assertEqual(len(document["events"]), 2)
+        self.assertEqual(document["boss_list"], ["boss1", "boss2"])
+
+    def test_csv_output_for_many_files(self) -> None:
+        first = self._timers("first.txt", ["01 Jan 2026 at 20:00: boss1 alice bob"])
+        second = self._timers("second.txt", ["02 Jan 2026 at 20:00: boss2 bob"])
+        output_dir = self.base_dir / "out"
+        status, _stdout, _stderr = self._run(
+            str(first), str(second), "--format", "csv", "--output-dir", str(output_dir)
+        )
+        self.assertEqual(status, 0)
+        with (output_dir / "second.totals.csv").open(encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["name", "points"])
+        self.assertEqual([row[0].lower() for row in rows[1:]], ["bob"])
+        with (output_dir / "first.events.csv").open(encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(len(rows), 3)
+
+    def test_fail_policy_and_validation_errors_set_exit_status(self) -> None:
+        unknown = self._timers("unknown.txt", ["01 Jan 2026 at 20:00: boss1 zed"])
+        invalid = self._timers("invalid.txt", ["01 Jan 2026 at 20:00: nosuchboss alice"])
+        good = self._timers("good.txt", ["01 Jan 2026 at 20:00: boss1 alice"])
+        output_dir = self.base_dir / "out"
+        status, _stdout, stderr = self._run(
+            str(unknown),
+            str(invalid),
+            str(good),
+            "--policy",
+            "fail",
+            "--output-dir",
+            str(output_dir),
+        )
+        self.assertEqual(status, 1)
+        self.assertIn("unknown.txt: Unknown name 'zed'", stderr)
+        self.assertIn("invalid.txt: boss_lines", stderr)
+        self.assertEqual(sorted(path.name for path in output_dir.iterdir()), ["good.json"])
+
+    def test_same_stem_in_different_directories_is_not_overwritten(self) -> None:
+        (self.base_dir / "a").mkdir()
+        (self.base_dir / "b").mkdir()
+        first = self._timers("a/timers.txt", ["01 Jan 2026 at 20:00: boss1 alice"])
+        second = self._timers("b/timers.txt", ["02 Jan 2026 at 20:00: boss2 bob"])
+        output_dir = self.base_dir / "out"
+        status, _stdout, _stderr = self._run(
+            str(first), str(second), "--output-dir", str(output_dir)
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            sorted(path.name for path in output_dir.iterdir()), ["timers-1.json", "timers-2.json"]
+        )
+        document = json.loads((output_dir / "timers-2.json").read_text(encoding="utf-8"))
+        self.assertEqual(document["timers_path"], str(second))
+        self.assertEqual(
+            output_stems([Path("x/t.txt"), Path("t-1.txt"), Path("y/t.txt")]), ["t-2", "t-1", "t-3"]
+        )
+
+    def test_date_window_defaults_to_one_week(self) -> None:
+        timers = self._timers(
+            "timers.txt",
+            [
+                "01 Jan 2026 at 20:00: boss1 alice",
+                "05 Jan 2026 at 20:00: boss2 alice",
+                "10 Jan 2026 at 20:00: boss1 bob",
+            ],
+        )
+        status, stdout, _stderr = self._run(str(timers), "--start", "2026-01-03T00:00:00")
+        self.assertEqual(status, 0)
+        totals = {item["name"].lower(): item["points"] for item in json.loads(stdout)["totals"]}
+        self.assertEqual(totals, {"alice": 5})
+
+        with self.assertRaises(SystemExit):
+            self._run(str(timers), "--end", "2026-01-08T00:00:00")
+
+    def test_cli_does_not_import_qt(self) -> None:
+        code = "import sys, pyapp.cli; print('PySide6' in sys.modules)"
+        root = Path(__file__).resolve().parents[2]
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
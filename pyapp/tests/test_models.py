@@ -0,0 +1,123 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QApplication
+
+from pyapp.gui.models import BossBreakdownModel, CountTableModel, WeeklyChartModel
+
+
+def _column(model, column: int):
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+class BossBreakdownModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.model = BossBreakdownModel()
+        self.model.set_breakdown(
+            ["Alice", "Bob", "Cara"],
+            ["boss1", "boss2"],
+            {"Alice": {"boss1": 2}, "Bob": {"boss1": 5, "boss2": 1}, "Cara": {"boss2": 3}},
+        )
+
+    def test_set_breakdown_fills_counts(self) -> None:
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 3)
+        self.assertEqual(
+            [self.model.headerData(column, Qt.Horizontal) for column in range(3)],
+            ["Player", "boss1", "boss2"],
+        )
+        self.assertEqual(_column(self.model, 0), ["Alice", "Bob", "Cara"])
+        self.assertEqual(_column(self.model, 1), [2, 5, 0])
+        self.assertEqual(_column(self.model, 2), [0, 1, 3])
+        self.assertEqual(self.model.text(1, 1), "5")
+
+    def test_sort_ascending_and_descending(self) -> None:
+        self.model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(_column(self.model, 0), ["Cara", "Alice", "Bob"])
+        self.model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(_column(self.model, 0), ["Bob", "Alice", "Cara"])
+        self.model.sort(0, Qt.DescendingOrder)
+        self.assertEqual(_column(self.model, 0), ["Cara", "Bob", "Alice"])
+
+    def test_sort_keeps_persistent_indexes_on_player(self) -> None:
+        bob = QPersistentModelIndex(self.model.index(1, 2))
+        cara = QPersistentModelIndex(self.model.index(2, 0))
+        self.model.sort(2, Qt.DescendingOrder)
+        self.assertEqual(bob.row(), 1)
+        self.assertEqual(cara.row(), 0)
+        self.model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(bob.row(), 0)
+        self.assertEqual(bob.column(), 2)
+        self.assertEqual(self.model.data(self.model.index(bob.row(), 0)), "Bob")
+        self.assertEqual(self.model.data(self.model.index(cara.row(), 0)), "Cara")
+
+    def test_clear_empties_model(self) -> None:
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.columnCount(), 0)
+        self.assertIsNone(self.model.headerData(0, Qt.Horizontal))
+
+
+class CountTableModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_subclass_must_override_count(self) -> None:
+        model = CountTableModel()
+        model._reset(["Player", "boss1"], ["Alice"])
+        self.assertEqual(model.data(model.index(0, 0)), "Alice")
+        with self.assertRaises(NotImplementedError):
+            model.count(0, 1)
+
+
+class WeeklyChartModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.model = WeeklyChartModel()
+        self.model.set_players(["Alice", "Bob"], ["boss1"])
+
+    def test_cells_before_week_are_zero(self) -> None:
+        self.assertEqual(self.model.columnCount(), 5)
+        self.assertEqual(self.model.headerData(4, Qt.Horizontal), "boss1")
+        for column in range(1, 5):
+            self.assertEqual(_column(self.model, column), [0, 0])
+
+    def test_set_week_fills_cells(self) -> None:
+        self.model.set_week(
+            {
+                "Alice": {"dkp": 12, "boss_counts": {"boss1": 3}},
+                "Bob": {"dkp": 4},
+            },
+            {"Alice": {"a": 2, "aplus": 1}, "Bob": {"a": 5}},
+        )
+        self.assertEqual(_column(self.model, 1), [12, 4])
+        self.assertEqual(_column(self.model, 2), [2, 5])
+        self.assertEqual(_column(self.model, 3), [1, 0])
+        self.assertEqual(_column(self.model, 4), [3, 0])
+
+    def test_set_week_resorts_sorted_column(self) -> None:
+        self.model.sort(1, Qt.DescendingOrder)
+        self.model.set_week({"Alice": {"dkp": 1}, "Bob": {"dkp": 9}})
+        self.assertEqual(_column(self.model, 0), ["Bob", "Alice"])
+        self.model.set_week({"Alice": {"dkp": 7}, "Bob": {"dkp": 2}})
+        self.assertEqual(_column(self.model, 0), ["Alice", "Bob"])
+
+    def test_clear_empties_model(self) -> None:
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.columnCount(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
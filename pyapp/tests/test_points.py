@@ -0,0 +1,102 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyapp.core.points import BossToken, PointsStore
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class PointsStoreTests(unittest.TestCase):
+    def _setup_base_dir(self, base_dir: Path) -> None:
+        _write_json(
+            base_dir / "points.json",
+            {
+                "/necro": 20,
+                "170.4": 4,
+                "boss1": 10,
+                "/rings": {"5": 1, "6": 2},
+                "/legacy": [{"level": 200, "5": 3, "6": 4}],
+            },
+        )
+        _write_json(base_dir / "prios.json", ["170"])
+
+    def test_base_and_structured_bosses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            store = PointsStore(base_dir)
+            self.assertEqual(store.get_points("necro"), 20)
+            self.assertEqual(store.get_points("/necro"), 20)
+            self.assertEqual(store.get_points("/170.4"), 4)
+            self.assertEqual(store.get_points("boss1"), 10)
+            self.assertIsNone(store.get_points("/boss1"))
+            self.assertEqual(store.get_points("rings3x6"), 6)
+            self.assertEqual(store.get_points("/legacy210.5"), 3)
+            self.assertEqual(store.get_points("legacy150.5"), 0)
+            self.assertEqual(store.get_points("root2"), 4)
+            self.assertIsNone(store.get_points("rings"))
+            self.assertIsNone(store.get_points("unknown"))
+
+    def test_modifiers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            store = PointsStore(base_dir)
+            self.assertEqual(store.get_points("boss1(doublepoints)"), 20)
+            self.assertEqual(store.get_points("boss1(brucybonus)"), 15)
+            self.assertEqual(store.get_points("necro(fail)"), 10)
+            self.assertEqual(store.get_points("170.4(comp)"), 4)
+            self.assertIsNone(store.get_points("necro(comp)"))
+            self.assertIsNone(store.get_points("boss1(bogus)"))
+
+    def test_classify_parses_token_structure(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            store = PointsStore(base_dir)
+            self.assertEqual(
+                store.classify("/necro(double)"),
+                BossToken(boss="/necro", kind="base", slash=True, modifier="double"),
+            )
+            self.assertEqual(
+                store.classify("rings3x6"),
+                BossToken(boss="rings3x6", kind="rings", slash=False, ring_count=3, star="6"),
+            )
+            self.assertEqual(
+                store.classify("/legacy210.5(fail)"),
+                BossToken(
+                    boss="/legacy210.5",
+                    kind="legacy",
+                    slash=True,
+                    modifier="fail",
+                    level=210,
+                    star="5",
+                ),
+            )
+            self.assertEqual(store.classify("root12").kind, "root")
+            self.assertIsNone(store.classify("rings5x5"))
+            self.assertIsNone(store.classify("legacy200.4"))
+            self.assertIsNone(store.classify("rootx"))
+            self.assertIsNone(store.classify("necro(bogus)"))
+
+    def test_reload_invalidates_cached_points(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            store = PointsStore(base_dir)
+            self.assertEqual(store.get_points("boss1"), 10)
+            self.assertIsNone(store.get_points("boss2"))
+
+            _write_json(base_dir / "points.json", {"boss1": 7, "boss2": 3})
+            self.assertEqual(store.get_points("boss1"), 10)
+            store.reload()
+            self.assertEqual(store.get_points("boss1"), 7)
+            self.assertEqual(store.get_points("boss2"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
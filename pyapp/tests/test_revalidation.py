@@ -0,0 +1,68 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pyapp.core.points import PointsStore
+from pyapp.core.revalidation import IncrementalValidator, split_errors_by_line
+from pyapp.core.sanitise import validate_lines
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class IncrementalValidatorTests(unittest.TestCase):
+    LINES = [
+        (1, "01 jan 2026 at 20:00:boss1 alice"),
+        (2, "02 jan 2026 at 20:00:bossx alice"),
+        (3, "03 jan 2026 at 20:00:boss1 a"),
+        (4, "xx jan 2026 at 20:00:boss1 carl"),
+        (5, "04 jan 2026 at 20:00:boss1 alice not bob carl"),
+        (6, "05 jan 2026 at 20:00:bossx at bob"),
+    ]
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        base_dir = Path(self._tmp.name)
+        _write_json(base_dir / "points.json", {"boss1": 10})
+        _write_json(base_dir / "prios.json", [])
+        _write_json(base_dir / "boss_aliases.json", [])
+        self.store = PointsStore(base_dir)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_initial_errors_match_full_validation(self) -> None:
+        validator = IncrementalValidator(self.LINES, self.store)
+        _, expected = validate_lines(self.LINES, self.store)
+        self.assertEqual(validator.errors(), expected)
+        self.assertEqual(validator.error_lines(), sorted(split_errors_by_line(expected)))
+        self.assertEqual(validator.total_lines, len(self.LINES))
+
+    def test_update_line_matches_full_validation(self) -> None:
+        validator = IncrementalValidator(self.LINES, self.store)
+        lines = dict(self.LINES)
+
+        for index, line in [
+            (2, "02 jan 2026 at 20:00:boss1 alice"),
+            (3, "03 jan 2026 at 20:00:boss1 abe"),
+            (1, "01 jan 2026 at 20:00:bossy alice"),
+        ]:
+            lines[index] = line
+            validator.update_line(index, line)
+            _, expected = validate_lines(sorted(lines.items()), self.store)
+            self.assertEqual(validator.errors(), expected)
+
+    def test_removing_line_drops_its_errors(self) -> None:
+        validator = IncrementalValidator(self.LINES, self.store)
+        previous, current = validator.update_line(6, None)
+        self.assertIsNotNone(previous)
+        self.assertIsNone(current)
+        self.assertNotIn(6, validator.error_lines())
+        self.assertNotIn(6, validator.lines)
+        self.assertNotIn(6, validator.errors().unknown_bosses.get("bossx", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
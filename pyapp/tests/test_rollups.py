@@ -0,0 +1,137 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pyapp.core.rollups import aggregate_events, load_weekly_rollups, week_start_utc
+from pyapp.core.runs import (
+    build_run_meta,
+    enable_sqlite_store,
+    iter_active_events,
+    normalize_event,
+    save_run,
+    save_run_store,
+)
+
+BASE = datetime(2026, 1, 4, tzinfo=timezone.utc)
+
+
+def _run(run_id: str, start_day: int, end_day: int, events: list):
+    start = BASE + timedelta(days=start_day)
+    end = BASE + timedelta(days=end_day)
+    meta = build_run_meta(run_id, BASE, start, end, len(events))
+    payloads = [
+        normalize_event(
+            run_id,
+            BASE,
+            BASE + timedelta(days=day, hours=20),
+            boss,
+            10,
+            entries,
+            f"{run_id}-{index}",
+        )
+        for index, (day, boss, entries) in enumerate(events)
+    ]
+    return meta, payloads
+
+
+class WeeklyRollupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _expected(self):
+        weekly, bosses = aggregate_events(iter_active_events(self.base_dir))
+        return weekly, sorted(set().union(*bosses.values()), key=str.lower)
+
+    def test_week_start_is_sunday_midnight_utc(self) -> None:
+        self.assertEqual(week_start_utc(BASE + timedelta(days=6, hours=23)), BASE)
+        self.assertEqual(week_start_utc(BASE + timedelta(days=7)), BASE + timedelta(days=7))
+
+    def test_boss_counts_follow_event_order(self) -> None:
+        _, events = _run(
+            "r1",
+            0,
+            6,
+            [
+                (0, "/Vox (North)", [{"name": "alice", "delta": -5}]),
+                (1, "Vox", [{"name": "alice", "delta": 10}, {"name": "bob", "delta": 0}]),
+                (2, "Vox", [{"name": "bob", "delta": -5}]),
+            ],
+        )
+        weekly, bosses = aggregate_events(events)
+        self.assertEqual(weekly[BASE]["alice"], {"dkp": 5, "boss_counts": {"Vox": 1}})
+        self.assertEqual(weekly[BASE]["bob"], {"dkp": -5, "boss_counts": {}})
+        self.assertEqual(bosses[BASE], {"Vox"})
+
+    def test_save_run_updates_only_affected_weeks(self) -> None:
+        alice = [{"name": "alice", "delta": 10}]
+        save_run(self.base_dir, *_run("r1", 0, 13, [(1, "Vox", alice), (8, "Trakanon", alice)]))
+        save_run(self.base_dir, *_run("r2", 7, 13, [(9, "Vox", [{"name": "bob", "delta": 5}])]))
+
+        weekly, boss_list = load_weekly_rollups(self.base_dir)
+        self.assertEqual((weekly, boss_list), self._expected())
+        self.assertEqual(weekly[BASE]["alice"]["dkp"], 10)
+        self.assertEqual(list(weekly[BASE + timedelta(days=7)]), ["bob"])
+        self.assertEqual(boss_list, ["Vox"])
+
+        rollup_dir = self.base_dir / "runs" / "weekly"
+        index = json.loads((rollup_dir / "index.json").read_text(encoding="utf-8"))
+        self.assertEqual(index["weeks"], [BASE.isoformat(), (BASE + timedelta(days=7)).isoformat()])
+        self.assertEqual(
+            sorted(path.name for path in rollup_dir.glob("*.json")),
+            ["2026-01-04.json", "2026-01-11.json", "index.json"],
+        )
+
+    def test_stale_or_missing_rollups_are_rebuilt(self) -> None:
+        alice = [{"name": "alice", "delta": 10}]
+        save_run(self.base_dir, *_run("r1", 0, 6, [(1, "Vox", alice)]))
+        (self.base_dir / "runs" / "weekly" / "index.json").unlink()
+        self.assertEqual(load_weekly_rollups(self.base_dir), self._expected())
+
+        save_run_store(self.base_dir, {"runs": [], "events": []})
+        self.assertEqual(load_weekly_rollups(self.base_dir), ({}, []))
+
+    def test_sqlite_backend_survives_the_switch_mid_week(self) -> None:
+        alice = [{"name": "alice", "delta": 10}]
+        save_run(self.base_dir, *_run("r1", 0, 6, [(1, "Vox", alice), (3, "Vox", alice)]))
+        enable_sqlite_store(self.base_dir)
+        save_run(self.base_dir, *_run("r2", 2, 6, [(4, "Vox", [{"name": "alice", "delta": 5}])]))
+
+        weekly, _ = load_weekly_rollups(self.base_dir)
+        self.assertEqual(weekly[BASE]["alice"], {"dkp": 15, "boss_counts": {"Vox": 2}})
+        self.assertEqual((weekly, ["Vox"]), self._expected())
+
+    def test_sqlite_backend_aggregates_weeks_in_sql(self) -> None:
+        enable_sqlite_store(self.base_dir)
+        save_run(
+            self.base_dir,
+            *_run(
+                "r1",
+                0,
+                13,
+                [
+                    (0, "/Vox (North)", [{"name": "alice", "delta": -5}]),
+                    (1, "Vox", [{"name": "alice", "delta": 10}, {"name": "bob", "delta": 0}]),
+                    (2, "Vox", [{"name": "bob", "delta": -5}]),
+                    (8, "Trakanon", [{"name": "bob", "delta": 7}, {"name": "", "delta": 3}]),
+                ],
+            ),
+        )
+        save_run(self.base_dir, *_run("r2", 8, 13, [(9, "Vox", [{"name": "carl", "delta": 4}])]))
+
+        weekly, boss_list = load_weekly_rollups(self.base_dir)
+        self.assertEqual((weekly, boss_list), self._expected())
+        self.assertEqual(weekly[BASE]["alice"], {"dkp": 5, "boss_counts": {"Vox": 1}})
+        self.assertEqual(weekly[BASE]["bob"], {"dkp": -5, "boss_counts": {}})
+        self.assertEqual(list(weekly[BASE + timedelta(days=7)]), ["carl"])
+        self.assertEqual(boss_list, ["Vox"])
+        self.assertFalse((self.base_dir / "runs" / "weekly" / "index.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
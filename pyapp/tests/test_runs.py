@@ -0,0 +1,250 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pyapp.core.runs import (
+    WEEK_SECONDS,
+    WeekBuckets,
+    apply_run_store_backend,
+    build_run_meta,
+    enable_sqlite_store,
+    iter_active_events,
+    load_run_store,
+    migrate_legacy_store,
+    normalize_event,
+    save_run,
+    save_run_store,
+)
+from pyapp.core.timing import Timings
+
+BASE = datetime(2026, 1, 4, tzinfo=timezone.utc)
+
+
+def _run(run_id: str, start_day: int, end_day: int, event_days: list):
+    created = BASE
+    start = BASE + timedelta(days=start_day)
+    end = BASE + timedelta(days=end_day)
+    meta = build_run_meta(run_id, created, start, end, len(event_days))
+    events = [
+        normalize_event(
+            run_id,
+            created,
+            BASE + timedelta(days=day, hours=20),
+            "boss1",
+            10,
+            [{"name": "alice", "delta": 10}],
+            f"{run_id}-{day}",
+        )
+        for day in event_days
+    ]
+    return meta, events
+
+
+class RunStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _active_lines(self, start=None, end=None):
+        events = iter_active_events(self.base_dir, start, end)
+        return [event["source_line"] for event in events]
+
+    def test_overlapping_run_supersedes_earlier_events(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6]))
+        save_run(self.base_dir, *_run("r2", 3, 10, [4, 9]))
+
+        self.assertEqual(self._active_lines(), ["r1-0", "r2-4", "r2-9"])
+        data = load_run_store(self.base_dir)
+        self.assertEqual([run["run_id"] for run in data["runs"]], ["r1", "r2"])
+        replaced = {event["source_line"]: event["replaced_by"] for event in data["events"]}
+        self.assertEqual(replaced["r1-3"], "r2")
+        self.assertEqual(replaced["r1-6"], "r2")
+        self.assertIsNone(replaced["r2-4"])
+
+    def test_save_run_returns_superseded_events(self) -> None:
+        self.assertEqual(save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6])), [])
+        superseded = save_run(self.base_dir, *_run("r2", 3, 10, [4, 9]))
+        self.assertEqual([event["source_line"] for event in superseded], ["r1-3", "r1-6"])
+        self.assertTrue(all(event["replaced_by"] == "r2" for event in superseded))
+        superseded = save_run(self.base_dir, *_run("r3", 5, 40, [30]))
+        self.assertEqual([event["source_line"] for event in superseded], ["r2-9"])
+
+    def test_save_run_records_stage_timings(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6]))
+        timings = Timings()
+        save_run(self.base_dir, *_run("r2", 3, 10, [4, 9]), timings=timings)
+        items = {item.name: item.items for item in timings.stats()}
+        self.assertEqual(items, {"store": 2, "rollups": 4})
+
+    def test_migrated_history_is_split_into_weekly_segments(self) -> None:
+        events = []
+        for week in range(3):
+            events.extend(_run(f"w{week}", week * 7, week * 7 + 6, [week * 7, week * 7 + 1])[1])
+        save_run_store(self.base_dir, {"version": 1, "runs": [], "events": events})
+
+        manifest = (self.base_dir / "runs" / "manifest.jsonl").read_bytes().splitlines()
+        self.assertEqual(len(manifest), 3)
+        self.assertEqual(load_run_store(self.base_dir)["events"], events)
+        self.assertEqual(
+            self._active_lines(BASE + timedelta(days=7), BASE + timedelta(days=8, hours=21)),
+            ["w1-7", "w1-8"],
+        )
+
+    def test_week_buckets_lookup(self) -> None:
+        buckets = WeekBuckets()
+        buckets.add(0, WEEK_SECONDS * 2, "wide")
+        buckets.add(WEEK_SECONDS * 5, WEEK_SECONDS * 5 + 10, "narrow")
+        buckets.add(float("-inf"), float("inf"), "all")
+        self.assertEqual(sorted(buckets.covering(WEEK_SECONDS)), ["all", "wide"])
+        self.assertEqual(buckets.covering(WEEK_SECONDS * 5 + 5)[-1], "narrow")
+        self.assertEqual(buckets.overlapping(WEEK_SECONDS * 4, WEEK_SECONDS * 6), ["all", "narrow"])
+        self.assertEqual(buckets.overlapping(-1, float("inf")), ["all", "narrow", "wide"])
+
+    def test_save_appends_without_rewriting_history(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3]))
+        log_path = self.base_dir / "runs" / "events.jsonl"
+        before = log_path.read_bytes()
+        save_run(self.base_dir, *_run("r2", 0, 7, [1]))
+        after = log_path.read_bytes()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(len(after.splitlines()), 3)
+
+    def test_legacy_store_is_migrated(self) -> None:
+        meta, events = _run("old", 0, 7, [0, 3])
+        events[0]["active"] = False
+        events[0]["replaced_by"] = "gone"
+        legacy_path = self.base_dir / "runs" / "events.json"
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_text(
+            json.dumps({"version": 1, "runs": [meta], "events": events}), encoding="utf-8"
+        )
+
+        save_run(self.base_dir, *_run("new", 2, 9, [5]))
+
+        self.assertFalse(legacy_path.exists())
+        self.assertTrue(legacy_path.with_name("events.json.migrated").exists())
+        self.assertFalse(migrate_legacy_store(self.base_dir))
+        data = load_run_store(self.base_dir)
+        self.assertEqual([run["run_id"] for run in data["runs"]], ["old", "new"])
+        replaced = {event["source_line"]: event["replaced_by"] for event in data["events"]}
+        self.assertEqual(replaced, {"old-0": "gone", "old-3": "new", "new-5": None})
+
+    def test_uncommitted_writes_are_ignored_and_discarded(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0]))
+        runs_dir = self.base_dir / "runs"
+        with (runs_dir / "events.jsonl").open("ab") as handle:
+            handle.write(b'{"source_line": "orphan"}\n{"source_')
+        with (runs_dir / "manifest.jsonl").open("ab") as handle:
+            handle.write(b'{"type": "run", "event_co')
+
+        self.assertEqual(self._active_lines(), ["r1-0"])
+        save_run(self.base_dir, *_run("r2", 8, 9, [8]))
+        self.assertEqual(self._active_lines(), ["r1-0", "r2-8"])
+        self.assertEqual(len((runs_dir / "manifest.jsonl").read_bytes().splitlines()), 2)
+
+    def test_save_run_store_compacts_history(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3]))
+        save_run(self.base_dir, *_run("r2", 3, 10, [4]))
+        data = load_run_store(self.base_dir)
+
+        save_run_store(self.base_dir, data)
+
+        self.assertEqual(load_run_store(self.base_dir), data)
+        save_run(self.base_dir, *_run("r3", 0, 1, [1]))
+        self.assertEqual(self._active_lines(), ["r2-4", "r3-1"])
+
+
+
+class SqliteRunStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _active_lines(self, *window):
+        return [event["source_line"] for event in iter_active_events(self.base_dir, *window)]
+
+    def test_enable_migrates_existing_history(self) -> None:
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6]))
+        before = load_run_store(self.base_dir)
+
+        self.assertTrue(enable_sqlite_store(self.base_dir))
+        self.assertFalse(enable_sqlite_store(self.base_dir))
+
+        runs_dir = self.base_dir / "runs"
+        self.assertTrue((runs_dir / "runs.sqlite3").exists())
+        self.assertFalse((runs_dir / "events.jsonl").exists())
+        self.assertEqual(load_run_store(self.base_dir), before)
+
+    def test_supersession_and_range_queries(self) -> None:
+        enable_sqlite_store(self.base_dir)
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6]))
+        save_run(self.base_dir, *_run("r2", 3, 10, [4, 9]))
+
+        self.assertEqual(self._active_lines(), ["r1-0", "r2-4", "r2-9"])
+        self.assertEqual(
+            self._active_lines(BASE + timedelta(days=1), BASE + timedelta(days=8)), ["r2-4"]
+        )
+        replaced = {
+            event["source_line"]: event["replaced_by"]
+            for event in load_run_store(self.base_dir)["events"]
+        }
+        self.assertEqual(replaced["r1-3"], "r2")
+
+        with closing(sqlite3.connect(str(self.base_dir / "runs" / "runs.sqlite3"))) as conn:
+            names = conn.execute(
+                "SELECT name, SUM(delta) FROM entries GROUP BY name"
+            ).fetchall()
+            plan = " ".join(
+                str(row)
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id FROM events"
+                    " WHERE active = 1 AND event_epoch BETWEEN 0 AND 1"
+                )
+            )
+        self.assertEqual(names, [("alice", 50)])
+        self.assertIn("idx_events_active_time", plan)
+
+    def test_save_run_store_round_trips(self) -> None:
+        enable_sqlite_store(self.base_dir)
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3]))
+        data = load_run_store(self.base_dir)
+        data["events"][0]["active"] = False
+        data["events"][0]["replaced_by"] = "manual"
+
+        save_run_store(self.base_dir, data)
+
+        self.assertEqual(load_run_store(self.base_dir), data)
+        self.assertEqual(self._active_lines(), ["r1-3"])
+
+    def test_switching_back_to_jsonl_exports_history(self) -> None:
+        self.assertTrue(apply_run_store_backend(self.base_dir, "sqlite"))
+        save_run(self.base_dir, *_run("r1", 0, 7, [0, 3, 6]))
+        save_run(self.base_dir, *_run("r2", 3, 10, [4, 9]))
+        before = load_run_store(self.base_dir)
+
+        self.assertTrue(apply_run_store_backend(self.base_dir, "jsonl"))
+        self.assertFalse(apply_run_store_backend(self.base_dir, "jsonl"))
+
+        runs_dir = self.base_dir / "runs"
+        self.assertFalse((runs_dir / "runs.sqlite3").exists())
+        self.assertTrue((runs_dir / "events.jsonl").exists())
+        self.assertEqual(load_run_store(self.base_dir), before)
+        self.assertEqual(self._active_lines(), ["r1-0", "r2-4", "r2-9"])
+
+        save_run(self.base_dir, *_run("r3", 9, 12, [10]))
+        self.assertFalse((runs_dir / "runs.sqlite3").exists())
+        self.assertEqual(self._active_lines(), ["r1-0", "r2-4", "r3-10"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import json
+import tempfile
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from pyapp.core.points import PointsStore
+from pyapp.core.sanitise import (
+    Sanitizer,
+    ValidationErrors,
+    iter_preprocessed_lines,
+    iter_validated_lines,
+    preprocess_lines,
+    sanitize_line,
+    slice_by_date,
+    validate_lines,
+)
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class StreamingPipelineTests(unittest.TestCase):
+    def _setup_base_dir(self, base_dir: Path) -> None:
+        _write_json(base_dir / "points.json", {"boss1": 10, "boss2": 5})
+        _write_json(base_dir / "prios.json", [])
+        _write_json(base_dir / "boss_aliases.json", [{"b1": "boss1"}])
+        _write_json(base_dir / "name_aliases.json", {})
+
+    def _write_timers(self, base_dir: Path, lines: list[str]) -> Path:
+        timers_path = base_dir / "timers.txt"
+        timers_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return timers_path
+
+    def test_preprocess_is_lazy_and_matches_list(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                [
+                    "01 Jan 2026 at 20:00: B1 alice",
+                    "",
+                    "02 Jan 2026 at 20:00: boss2 bob",
+                ],
+            )
+            lazy = iter_preprocessed_lines(timers_path, base_dir)
+            self.assertIsInstance(lazy, types.GeneratorType)
+            self.assertEqual(
+                list(lazy),
+                [
+                    (1, "01 jan 2026 at 20:00:boss1 alice"),
+                    (3, "02 jan 2026 at 20:00:boss2 bob"),
+                ],
+            )
+            self.assertEqual(
+                preprocess_lines(timers_path, base_dir),
+                list(iter_preprocessed_lines(timers_path, base_dir)),
+            )
+
+    def test_slice_preprocessed_lines_by_date(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                [
+                    "25 Dec 2025 at 20:00: boss1 bob",
+                    "01 Jan 2026 at 20:00: boss1 alice",
+                    "no date here",
+                    "05 Jan 2026 at 20:00: boss2 alice",
+                    "10 Jan 2026 at 20:00: boss2 carl",
+                ],
+            )
+            start = datetime(2026, 1, 1, 0, 0)
+            end = datetime(2026, 1, 8, 0, 0)
+            sliced = slice_by_date(preprocess_lines(timers_path, base_dir), start, end)
+            self.assertEqual([index for index, _ in sliced], [2, 3, 4])
+
+    def test_iter_validated_lines_collects_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            lines = [
+                (1, "01 jan 2026 at 20:00:boss1 alice"),
+                (2, "bad line"),
+                (3, "01 jan 2026 at 20:00: nope alice"),
+            ]
+            store = PointsStore(base_dir)
+            errors = ValidationErrors()
+            formatted = list(iter_validated_lines(iter(lines), store, errors))
+            self.assertEqual(formatted, [(1, ["boss1", "alice"])])
+            self.assertEqual(errors.date_lines, [2])
+            self.assertEqual(errors.general_lines, [2])
+            self.assertEqual(errors.boss_lines, [3])
+            self.assertEqual(errors.unknown_bosses, {"nope": [3]})
+
+            listed, list_errors = validate_lines(lines, store)
+            self.assertEqual(listed, formatted)
+            self.assertEqual(list_errors, errors)
+
+
+class SanitizerTests(unittest.TestCase):
+    def test_rewrite_rules_and_aliases(self) -> None:
+        aliases = [("Bloodthorn", "BT"), ("/tree", "/valleyx")]
+        sanitizer = Sanitizer(aliases)
+        cases = {
+            "01 Jan 2026 at 20:00: Bloodthorn(double points) Alice": (
+                "01 jan 2026 at 20:00:bt(doublepoints) alice"
+            ),
+            "01 Jan 2026 at 20:00: / nerco bob": "01 jan 2026 at 20:00:/necro bob",
+            "01 Jan 2026 at 20:00: /faction rootx3": "01 jan 2026 at 20:00:/factions root3",
+            "01 Jan 2026 at 20:00: aggy/ Æve": "01 jan 2026 at 20:00:/aggy ve",
+            "aggy/mords carl": "/aggy mord carl",
+            "/tree  dave": "/valleyx dave",
+            "   ": "",
+        }
+        for raw, expected in cases.items():
+            self.assertEqual(sanitizer.sanitize(raw), expected)
+            self.assertEqual(sanitize_line(raw, aliases=aliases), expected)
+
+    def test_only_directly_spaced_slashes_are_joined(self) -> None:
+        sanitizer = Sanitizer([])
+        self.assertEqual(sanitizer.sanitize("/ / x"), "// x")
+        self.assertEqual(sanitizer.sanitize("aggy/ / x"), "/aggy /x")
+
+
+if __name__ == "__main__":
+    unittest.main()
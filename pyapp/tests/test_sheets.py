@@ -0,0 +1,278 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.http import HttpMockSequence
+
+from pyapp.core.sheets import (
+    RosterCache,
+    SheetsClientPool,
+    default_client_pool,
+    fetch_names,
+    get_names_from_sheets,
+    prefetch_names,
+)
+
+
+class _FakeRequest:
+    def __init__(self, service: "FakeSheetsService", spreadsheet_id: str, range_name: str) -> None:
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.range_name = range_name
+
+    def execute(self):
+        self.service.calls.append((self.spreadsheet_id, self.range_name))
+        return {"values": [[name] for name in self.service.names] + [[1]]}
+
+
+class FakeSheetsService:
+    def __init__(self, names: List[str]) -> None:
+        self.names = names
+        self.calls: List[tuple] = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId: str, range: str) -> _FakeRequest:
+        return _FakeRequest(self, spreadsheetId, range)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RosterCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        self.service = FakeSheetsService(["Alice", "Bob"])
+        self.clock = _Clock()
+        self.factories: List[tuple] = []
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _factory(self, credentials_path: Path, token_path: Path) -> FakeSheetsService:
+        self.factories.append((credentials_path, token_path))
+        return self.service
+
+    def _cache(self, ttl: float = 60) -> RosterCache:
+        return RosterCache(
+            self.base_dir / "roster_cache.json",
+            ttl_seconds=ttl,
+            service_factory=self._factory,
+            clock=self.clock,
+        )
+
+    def _get(self, cache: RosterCache, **kwargs) -> List[str]:
+        return get_names_from_sheets(
+            "sheet",
+            "A1:A",
+            self.base_dir / "credentials.json",
+            self.base_dir / "token.json",
+            cache=cache,
+            **kwargs,
+        )
+
+    def test_serves_cached_names_within_ttl(self) -> None:
+        cache = self._cache()
+        self.assertEqual(self._get(cache), ["Alice", "Bob"])
+        self.clock.now += 10
+        self.assertEqual(self._get(cache), ["Alice", "Bob"])
+        self.assertEqual(len(self.service.calls), 1)
+
+        stored = json.loads((self.base_dir / "roster_cache.json").read_text(encoding="utf-8"))
+        self.assertEqual(stored["sheet|A1:A"]["names"], ["Alice", "Bob"])
+        self.assertEqual(stored["sheet|A1:A"]["fetched_at"], 1000.0)
+
+    def test_cache_persists_across_instances(self) -> None:
+        self._get(self._cache())
+        self.service.names = ["Carl"]
+        self.assertEqual(self._get(self._cache()), ["Alice", "Bob"])
+        self.assertEqual(len(self.service.calls), 1)
+
+    def test_expired_entry_is_fetched_again(self) -> None:
+        cache = self._cache()
+        self._get(cache)
+        self.service.names = ["Carl"]
+        self.clock.now += 60
+        self.assertEqual(self._get(cache), ["Carl"])
+        self.assertEqual(len(self.service.calls), 2)
+
+    def test_ageing_entry_refreshes_in_background(self) -> None:
+        cache = self._cache()
+        self._get(cache)
+        self.service.names = ["Alice", "Bob", "Carl"]
+        self.clock.now += 40
+        self.assertEqual(self._get(cache), ["Alice", "Bob"])
+        cache.wait(5)
+        self.assertEqual(len(self.service.calls), 2)
+        self.assertEqual(cache.cached("sheet", "A1:A").fetched_at, 1040.0)
+        self.assertEqual(self._get(cache), ["Alice", "Bob", "Carl"])
+
+    def test_unchanged_roster_only_revalidates_timestamp(self) -> None:
+        cache = self._cache()
+        self._get(cache)
+        digest = cache.cached("sheet", "A1:A").digest
+        self.clock.now += 5
+        self.assertEqual(self._get(cache, force_refresh=True), ["Alice", "Bob"])
+        entry = cache.cached("sheet", "A1:A")
+        self.assertEqual(entry.digest, digest)
+        self.assertEqual(entry.fetched_at, 1005.0)
+        self.assertEqual(len(self.service.calls), 2)
+
+    def test_corrupt_cache_file_is_ignored(self) -> None:
+        (self.base_dir / "roster_cache.json").write_text("{not json", encoding="utf-8")
+        self.assertEqual(self._get(self._cache()), ["Alice", "Bob"])
+
+    def test_prefetch_fills_cache_in_background(self) -> None:
+        cache = self._cache()
+        future = prefetch_names(
+            "sheet",
+            "A1:A",
+            self.base_dir / "credentials.json",
+            self.base_dir / "token.json",
+            cache=cache,
+        )
+        self.assertEqual(future.result(5), ["Alice", "Bob"])
+        self.assertEqual(self._get(cache), ["Alice", "Bob"])
+        self.assertEqual(len(self.service.calls), 1)
+
+    def test_queued_prefetch_can_be_cancelled(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls: List[str] = []
+
+        def blocking_fetch(spreadsheet_id, range_name, credentials_path, token_path, cache=None):
+            calls.append(spreadsheet_id)
+            started.set()
+            release.wait(5)
+            return ["Alice"]
+
+        paths = (self.base_dir / "credentials.json", self.base_dir / "token.json")
+        with patch("pyapp.core.sheets.get_names_from_sheets", blocking_fetch):
+            first = prefetch_names("first", "A1:A", *paths)
+            self.assertTrue(started.wait(5))
+            second = prefetch_names("second", "A1:A", *paths)
+            self.assertTrue(second.cancel())
+            self.assertFalse(first.cancel())
+            release.set()
+            self.assertEqual(first.result(5), ["Alice"])
+            threads = [t for t in threading.enumerate() if t.name == "roster-prefetch"]
+            self.assertTrue(all(t.daemon for t in threads))
+            for thread in threads:
+                thread.join(5)
+        self.assertEqual(calls, ["first"])
+
+
+class _ExpiringCredentials(Credentials):
+    def __init__(self) -> None:
+        super().__init__(token="old", refresh_token="refresh")
+        self.expiry = datetime(2000, 1, 1)
+        self.refreshes = 0
+
+    def refresh(self, request) -> None:
+        self.refreshes += 1
+        self.token = "new"
+        self.expiry = None
+
+
+class SheetsClientPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        self.credentials_path = self.base_dir / "credentials.json"
+        self.credentials_path.write_text("{}", encoding="utf-8")
+        self.token_path = self.base_dir / "token.json"
+        self.loaded: List[Credentials] = []
+        self.transports: List[HttpMockSequence] = []
+        self.make_credentials = lambda: Credentials(token="token")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _load(self, credentials_path: Path, token_path: Path) -> Credentials:
+        creds = self.make_credentials()
+        self.loaded.append(creds)
+        return creds
+
+    def _transport(self) -> HttpMockSequence:
+        body = json.dumps({"values": [["Alice"], ["Bob"]]})
+        transport = HttpMockSequence([({"status": "200"}, body)] * 3)
+        self.transports.append(transport)
+        return transport
+
+    def _pool(self) -> SheetsClientPool:
+        return SheetsClientPool(credentials_loader=self._load, transport_factory=self._transport)
+
+    def test_service_and_transport_are_reused(self) -> None:
+        pool = self._pool()
+        service = pool.service(self.credentials_path, self.token_path)
+        self.assertEqual(fetch_names(service, "sheet", "A1:A"), ["Alice", "Bob"])
+        again = pool.service(self.credentials_path, self.token_path)
+        self.assertIs(again, service)
+        self.assertEqual(fetch_names(again, "sheet", "A1:A"), ["Alice", "Bob"])
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(len(self.transports), 1)
+
+    def test_expired_credentials_are_refreshed_once(self) -> None:
+        self.make_credentials = _ExpiringCredentials
+        pool = self._pool()
+        pool.service(self.credentials_path, self.token_path)
+        pool.service(self.credentials_path, self.token_path)
+        pool.service(self.credentials_path, self.token_path)
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(self.loaded[0].refreshes, 1)
+        stored = json.loads(self.token_path.read_text(encoding="utf-8"))
+        self.assertEqual(stored["token"], "new")
+
+    def test_changed_credentials_file_rebuilds_client(self) -> None:
+        pool = self._pool()
+        first = pool.service(self.credentials_path, self.token_path)
+        self.credentials_path.write_text('{"changed": true}', encoding="utf-8")
+        second = pool.service(self.credentials_path, self.token_path)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.loaded), 2)
+
+    def test_default_pool_is_created_once_across_threads(self) -> None:
+        created: List[object] = []
+        barrier = threading.Barrier(8)
+
+        def slow_pool() -> object:
+            time.sleep(0.05)
+            created.append(object())
+            return created[-1]
+
+        def fetch(results: List[object]) -> None:
+            barrier.wait()
+            results.append(default_client_pool())
+
+        results: List[object] = []
+        with patch("pyapp.core.sheets._default_client_pool", None), patch(
+            "pyapp.core.sheets.SheetsClientPool", slow_pool
+        ):
+            threads = [threading.Thread(target=fetch, args=(results,)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(created), 1)
+        self.assertEqual(results, created * 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pyapp.core.streaks import StreakEngine, full_week_range
+
+BASE = datetime(2026, 1, 4, tzinfo=timezone.utc)
+
+
+def _week(offset: int) -> datetime:
+    return BASE + timedelta(weeks=offset)
+
+
+def _players(**dkp: int):
+    return {name: {"dkp": value, "boss_counts": {}} for name, value in dkp.items()}
+
+
+class StreakEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.weekly = {
+            _week(0): _players(alice=400, bob=80),
+            _week(1): _players(alice=90, bob=75),
+            _week(3): _players(alice=310, bob=70, cara=500),
+        }
+
+    def test_full_week_range_fills_gaps(self) -> None:
+        self.assertEqual(full_week_range(self.weekly), [_week(0), _week(1), _week(2), _week(3)])
+        self.assertEqual(full_week_range([]), [])
+
+    def test_missing_weeks_break_streaks(self) -> None:
+        streaks = StreakEngine(self.weekly).streaks(70, 300)
+        self.assertEqual(streaks["alice"], {"a": 1, "aplus": 1})
+        self.assertEqual(streaks["cara"], {"a": 1, "aplus": 1})
+
+    def test_thresholds_are_answered_from_precomputed_floors(self) -> None:
+        self.weekly[_week(2)] = _players(alice=100, bob=71)
+        engine = StreakEngine(self.weekly)
+        self.assertEqual(engine.streak("alice", 90), 4)
+        self.assertEqual(engine.streak("alice", 100), 2)
+        self.assertEqual(engine.streak("bob", 70), 4)
+        self.assertEqual(engine.streak("bob", 71), 0)
+        self.assertEqual(engine.streak("cara", 0), 4)
+        self.assertEqual(engine.streak("nobody", 0), 0)
+
+    def test_results_are_cached_per_threshold_pair(self) -> None:
+        engine = StreakEngine(self.weekly)
+        first = engine.streaks(70, 300)
+        self.assertIs(engine.streaks(70, 300), first)
+        self.assertIsNot(engine.streaks(80, 300), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
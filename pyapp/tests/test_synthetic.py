@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+from dataclasses import fields
+from pathlib import Path
+
+from pyapp.benchmarks.synthetic import BOSS_TYPOS, write_dataset
+from pyapp.core.points import PointsStore
+from pyapp.core.revalidation import split_errors_by_line
+from pyapp.core.sanitise import get_date, preprocess_lines, validate_lines
+
+
+class SyntheticDatasetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _dataset(self, name: str, seed: int = 7):
+        return write_dataset(self.root / name, 300, seed=seed, roster_size=40)
+
+    def test_same_seed_is_deterministic(self) -> None:
+        first = self._dataset("first")
+        second = self._dataset("second")
+        other = self._dataset("other", seed=8)
+        text = first.timers_path.read_text(encoding="utf-8")
+        self.assertEqual(text, second.timers_path.read_text(encoding="utf-8"))
+        self.assertNotEqual(text, other.timers_path.read_text(encoding="utf-8"))
+        self.assertEqual(first.roster, second.roster)
+        for name in ("points.json", "boss_aliases.json"):
+            self.assertEqual(
+                (first.base_dir / name).read_text(encoding="utf-8"),
+                (second.base_dir / name).read_text(encoding="utf-8"),
+            )
+
+    def test_only_boss_typo_lines_fail_validation(self) -> None:
+        dataset = self._dataset("data")
+        raw = dataset.timers_path.read_text(encoding="utf-8").splitlines()
+        typo_lines = {
+            index
+            for index, line in enumerate(raw, start=1)
+            if line.split(": ", 1)[1].startswith(tuple(BOSS_TYPOS) + ("/ ",))
+        }
+        self.assertTrue(typo_lines)
+
+        lines = preprocess_lines(dataset.timers_path, dataset.base_dir)
+        formatted, errors = validate_lines(lines, PointsStore(dataset.base_dir))
+        error_lines = set(split_errors_by_line(errors))
+        self.assertEqual(len(lines), dataset.line_count)
+        self.assertLessEqual(error_lines, typo_lines)
+        self.assertEqual(len(formatted) + len(error_lines), dataset.line_count)
+        for item in fields(errors):
+            if item.name not in ("boss_lines", "unknown_bosses"):
+                self.assertFalse(getattr(errors, item.name), item.name)
+
+    def test_first_and_last_bracket_the_timestamps(self) -> None:
+        dataset = self._dataset("data")
+        lines = preprocess_lines(dataset.timers_path, dataset.base_dir)
+        dates = [get_date(line) for _, line in lines]
+        self.assertNotIn(None, dates)
+        self.assertEqual(dataset.first, min(dates))
+        self.assertEqual(dataset.last, max(dates))
+        self.assertEqual(dates[0], dataset.first)
+
+
+if __name__ == "__main__":
+    unittest.main()
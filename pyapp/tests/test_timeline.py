@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime, timezone
+
+from pyapp.core.sanitise import slice_by_date
+from pyapp.core.timeline import TimelineIndex
+
+
+class TimelineIndexTests(unittest.TestCase):
+    LINES = [
+        (1, "25 dec 2025 at 20:00:boss1 bob"),
+        (2, "01 jan 2026 at 20:00:boss1 alice"),
+        (3, "no date"),
+        (4, "05 jan 2026 at 20:00:boss2 alice"),
+        (5, "10 jan 2026 at 20:00:boss2 carl"),
+    ]
+
+    def test_sorted_index_uses_bisect_bounds(self) -> None:
+        index = TimelineIndex.from_lines(self.LINES, timezone.utc)
+        self.assertTrue(index.is_sorted)
+        self.assertEqual(index.positions, [0, 1, 3, 4])
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 8, tzinfo=timezone.utc)
+        self.assertEqual(index.bounds(start, end), (1, 3))
+        self.assertEqual(
+            [idx for idx, _ in index.slice(self.LINES, start, end)], [2, 3, 4]
+        )
+
+    def test_index_is_reusable_across_ranges(self) -> None:
+        index = TimelineIndex.from_lines(self.LINES)
+        for start, end in [
+            (datetime(2026, 1, 1), datetime(2026, 1, 8)),
+            (datetime(2025, 12, 1), datetime(2026, 1, 2)),
+            (datetime(2026, 1, 6), datetime(2026, 2, 1)),
+            (datetime(2027, 1, 1), datetime(2027, 2, 1)),
+        ]:
+            self.assertEqual(
+                slice_by_date(self.LINES, start, end, index),
+                slice_by_date(self.LINES, start, end),
+            )
+
+    def test_unsorted_lines_fall_back_to_scan(self) -> None:
+        lines = [
+            (1, "05 jan 2026 at 20:00:boss1 bob"),
+            (2, "01 jan 2026 at 20:00:boss1 alice"),
+            (3, "12 jan 2026 at 20:00:boss1 carl"),
+            (4, "03 jan 2026 at 20:00:boss2 dave"),
+        ]
+        index = TimelineIndex.from_lines(lines, timezone.utc)
+        self.assertFalse(index.is_sorted)
+        start = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 8, tzinfo=timezone.utc)
+        self.assertEqual(index.bounds(start, end), (2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from datetime import datetime, timedelta
+
+from pyapp.core.timestamps import TimestampParser, parse_timestamp, parse_with_strptime
+
+
+class TimestampParserTests(unittest.TestCase):
+    def test_all_formats_match_strptime(self) -> None:
+        parser = TimestampParser()
+        cases = {
+            "01 jan 2026 at 20:05:boss1 alice": datetime(2026, 1, 1, 20, 5),
+            "jan 2, 2026 at 8:05 pm:boss1 alice": datetime(2026, 1, 2, 20, 5),
+            "january 3, 2026 12:05 am: boss1": datetime(2026, 1, 3, 0, 5),
+            "May 4, 2026 12:30 PM: boss1": datetime(2026, 5, 4, 12, 30),
+            "sep 5, 2026 11:59 am boss1": datetime(2026, 9, 5, 11, 59),
+        }
+        for line, expected in cases.items():
+            self.assertEqual(parser.parse(line), expected)
+            self.assertEqual(parse_with_strptime(line), expected)
+
+    def test_invalid_dates_match_strptime(self) -> None:
+        parser = TimestampParser()
+        for line in [
+            "31 feb 2026 at 20:00: boss1",
+            "01 jan 2026 at 24:00: boss1",
+            "01 jan 2026 at 20:60: boss1",
+            "00 jan 2026 at 20:00: boss1",
+            "jan 2, 2026 at 13:05 pm: boss1",
+            "march 2, 2026 at 8:05 pm: boss1",
+            "sept 2, 2026 8:05 pm: boss1",
+            "boss1 alice",
+            "",
+        ]:
+            self.assertIsNone(parser.parse(line), line)
+            self.assertIsNone(parse_with_strptime(line), line)
+
+    def test_detected_layout_does_not_change_results(self) -> None:
+        parser = TimestampParser()
+        self.assertEqual(
+            parser.parse("jan 2, 2026 8:05 pm: boss1"), datetime(2026, 1, 2, 20, 5)
+        )
+        self.assertEqual(
+            parser.parse("02 jan 2026 at 20:05: boss1"), datetime(2026, 1, 2, 20, 5)
+        )
+
+    def test_remembered_dates_match_strptime(self) -> None:
+        parser = TimestampParser()
+        for line in [
+            "01 jan 2026 at 20:05: boss1",
+            "01 jan 2026 at 23:59: boss1",
+            "01 jan 2026 at 24:00: boss1",
+            "01 jan 2026 at 7:05: boss1",
+            "01 jan 2026 AT 20:05: boss1",
+            "jan 2, 2026 at 8:05 pm: boss1",
+            "jan 2, 2026 at 12:00 AM: boss1",
+            "jan 2, 2026 at 13:00 pm: boss1",
+            "jan 2, 2026 at 8:5 pm: boss1",
+            "january 3, 2026 8:05 pm: boss1",
+            "january 3, 2026 11:59 Am boss1",
+        ]:
+            self.assertEqual(parser.parse(line), parse_with_strptime(line), line)
+        self.assertEqual(parse_timestamp("01 jan 2026 at 20:05:"), datetime(2026, 1, 1, 20, 5))
+
+    def test_many_distinct_dates(self) -> None:
+        parser = TimestampParser()
+        start = datetime(2000, 1, 1)
+        for offset in range(0, 10000, 2):
+            day = start + timedelta(days=offset)
+            for line in (
+                day.strftime("%d %b %Y at 10:30: boss1"),
+                day.strftime("%b %d, %Y at 10:30 PM: boss1"),
+            ):
+                self.assertEqual(parser.parse(line), parse_with_strptime(line), line)
+
+if __name__ == "__main__":
+    unittest.main()
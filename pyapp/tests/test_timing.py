@@ -0,0 +1,50 @@
+import unittest
+
+from pyapp.core.timing import Timings
+
+
+class TimingsTests(unittest.TestCase):
+    def test_spans_accumulate_calls_time_and_items(self) -> None:
+        timings = Timings()
+        with timings.span("validate", 10):
+            pass
+        with timings.span("validate") as span:
+            span.items = 5
+        timings.add("prompts", 0.25, 1)
+
+        stats = {item.name: item for item in timings.stats()}
+        self.assertEqual(stats["validate"].calls, 2)
+        self.assertEqual(stats["validate"].items, 15)
+        self.assertAlmostEqual(timings.seconds("prompts"), 0.25)
+        self.assertAlmostEqual(
+            timings.seconds("validate", "prompts", "missing"),
+            stats["validate"].seconds + 0.25,
+        )
+
+    def test_span_is_recorded_when_the_block_raises(self) -> None:
+        timings = Timings()
+        with self.assertRaises(ValueError):
+            with timings.span("roster"):
+                raise ValueError("offline")
+        self.assertEqual([item.calls for item in timings.stats()], [1])
+
+    def test_summary_is_logged(self) -> None:
+        timings = Timings()
+        timings.add("preprocess", 0.0123, 400)
+        timings.add("autocorrect", 0.002)
+        timings.add("autocorrect", 0.002)
+        self.assertEqual(
+            timings.summary_lines(),
+            ["preprocess: 12.3 ms, 400 items", "autocorrect: 4.0 ms, 2 calls"],
+        )
+        with self.assertLogs(level="INFO") as logs:
+            timings.log("Calculate points")
+        self.assertIn("Calculate points timings: preprocess: 12.3 ms", logs.output[0])
+
+    def test_empty_timings_log_nothing(self) -> None:
+        with self.assertNoLogs(level="INFO"):
+            Timings().log("Save run")
+
+
+if __name__ == "__main__":
+    unittest.main()
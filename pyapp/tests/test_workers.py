@@ -0,0 +1,93 @@
+import json
+import queue
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+
+from pyapp.core.workflow import Resolution
+from pyapp.gui.workers import AutocorrectCancelled, AutocorrectJob, AutocorrectWorker
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class AutocorrectWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        _write_json(self.base_dir / "points.json", {"boss1": 10})
+        _write_json(self.base_dir / "prios.json", [])
+        _write_json(self.base_dir / "boss_aliases.json", [])
+        _write_json(self.base_dir / "name_aliases.json", {})
+        timers_path = self.base_dir / "timers.txt"
+        timers_path.write_text("01 Jan 2026 at 20:00: boss1 alcie bob\n", encoding="utf-8")
+        self.worker = AutocorrectWorker(
+            AutocorrectJob(
+                timers_path=timers_path,
+                start_date=None,
+                end_date=None,
+                use_all_entries=True,
+                spreadsheet_id="dummy",
+                range_name="dummy",
+                credentials_path=self.base_dir / "credentials.json",
+                token_path=self.base_dir / "token.json",
+                base_dir=self.base_dir,
+                roster=["Alice", "Bob"],
+            )
+        )
+        self.requests: queue.Queue = queue.Queue()
+        self.succeeded = []
+        self.failed = []
+        self.finished = []
+        direct = Qt.DirectConnection
+        self.worker.resolution_requested.connect(self.requests.put, direct)
+        self.worker.succeeded.connect(self.succeeded.append, direct)
+        self.worker.failed.connect(self.failed.append, direct)
+        self.worker.finished.connect(lambda: self.finished.append(True), direct)
+        self.thread = threading.Thread(target=self.worker.run, daemon=True)
+
+    def tearDown(self) -> None:
+        self.worker.cancel()
+        if self.thread.is_alive():
+            self.thread.join(5)
+        self._tmp.cleanup()
+
+    def _join(self) -> None:
+        self.thread.join(5)
+        self.assertFalse(self.thread.is_alive())
+
+    def test_respond_resumes_scoring(self) -> None:
+        self.thread.start()
+        request = self.requests.get(timeout=5)
+        self.assertEqual(request.name, "alcie")
+        request.respond(Resolution(names=["Alice"], cache_original=False))
+        self._join()
+        self.assertEqual(self.failed, [])
+        self.assertEqual(self.finished, [True])
+        self.assertEqual(len(self.succeeded), 1)
+        totals = dict(self.succeeded[0].totals)
+        self.assertEqual(totals, {"Alice": 10, "Bob": 10})
+
+    def test_cancel_while_waiting_finishes_without_failure(self) -> None:
+        self.thread.start()
+        request = self.requests.get(timeout=5)
+        self.worker.cancel()
+        self._join()
+        self.assertTrue(request.cancelled)
+        self.assertEqual(self.succeeded, [])
+        self.assertEqual(self.failed, [])
+        self.assertEqual(self.finished, [True])
+
+    def test_request_after_cancel_raises(self) -> None:
+        self.worker.cancel()
+        with self.assertRaises(AutocorrectCancelled):
+            self.worker._request_resolution("alcie", ["Alice"], "", "", "", "", "")
+        self.assertTrue(self.requests.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,21 @@
 import json
 import tempfile
 import unittest
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
+from pyapp.core import aliases
 from pyapp.core.sanitise import preprocess_lines, validate_lines
-from pyapp.core.workflow import Resolution, calculate_points
+from pyapp.core.workflow import (
+    Resolution,
+    calculate_points,
+    calculate_prepared,
+    estimate_prepared,
+    estimate_unknown_count,
+    prepare_run,
+)
 
 
 def _write_json(path: Path, data) -> None:
@@ -415,6 +424,265 @@ class WorkflowPointsTests(unittest.TestCase):
             self.assertEqual(totals["alice"], 20)
             self.assertEqual(totals["bob"], 15)
 
+    def test_prepared_run_is_shared_by_estimate_and_calculation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                [
+                    "01 Jan 2026 at 20:00: boss1 alice zed",
+                    "02 Jan 2026 at 20:00: boss2 alice bob",
+                ],
+            )
+            with patch("pyapp.core.workflow.get_names_from_sheets") as mock_get_names:
+                mock_get_names.return_value = ["Alice", "Bob"]
+                prepared = prepare_run(
+                    timers_path=timers_path,
+                    start_date=None,
+                    end_date=None,
+                    use_all_entries=True,
+                    spreadsheet_id="dummy",
+                    range_name="dummy",
+                    credentials_path=base_dir / "credentials.json",
+                    token_path=base_dir / "token.json",
+                    base_dir=base_dir,
+                )
+                estimated, names = estimate_prepared(prepared)
+                first = calculate_prepared(prepared, lambda *_: None)
+                second = calculate_prepared(prepared, lambda *_: None)
+                self.assertEqual(mock_get_names.call_count, 1)
+
+            self.assertEqual(estimated, 1)
+            self.assertEqual(names, ["Alice", "Bob"])
+            stages = {item.name: item for item in first.timings.stats()}
+            self.assertEqual(stages["preprocess"].items, 2)
+            self.assertEqual(stages["roster"].calls, 1)
+            self.assertEqual(stages["prompts"].calls, 2)
+            self.assertEqual(stages["score"].calls, 2)
+            self.assertEqual(first.totals, second.totals)
+            totals = {name.lower(): points for name, points in first.totals}
+            self.assertEqual(totals, {"alice": 15, "bob": 5})
+            self.assertNotIn("zed", prepared.aliases)
+
+    def test_estimate_unknown_count_logs_stage_timings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: boss1 alice zed"],
+            )
+            with self.assertLogs(level="INFO") as logs:
+                estimated, names = estimate_unknown_count(
+                    timers_path=timers_path,
+                    start_date=None,
+                    end_date=None,
+                    use_all_entries=True,
+                    spreadsheet_id="dummy",
+                    range_name="dummy",
+                    credentials_path=base_dir / "credentials.json",
+                    token_path=base_dir / "token.json",
+                    base_dir=base_dir,
+                    roster=["Alice"],
+                )
+            self.assertEqual((estimated, names), (1, ["Alice"]))
+            self.assertIn("Estimate unknowns timings: ", logs.output[-1])
+            self.assertIn("roster: ", logs.output[-1])
+
+    def test_prepared_run_with_errors_skips_roster(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: unknownboss alice"],
+            )
+            with patch("pyapp.core.workflow.get_names_from_sheets") as mock_get_names:
+                prepared = prepare_run(
+                    timers_path=timers_path,
+                    start_date=None,
+                    end_date=None,
+                    use_all_entries=True,
+                    spreadsheet_id="dummy",
+                    range_name="dummy",
+                    credentials_path=base_dir / "credentials.json",
+                    token_path=base_dir / "token.json",
+                    base_dir=base_dir,
+                )
+                mock_get_names.assert_not_called()
+            self.assertEqual(estimate_prepared(prepared), (0, []))
+            self.assertTrue(calculate_prepared(prepared, lambda *_: None).errors.any())
+
+    def test_pending_roster_future_replaces_sheets_fetch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: boss1 alice bob"],
+            )
+            roster: Future = Future()
+            roster.set_result(["Alice", "Bob"])
+            with patch("pyapp.core.workflow.get_names_from_sheets") as mock_get_names:
+                result = calculate_points(
+                    timers_path=timers_path,
+                    start_date=None,
+                    end_date=None,
+                    use_all_entries=True,
+                    spreadsheet_id="dummy",
+                    range_name="dummy",
+                    credentials_path=base_dir / "credentials.json",
+                    token_path=base_dir / "token.json",
+                    base_dir=base_dir,
+                    resolve_unknown=lambda *_: None,
+                    roster=roster,
+                )
+                mock_get_names.assert_not_called()
+            totals = {name.lower(): points for name, points in result.totals}
+            self.assertEqual(totals, {"alice": 10, "bob": 10})
+
+    def test_failed_roster_future_falls_back_to_sheets_fetch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: boss1 alice bob"],
+            )
+            roster: Future = Future()
+            roster.set_exception(OSError("network down"))
+            with patch("pyapp.core.workflow.get_names_from_sheets") as mock_get_names:
+                mock_get_names.return_value = ["Alice", "Bob"]
+                with self.assertLogs(level="WARNING"):
+                    prepared = prepare_run(
+                        timers_path=timers_path,
+                        start_date=None,
+                        end_date=None,
+                        use_all_entries=True,
+                        spreadsheet_id="dummy",
+                        range_name="dummy",
+                        credentials_path=base_dir / "credentials.json",
+                        token_path=base_dir / "token.json",
+                        base_dir=base_dir,
+                        roster=roster,
+                    )
+                mock_get_names.assert_called_once()
+            self.assertEqual(prepared.names, ["Alice", "Bob"])
+
+    def test_cancelled_roster_future_falls_back_to_sheets_fetch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: boss1 alice bob"],
+            )
+            roster: Future = Future()
+            roster.cancel()
+            with patch("pyapp.core.workflow.get_names_from_sheets") as mock_get_names:
+                mock_get_names.return_value = ["Alice", "Bob"]
+                with self.assertLogs(level="WARNING"):
+                    prepared = prepare_run(
+                        timers_path=timers_path,
+                        start_date=None,
+                        end_date=None,
+                        use_all_entries=True,
+                        spreadsheet_id="dummy",
+                        range_name="dummy",
+                        credentials_path=base_dir / "credentials.json",
+                        token_path=base_dir / "token.json",
+                        base_dir=base_dir,
+                        roster=roster,
+                    )
+                mock_get_names.assert_called_once()
+            self.assertEqual(prepared.names, ["Alice", "Bob"])
+
+    def test_persisted_aliases_are_written_once_after_calculation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                [
+                    "01 Jan 2026 at 20:00: boss1 alcie bobb",
+                    "02 Jan 2026 at 20:00: boss2 zed",
+                ],
+            )
+            aliases_path = base_dir / "name_aliases.json"
+            corrections = {"alcie": "Alice", "bobb": "Bob"}
+
+            def resolver(name, suggestions, *_args):
+                self.assertEqual(json.loads(aliases_path.read_text(encoding="utf-8")), {})
+                if name == "zed":
+                    raise RuntimeError("cancelled")
+                return Resolution(
+                    names=[corrections[name]], cache_original=True, persist_alias=True
+                )
+
+            prepared = prepare_run(
+                timers_path=timers_path,
+                start_date=None,
+                end_date=None,
+                use_all_entries=True,
+                spreadsheet_id="dummy",
+                range_name="dummy",
+                credentials_path=base_dir / "credentials.json",
+                token_path=base_dir / "token.json",
+                base_dir=base_dir,
+                roster=["Alice", "Bob"],
+            )
+            with patch("pyapp.core.aliases._write_json", wraps=aliases._write_json) as mock_write:
+                with self.assertRaises(RuntimeError):
+                    calculate_prepared(prepared, resolver)
+            self.assertEqual(mock_write.call_count, 1)
+            self.assertEqual(
+                json.loads(aliases_path.read_text(encoding="utf-8")),
+                {"alcie": "Alice", "bobb": "Bob"},
+            )
+            self.assertFalse((base_dir / "name_aliases.json.tmp").exists())
+            stages = {item.name: item for item in prepared.timings.stats()}
+            self.assertEqual(stages["persist"].items, 2)
+
+    def test_alias_flush_failure_does_not_hide_resolver_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            self._setup_base_dir(base_dir)
+            timers_path = self._write_timers(
+                base_dir,
+                ["01 Jan 2026 at 20:00: boss1 alcie zed"],
+            )
+
+            def resolver(name, suggestions, *_args):
+                if name == "zed":
+                    raise RuntimeError("cancelled")
+                return Resolution(names=["Alice"], cache_original=True, persist_alias=True)
+
+            prepared = prepare_run(
+                timers_path=timers_path,
+                start_date=None,
+                end_date=None,
+                use_all_entries=True,
+                spreadsheet_id="dummy",
+                range_name="dummy",
+                credentials_path=base_dir / "credentials.json",
+                token_path=base_dir / "token.json",
+                base_dir=base_dir,
+                roster=["Alice"],
+            )
+            with patch("pyapp.core.aliases._write_json", side_effect=OSError("disk full")):
+                with self.assertLogs(level="ERROR") as logs:
+                    with self.assertRaisesRegex(RuntimeError, "cancelled"):
+                        calculate_prepared(prepared, resolver)
+                self.assertIn("disk full", "\n".join(logs.output))
+                with self.assertRaises(OSError):
+                    calculate_prepared(
+                        prepared,
+                        lambda *_: Resolution(
+                            names=["Alice"], cache_original=True, persist_alias=True
+                        ),
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()